@@ -51,6 +51,9 @@ except ImportError:
 from ansible.module_utils._text import to_text
 from ansible.module_utils.connection import ConnectionError
 from ansible.plugins.httpapi import HttpApiBase
+from ansible_collections.cisco.dcnm.plugins.module_utils.common.json_decode import (
+    json_loads,
+)
 
 
 class HttpApi(HttpApiBase):
@@ -383,7 +386,7 @@ class HttpApi(HttpApiBase):
     def _response_to_json(self, response_text):
         """Convert response_text to json format"""
         try:
-            return json.loads(response_text) if response_text else {}
+            return json_loads(response_text) if response_text else {}
         # JSONDecodeError only available on Python 3.5+
         except ValueError:
             return "Invalid JSON response: {0}".format(response_text)
@@ -398,7 +401,7 @@ class HttpApi(HttpApiBase):
         response_text = to_text(response_value)
 
         try:
-            return json.loads(response_text) if response_text else {}
+            return json_loads(response_text) if response_text else {}
         # # JSONDecodeError only available on Python 3.5+
         except ValueError:
             return "Invalid JSON response: {0}".format(response_text)
@@ -33,15 +33,24 @@ class Api:
     ``/appcenter/cisco/ndfc/api``
     """
 
+    __slots__ = (
+        "class_name",
+        "log",
+        "_conversion",
+        "required_properties",
+        "properties",
+    )
+
+    api = "/appcenter/cisco/ndfc/api"
+
     def __init__(self):
         self.class_name = self.__class__.__name__
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
-        self.conversion = ConversionUtils()
+        self._conversion = None
         # Popuate in subclasses to indicate which properties
         # are mandatory for the subclass.
         self.required_properties = set()
         self.log.debug("ENTERED api.Api()")
-        self.api = "/appcenter/cisco/ndfc/api"
         self._init_properties()
 
     def _init_properties(self):
@@ -49,6 +58,15 @@ class Api:
         self.properties["path"] = None
         self.properties["verb"] = None
 
+    @property
+    def conversion(self):
+        """
+        Return a ConversionUtils() instance, created on first access.
+        """
+        if self._conversion is None:
+            self._conversion = ConversionUtils()
+        return self._conversion
+
     @property
     def path(self):
         """
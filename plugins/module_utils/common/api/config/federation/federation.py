@@ -49,6 +49,5 @@ class EpFederationMembers(Federation):
 
         self._verb = "GET"
         self._path = f"{self.federation}/members"
-        msg = "ENTERED api.config.federation."
-        msg += f"Federation.{self.class_name}"
-        self.log.debug(msg)
+        msg = "ENTERED api.config.federation.Federation.%s"
+        self.log.debug(msg, self.class_name)
@@ -60,6 +60,5 @@ class EpFederationManagerGet(Manager):
         self._verb = "GET"
         self._path = f"{self.manager}/mo"
 
-        msg = "ENTERED api.config.federation.manager."
-        msg += f"Manager.{self.class_name}"
-        self.log.debug(msg)
+        msg = "ENTERED api.config.federation.manager.Manager.%s"
+        self.log.debug(msg, self.class_name)
@@ -33,9 +33,12 @@ class ConfigTemplate(V1):
     ``/appcenter/cisco/ndfc/api/v1/configtemplate``
     """
 
+    __slots__ = ()
+
+    configtemplate = f"{V1.v1}/configtemplate"
+
     def __init__(self):
         super().__init__()
         self.class_name = self.__class__.__name__
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
-        self.configtemplate = f"{self.v1}/configtemplate"
         self.log.debug("ENTERED api.v1.configtemplate.ConfigTemplate()")
@@ -33,13 +33,16 @@ class Config(Rest):
     -   ``/api/v1/configtemplate/rest/config``
     """
 
+    __slots__ = ()
+
+    config = f"{Rest.rest}/config"
+
     def __init__(self):
         super().__init__()
         self.class_name = self.__class__.__name__
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
-        self.config = f"{self.rest}/config"
-        msg = f"ENTERED api.v1.rest.config.{self.class_name}"
-        self.log.debug(msg)
+        msg = "ENTERED api.v1.rest.config.%s"
+        self.log.debug(msg, self.class_name)
         self._build_properties()
 
     def _build_properties(self):
@@ -17,7 +17,6 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 __author__ = "Allen Robel"
 
-import inspect
 import logging
 
 from ..config import Config
@@ -35,30 +34,46 @@ class Templates(Config):
     -   ``/api/v1/configtemplate/rest/config/templates``
     """
 
+    __slots__ = ("_fabric_types", "_path_template_name", "_template_name")
+
+    templates = f"{Config.config}/templates"
+
     def __init__(self):
         super().__init__()
         self.class_name = self.__class__.__name__
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
-        self.fabric_types = FabricTypes()
+        self._fabric_types = None
 
-        self.templates = f"{self.config}/templates"
+        self._path_template_name = None
         self._template_name = None
-        msg = "ENTERED api.v1.configtemplate.rest.config."
-        msg += f"templates.{self.class_name}"
-        self.log.debug(msg)
+        msg = "ENTERED api.v1.configtemplate.rest.config.templates.%s"
+        self.log.debug(msg, self.class_name)
+
+    @property
+    def fabric_types(self):
+        """
+        - Return a FabricTypes() instance, created on first access.
+        """
+        if self._fabric_types is None:
+            self._fabric_types = FabricTypes()
+        return self._fabric_types
 
     @property
     def path_template_name(self):
         """
         - Endpoint for template retrieval.
         - Raise ``ValueError`` if template_name is not set.
+        - The path is built once, when template_name is set.
         """
-        method_name = inspect.stack()[0][3]
-        if self.template_name is None and "template_name" in self.required_properties:
-            msg = f"{self.class_name}.{method_name}: "
-            msg += "template_name must be set prior to accessing path."
-            raise ValueError(msg)
-        return f"{self.templates}/{self.template_name}"
+        method_name = "path_template_name"
+        path = self._path_template_name
+        if path is None:
+            if "template_name" in self.required_properties:
+                msg = f"{self.class_name}.{method_name}: "
+                msg += "template_name must be set prior to accessing path."
+                raise ValueError(msg)
+            path = f"{self.templates}/{self.template_name}"
+        return path
 
     @property
     def template_name(self):
@@ -71,14 +86,15 @@ class Templates(Config):
 
     @template_name.setter
     def template_name(self, value):
-        method_name = inspect.stack()[0][3]
-        if value not in self.fabric_types.valid_fabric_template_names:
+        method_name = "template_name"
+        if value not in self.fabric_types.valid_fabric_template_names_set:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"Invalid template_name: {value}. "
             msg += "Expected one of: "
             msg += f"{', '.join(self.fabric_types.valid_fabric_template_names)}."
             raise ValueError(msg)
         self._template_name = value
+        self._path_template_name = f"{self.templates}/{value}"
 
 
 class EpTemplate(Templates):
@@ -114,14 +130,11 @@ class EpTemplate(Templates):
     ```
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
-        self.class_name = self.__class__.__name__
-        self.log = logging.getLogger(f"dcnm.{self.class_name}")
         self.required_properties.add("template_name")
-        msg = "ENTERED api.v1.configtemplate.rest.config."
-        msg += f"templates.Templates.{self.class_name}"
-        self.log.debug(msg)
 
     @property
     def path(self):
@@ -167,14 +180,7 @@ class EpTemplates(Templates):
     ```
     """
 
-    def __init__(self):
-        super().__init__()
-        self.class_name = self.__class__.__name__
-        self.log = logging.getLogger(f"dcnm.{self.class_name}")
-        self._build_properties()
-        msg = "ENTERED api.v1.configtemplate.rest.config."
-        msg += f"templates.Templates.{self.class_name}"
-        self.log.debug(msg)
+    __slots__ = ()
 
     @property
     def path(self):
@@ -33,13 +33,16 @@ class Rest(ConfigTemplate):
     -   ``/api/v1/configtemplate/rest``
     """
 
+    __slots__ = ()
+
+    rest = f"{ConfigTemplate.configtemplate}/rest"
+
     def __init__(self):
         super().__init__()
         self.class_name = self.__class__.__name__
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
-        self.rest = f"{self.configtemplate}/rest"
-        msg = f"ENTERED api.v1.configtemplate.rest.{self.class_name}"
-        self.log.debug(msg)
+        msg = "ENTERED api.v1.configtemplate.rest.%s"
+        self.log.debug(msg, self.class_name)
         self._build_properties()
 
     def _build_properties(self):
@@ -70,14 +70,6 @@ class EpBootflashFiles(Bootflash):
     ```
     """
 
-    def __init__(self):
-        super().__init__()
-        self.class_name = self.__class__.__name__
-        self.log = logging.getLogger(f"dcnm.{self.class_name}")
-        msg = "ENTERED api.v1.imagemanagement.rest.imagemgnt."
-        msg += "BootflashFiles.EpBootflashFiles()"
-        self.log.debug(msg)
-
     @property
     def path(self):
         return f"{self.bootflash}/bootflash-files"
@@ -119,11 +111,7 @@ class EpBootflashInfo(Bootflash):
 
     def __init__(self):
         super().__init__()
-        self.class_name = self.__class__.__name__
-        self.log = logging.getLogger(f"dcnm.{self.class_name}")
-        msg = "ENTERED api.v1.imagemanagement.rest.imagemgnt."
-        msg += "BootflashFiles.EpBootflashInfo()"
-        self.log.debug(msg)
+        self._serial_number = None
 
     @property
     def path(self):
@@ -38,8 +38,8 @@ class ImageUpgrade(Rest):
         self.class_name = self.__class__.__name__
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
         self.imageupgrade = f"{self.rest}/imageupgrade"
-        msg = f"ENTERED api.v1.imagemanagement.rest.{self.class_name}"
-        self.log.debug(msg)
+        msg = "ENTERED api.v1.imagemanagement.rest.%s"
+        self.log.debug(msg, self.class_name)
         self._build_properties()
 
     def _build_properties(self):
@@ -80,9 +80,8 @@ class EpInstallOptions(ImageUpgrade):
         super().__init__()
         self.class_name = self.__class__.__name__
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
-        msg = "ENTERED api.v1.imagemanagement.rest."
-        msg += f"imageupgrade.{self.class_name}"
-        self.log.debug(msg)
+        msg = "ENTERED api.v1.imagemanagement.rest.imageupgrade.%s"
+        self.log.debug(msg, self.class_name)
 
     @property
     def path(self):
@@ -131,9 +130,8 @@ class EpUpgradeImage(ImageUpgrade):
         super().__init__()
         self.class_name = self.__class__.__name__
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
-        msg = "ENTERED api.v1.imagemanagement.rest."
-        msg += f"imageupgrade.{self.class_name}"
-        self.log.debug(msg)
+        msg = "ENTERED api.v1.imagemanagement.rest.imageupgrade.%s"
+        self.log.debug(msg, self.class_name)
 
     @property
     def path(self):
@@ -73,9 +73,8 @@ class EpIssu(PackageMgnt):
         super().__init__()
         self.class_name = self.__class__.__name__
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
-        msg = "ENTERED api.v1.imagemanagement.rest."
-        msg += f"packagemgnt.{self.class_name}"
-        self.log.debug(msg)
+        msg = "ENTERED api.v1.imagemanagement.rest.packagemgnt.%s"
+        self.log.debug(msg, self.class_name)
 
     @property
     def path(self):
@@ -74,9 +74,8 @@ class EpPolicies(PolicyMgnt):
         super().__init__()
         self.class_name = self.__class__.__name__
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
-        msg = "ENTERED api.v1.imagemanagement.rest."
-        msg += f"policymgnt.{self.class_name}"
-        self.log.debug(msg)
+        msg = "ENTERED api.v1.imagemanagement.rest.policymgnt.%s"
+        self.log.debug(msg, self.class_name)
 
     @property
     def path(self):
@@ -119,9 +118,8 @@ class EpPoliciesAllAttached(PolicyMgnt):
         super().__init__()
         self.class_name = self.__class__.__name__
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
-        msg = "ENTERED api.v1.imagemanagement.rest."
-        msg += f"policymgnt.{self.class_name}"
-        self.log.debug(msg)
+        msg = "ENTERED api.v1.imagemanagement.rest.policymgnt.%s"
+        self.log.debug(msg, self.class_name)
 
     @property
     def path(self):
@@ -164,9 +162,8 @@ class EpPolicyAttach(PolicyMgnt):
         super().__init__()
         self.class_name = self.__class__.__name__
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
-        msg = "ENTERED api.v1.imagemanagement.rest."
-        msg += f"policymgnt.{self.class_name}"
-        self.log.debug(msg)
+        msg = "ENTERED api.v1.imagemanagement.rest.policymgnt.%s"
+        self.log.debug(msg, self.class_name)
 
     @property
     def path(self):
@@ -209,9 +206,8 @@ class EpPolicyCreate(PolicyMgnt):
         super().__init__()
         self.class_name = self.__class__.__name__
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
-        msg = "ENTERED api.v1.imagemanagement.rest."
-        msg += f"policymgnt.{self.class_name}"
-        self.log.debug(msg)
+        msg = "ENTERED api.v1.imagemanagement.rest.policymgnt.%s"
+        self.log.debug(msg, self.class_name)
 
     @property
     def path(self):
@@ -253,9 +249,8 @@ class EpPolicyDelete(PolicyMgnt):
         super().__init__()
         self.class_name = self.__class__.__name__
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
-        msg = "ENTERED api.v1.imagemanagement.rest."
-        msg += f"policymgnt.{self.class_name}"
-        self.log.debug(msg)
+        msg = "ENTERED api.v1.imagemanagement.rest.policymgnt.%s"
+        self.log.debug(msg, self.class_name)
 
     @property
     def path(self):
@@ -299,9 +294,8 @@ class EpPolicyDetach(PolicyMgnt):
         self.class_name = self.__class__.__name__
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
         self._serial_numbers = None
-        msg = "ENTERED api.v1.imagemanagement.rest."
-        msg += f"policymgnt.{self.class_name}"
-        self.log.debug(msg)
+        msg = "ENTERED api.v1.imagemanagement.rest.policymgnt.%s"
+        self.log.debug(msg, self.class_name)
 
     @property
     def path(self):
@@ -377,9 +371,8 @@ class EpPolicyEdit(PolicyMgnt):
         super().__init__()
         self.class_name = self.__class__.__name__
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
-        msg = "ENTERED api.v1.imagemanagement.rest."
-        msg += f"policymgnt.{self.class_name}"
-        self.log.debug(msg)
+        msg = "ENTERED api.v1.imagemanagement.rest.policymgnt.%s"
+        self.log.debug(msg, self.class_name)
 
     @property
     def path(self):
@@ -427,9 +420,8 @@ class EpPolicyInfo(PolicyMgnt):
         self.class_name = self.__class__.__name__
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
         self._policy_name = None
-        msg = "ENTERED api.v1.imagemanagement.rest."
-        msg += f"policymgnt.{self.class_name}"
-        self.log.debug(msg)
+        msg = "ENTERED api.v1.imagemanagement.rest.policymgnt.%s"
+        self.log.debug(msg, self.class_name)
 
     @property
     def path(self):
@@ -38,8 +38,8 @@ class Rest(ImageManagement):
         self.class_name = self.__class__.__name__
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
         self.rest = f"{self.imagemanagement}/rest"
-        msg = f"ENTERED api.v1.imagemanagement.rest.{self.class_name}"
-        self.log.debug(msg)
+        msg = "ENTERED api.v1.imagemanagement.rest.%s"
+        self.log.debug(msg, self.class_name)
         self._build_properties()
 
     def _build_properties(self):
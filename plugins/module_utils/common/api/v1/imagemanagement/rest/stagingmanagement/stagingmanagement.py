@@ -38,9 +38,8 @@ class StagingManagement(Rest):
         self.class_name = self.__class__.__name__
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
         self.stagingmanagement = f"{self.rest}/stagingmanagement"
-        msg = "ENTERED api.v1.imagemanagement.rest."
-        msg += f"stagingmanagement.{self.class_name}"
-        self.log.debug(msg)
+        msg = "ENTERED api.v1.imagemanagement.rest.stagingmanagement.%s"
+        self.log.debug(msg, self.class_name)
 
 
 class EpImageStage(StagingManagement):
@@ -75,9 +74,8 @@ class EpImageStage(StagingManagement):
         super().__init__()
         self.class_name = self.__class__.__name__
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
-        msg = "ENTERED api.v1.imagemanagement.rest."
-        msg += f"stagingmanagement.{self.class_name}"
-        self.log.debug(msg)
+        msg = "ENTERED api.v1.imagemanagement.rest.stagingmanagement.%s"
+        self.log.debug(msg, self.class_name)
 
     @property
     def path(self):
@@ -120,9 +118,8 @@ class EpImageValidate(StagingManagement):
         super().__init__()
         self.class_name = self.__class__.__name__
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
-        msg = "ENTERED api.v1.imagemanagement.rest."
-        msg += f"stagingmanagement.{self.class_name}"
-        self.log.debug(msg)
+        msg = "ENTERED api.v1.imagemanagement.rest.stagingmanagement.%s"
+        self.log.debug(msg, self.class_name)
 
     @property
     def path(self):
@@ -165,9 +162,8 @@ class EpStageInfo(StagingManagement):
         super().__init__()
         self.class_name = self.__class__.__name__
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
-        msg = "ENTERED api.v1.imagemanagement.rest."
-        msg += f"stagingmanagement.{self.class_name}"
-        self.log.debug(msg)
+        msg = "ENTERED api.v1.imagemanagement.rest.stagingmanagement.%s"
+        self.log.debug(msg, self.class_name)
 
     @property
     def path(self):
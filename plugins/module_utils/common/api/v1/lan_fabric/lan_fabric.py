@@ -33,9 +33,12 @@ class LanFabric(V1):
     ``/appcenter/cisco/ndfc/api/v1/lan-fabric``
     """
 
+    __slots__ = ()
+
+    lan_fabric = f"{V1.v1}/lan-fabric"
+
     def __init__(self):
         super().__init__()
         self.class_name = self.__class__.__name__
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
-        self.lan_fabric = f"{self.v1}/lan-fabric"
         self.log.debug("ENTERED api.v1.lan-fabric.LanFabric()")
@@ -33,10 +33,13 @@ class Control(Rest):
     -   ``/api/v1/lan-fabric/rest/control``
     """
 
+    __slots__ = ()
+
+    control = f"{Rest.rest}/control"
+
     def __init__(self):
         super().__init__()
         self.class_name = self.__class__.__name__
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
-        self.control = f"{self.rest}/control"
-        msg = f"ENTERED api.v1.lan_fabric.rest.control.{self.class_name}"
-        self.log.debug(msg)
+        msg = "ENTERED api.v1.lan_fabric.rest.control.%s"
+        self.log.debug(msg, self.class_name)
@@ -17,7 +17,6 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 __author__ = "Allen Robel"
 
-import inspect
 import logging
 
 from ..control import Control
@@ -36,24 +35,38 @@ class Fabrics(Control):
     -   ``/api/v1/lan-fabric/rest/control/fabrics``
     """
 
+    __slots__ = (
+        "_fabric_types",
+        "_path_cache",
+        "_fabric_name",
+        "_serial_number",
+        "_template_name",
+        "_ticket_id",
+    )
+
+    fabrics = f"{Control.control}/fabrics"
+
     def __init__(self):
         super().__init__()
         self.class_name = self.__class__.__name__
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
-        self.fabric_types = FabricTypes()
-        self.fabrics = f"{self.control}/fabrics"
-        msg = f"ENTERED api.v1.lan_fabric.rest.control.fabrics.{self.class_name}"
-        self.log.debug(msg)
+        self._fabric_types = None
+        msg = "ENTERED api.v1.lan_fabric.rest.control.fabrics.%s"
+        self.log.debug(msg, self.class_name)
         self._build_properties()
 
     def _build_properties(self):
         """
-        - Set the fabric_name property.
+        - Set the fabric_name, serial_number, template_name and
+          ticket_id properties.
+        - Reset the cache of paths built from fabric_name,
+          serial_number and template_name.
         """
-        self.properties["fabric_name"] = None
-        self.properties["serial_number"] = None
-        self.properties["template_name"] = None
-        self.properties["ticket_id"] = None
+        self._path_cache = {}
+        self._fabric_name = None
+        self._serial_number = None
+        self._template_name = None
+        self._ticket_id = None
 
     @property
     def fabric_name(self):
@@ -62,18 +75,28 @@ class Fabrics(Control):
         - setter: Set the fabric_name.
         - setter: Raise ``ValueError`` if fabric_name is not valid.
         """
-        return self.properties["fabric_name"]
+        return self._fabric_name
 
     @fabric_name.setter
     def fabric_name(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = "fabric_name"
         try:
             self.conversion.validate_fabric_name(value)
         except (TypeError, ValueError) as error:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{error}"
             raise ValueError(msg) from error
-        self.properties["fabric_name"] = value
+        self._path_cache.clear()
+        self._fabric_name = value
+
+    @property
+    def fabric_types(self):
+        """
+        - Return a FabricTypes() instance, created on first access.
+        """
+        if self._fabric_types is None:
+            self._fabric_types = FabricTypes()
+        return self._fabric_types
 
     @property
     def path_fabric_name(self):
@@ -82,12 +105,14 @@ class Fabrics(Control):
         -   Raise ``ValueError`` if fabric_name is not set and
             ``self.required_properties`` contains "fabric_name".
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "path_fabric_name"
         if self.fabric_name is None and "fabric_name" in self.required_properties:
             msg = f"{self.class_name}.{method_name}: "
             msg += "fabric_name must be set prior to accessing path."
             raise ValueError(msg)
-        return f"{self.fabrics}/{self.fabric_name}"
+        if method_name not in self._path_cache:
+            self._path_cache[method_name] = f"{self.fabrics}/{self.fabric_name}"
+        return self._path_cache[method_name]
 
     @property
     def path_fabric_name_serial_number(self):
@@ -98,7 +123,7 @@ class Fabrics(Control):
         -   Raise ``ValueError`` if serial_number is not set.
         -   /appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/fabrics/{fabricName}/switches/{serialNumber}
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "path_fabric_name_serial_number"
         if self.fabric_name is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += "fabric_name must be set prior to accessing path."
@@ -107,7 +132,11 @@ class Fabrics(Control):
             msg = f"{self.class_name}.{method_name}: "
             msg += "serial_number must be set prior to accessing path."
             raise ValueError(msg)
-        return f"{self.fabrics}/{self.fabric_name}/switches/{self.serial_number}"
+        if method_name not in self._path_cache:
+            self._path_cache[method_name] = (
+                f"{self.fabrics}/{self.fabric_name}/switches/{self.serial_number}"
+            )
+        return self._path_cache[method_name]
 
     @property
     def path_fabric_name_template_name(self):
@@ -118,7 +147,7 @@ class Fabrics(Control):
         -   Raise ``ValueError`` if template_name is not set and
             ``self.required_properties`` contains "template_name".
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "path_fabric_name_template_name"
         if self.fabric_name is None and "fabric_name" in self.required_properties:
             msg = f"{self.class_name}.{method_name}: "
             msg += "fabric_name must be set prior to accessing path."
@@ -127,7 +156,11 @@ class Fabrics(Control):
             msg = f"{self.class_name}.{method_name}: "
             msg += "template_name must be set prior to accessing path."
             raise ValueError(msg)
-        return f"{self.fabrics}/{self.fabric_name}/{self.template_name}"
+        if method_name not in self._path_cache:
+            self._path_cache[method_name] = (
+                f"{self.fabrics}/{self.fabric_name}/{self.template_name}"
+            )
+        return self._path_cache[method_name]
 
     @property
     def serial_number(self):
@@ -137,17 +170,18 @@ class Fabrics(Control):
         - setter: Raise ``TypeError`` if serial_number is not a string.
         - Default: None
         """
-        return self.properties["serial_number"]
+        return self._serial_number
 
     @serial_number.setter
     def serial_number(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = "serial_number"
         if not isinstance(value, str):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"Expected string for {method_name}. "
             msg += f"Got {value} with type {type(value).__name__}."
             raise TypeError(msg)
-        self.properties["serial_number"] = value
+        self._path_cache.clear()
+        self._serial_number = value
 
     @property
     def template_name(self):
@@ -156,18 +190,19 @@ class Fabrics(Control):
         - setter: Set the template_name.
         - setter: Raise ``ValueError`` if template_name is not a string.
         """
-        return self.properties["template_name"]
+        return self._template_name
 
     @template_name.setter
     def template_name(self, value):
-        method_name = inspect.stack()[0][3]
-        if value not in self.fabric_types.valid_fabric_template_names:
+        method_name = "template_name"
+        if value not in self.fabric_types.valid_fabric_template_names_set:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"Invalid template_name: {value}. "
             msg += "Expected one of: "
             msg += f"{', '.join(self.fabric_types.valid_fabric_template_names)}."
             raise ValueError(msg)
-        self.properties["template_name"] = value
+        self._path_cache.clear()
+        self._template_name = value
 
     @property
     def ticket_id(self):
@@ -178,17 +213,17 @@ class Fabrics(Control):
         - Default: None
         - Note: ticket_id is optional unless Change Control is enabled.
         """
-        return self.properties["ticket_id"]
+        return self._ticket_id
 
     @ticket_id.setter
     def ticket_id(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = "ticket_id"
         if not isinstance(value, str):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"Expected string for {method_name}. "
             msg += f"Got {value} with type {type(value).__name__}."
             raise ValueError(msg)
-        self.properties["ticket_id"] = value
+        self._ticket_id = value
 
 
 class EpFabricConfigDeploy(Fabrics):
@@ -256,15 +291,16 @@ class EpFabricConfigDeploy(Fabrics):
     ```
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.class_name = self.__class__.__name__
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
         self.required_properties.add("fabric_name")
         self._build_properties()
-        msg = "ENTERED api.v1.lan_fabric.rest.control.fabrics."
-        msg += f"Fabrics.{self.class_name}"
-        self.log.debug(msg)
+        msg = "ENTERED api.v1.lan_fabric.rest.control.fabrics.Fabrics.%s"
+        self.log.debug(msg, self.class_name)
 
     def _build_properties(self):
         super()._build_properties()
@@ -287,7 +323,7 @@ class EpFabricConfigDeploy(Fabrics):
 
     @force_show_run.setter
     def force_show_run(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = "force_show_run"
         if not isinstance(value, bool):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"Expected boolean for {method_name}. "
@@ -312,7 +348,7 @@ class EpFabricConfigDeploy(Fabrics):
 
     @include_all_msd_switches.setter
     def include_all_msd_switches(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = "include_all_msd_switches"
         if not isinstance(value, bool):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"Expected boolean for {method_name}. "
@@ -326,14 +362,17 @@ class EpFabricConfigDeploy(Fabrics):
         - Override the path property to mandate fabric_name is set.
         - Raise ``ValueError`` if fabric_name is not set.
         """
-        _path = self.path_fabric_name
-        _path += "/config-deploy"
-        if self.switch_id:
-            _path += f"/{self.switch_id}"
-        _path += f"?forceShowRun={self.force_show_run}"
-        if not self.switch_id:
-            _path += f"&inclAllMSDSwitches={self.include_all_msd_switches}"
-        return _path
+        switch_id = self.switch_id
+        if switch_id:
+            return (
+                f"{self.path_fabric_name}/config-deploy/{switch_id}"
+                f"?forceShowRun={self.force_show_run}"
+            )
+        return (
+            f"{self.path_fabric_name}/config-deploy"
+            f"?forceShowRun={self.force_show_run}"
+            f"&inclAllMSDSwitches={self.include_all_msd_switches}"
+        )
 
     @property
     def switch_id(self):
@@ -353,7 +392,7 @@ class EpFabricConfigDeploy(Fabrics):
 
     @switch_id.setter
     def switch_id(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = "switch_id"
 
         def error(param, param_type):
             msg = f"{self.class_name}.{method_name}: "
@@ -411,15 +450,16 @@ class EpFabricConfigSave(Fabrics):
     ```
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.class_name = self.__class__.__name__
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
         self.required_properties.add("fabric_name")
         self._build_properties()
-        msg = "ENTERED api.v1.lan_fabric.rest.control.fabrics."
-        msg += f"Fabrics.{self.class_name}"
-        self.log.debug(msg)
+        msg = "ENTERED api.v1.lan_fabric.rest.control.fabrics.Fabrics.%s"
+        self.log.debug(msg, self.class_name)
 
     def _build_properties(self):
         super()._build_properties()
@@ -432,11 +472,9 @@ class EpFabricConfigSave(Fabrics):
         - Set self.ticket_id if Change Control is enabled.
         - Raise ``ValueError`` if fabric_name is not set.
         """
-        _path = self.path_fabric_name
-        _path += "/config-save"
         if self.ticket_id:
-            _path += f"?ticketId={self.ticket_id}"
-        return _path
+            return f"{self.path_fabric_name}/config-save?ticketId={self.ticket_id}"
+        return f"{self.path_fabric_name}/config-save"
 
 
 class EpFabricCreate(Fabrics):
@@ -478,6 +516,8 @@ class EpFabricCreate(Fabrics):
     ```
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.class_name = self.__class__.__name__
@@ -485,9 +525,8 @@ class EpFabricCreate(Fabrics):
         self.required_properties.add("fabric_name")
         self.required_properties.add("template_name")
         self._build_properties()
-        msg = "ENTERED api.v1.lan_fabric.rest.control.fabrics."
-        msg += f"Fabrics.{self.class_name}"
-        self.log.debug(msg)
+        msg = "ENTERED api.v1.lan_fabric.rest.control.fabrics.Fabrics.%s"
+        self.log.debug(msg, self.class_name)
 
     def _build_properties(self):
         super()._build_properties()
@@ -535,15 +574,16 @@ class EpFabricDelete(Fabrics):
     ```
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.class_name = self.__class__.__name__
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
         self.required_properties.add("fabric_name")
         self._build_properties()
-        msg = "ENTERED api.v1.lan_fabric.rest.control.fabrics."
-        msg += f"Fabrics.{self.class_name}"
-        self.log.debug(msg)
+        msg = "ENTERED api.v1.lan_fabric.rest.control.fabrics.Fabrics.%s"
+        self.log.debug(msg, self.class_name)
 
     def _build_properties(self):
         super()._build_properties()
@@ -591,15 +631,16 @@ class EpFabricDetails(Fabrics):
     ```
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.class_name = self.__class__.__name__
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
         self.required_properties.add("fabric_name")
         self._build_properties()
-        msg = "ENTERED api.v1.lan_fabric.rest.control.fabrics."
-        msg += f"Fabrics.{self.class_name}"
-        self.log.debug(msg)
+        msg = "ENTERED api.v1.lan_fabric.rest.control.fabrics.Fabrics.%s"
+        self.log.debug(msg, self.class_name)
 
     def _build_properties(self):
         super()._build_properties()
@@ -643,15 +684,16 @@ class EpFabricFreezeMode(Fabrics):
     ```
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.class_name = self.__class__.__name__
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
         self.required_properties.add("fabric_name")
         self._build_properties()
-        msg = "ENTERED api.v1.lan_fabric.rest.control.fabrics."
-        msg += f"Fabrics.{self.class_name}"
-        self.log.debug(msg)
+        msg = "ENTERED api.v1.lan_fabric.rest.control.fabrics.Fabrics.%s"
+        self.log.debug(msg, self.class_name)
 
     def _build_properties(self):
         super()._build_properties()
@@ -704,15 +746,16 @@ class EpFabricUpdate(Fabrics):
     ```
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.class_name = self.__class__.__name__
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
         self.required_properties.add("fabric_name")
         self.required_properties.add("template_name")
-        msg = "ENTERED api.v1.lan_fabric.rest.control.fabrics."
-        msg += f"Fabrics.{self.class_name}"
-        self.log.debug(msg)
+        msg = "ENTERED api.v1.lan_fabric.rest.control.fabrics.Fabrics.%s"
+        self.log.debug(msg, self.class_name)
 
     @property
     def path(self):
@@ -755,14 +798,15 @@ class EpFabrics(Fabrics):
     ```
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.class_name = self.__class__.__name__
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
         self._build_properties()
-        msg = "ENTERED api.v1.lan_fabric.rest.control.fabrics."
-        msg += f"Fabrics.{self.class_name}"
-        self.log.debug(msg)
+        msg = "ENTERED api.v1.lan_fabric.rest.control.fabrics.Fabrics.%s"
+        self.log.debug(msg, self.class_name)
 
     def _build_properties(self):
         super()._build_properties()
@@ -818,6 +862,8 @@ class EpMaintenanceModeDeploy(Fabrics):
     ```
     """
 
+    __slots__ = ("_wait_for_mode_change",)
+
     def __init__(self):
         super().__init__()
         self.class_name = self.__class__.__name__
@@ -825,9 +871,8 @@ class EpMaintenanceModeDeploy(Fabrics):
         self.required_properties.add("fabric_name")
         self.required_properties.add("serial_number")
         self._wait_for_mode_change = False
-        msg = "ENTERED api.v1.lan_fabric.rest.control.fabrics."
-        msg += f"Fabrics.{self.class_name}"
-        self.log.debug(msg)
+        msg = "ENTERED api.v1.lan_fabric.rest.control.fabrics.Fabrics.%s"
+        self.log.debug(msg, self.class_name)
 
     @property
     def path(self):
@@ -836,10 +881,9 @@ class EpMaintenanceModeDeploy(Fabrics):
         - Raise ``ValueError`` if fabric_name is not set.
         - Raise ``ValueError`` if serial_number is not set.
         """
-        _path = self.path_fabric_name_serial_number
-        _path += "/deploy-maintenance-mode"
+        _path = f"{self.path_fabric_name_serial_number}/deploy-maintenance-mode"
         if self.wait_for_mode_change:
-            _path += "?waitForModeChange=true"
+            return f"{_path}?waitForModeChange=true"
         return _path
 
     @property
@@ -864,7 +908,7 @@ class EpMaintenanceModeDeploy(Fabrics):
 
     @wait_for_mode_change.setter
     def wait_for_mode_change(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = "wait_for_mode_change"
         if not isinstance(value, bool):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"Expected boolean for {method_name}. "
@@ -916,15 +960,16 @@ class EpMaintenanceModeEnable(Fabrics):
     ```
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.class_name = self.__class__.__name__
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
         self.required_properties.add("fabric_name")
         self.required_properties.add("serial_number")
-        msg = "ENTERED api.v1.lan_fabric.rest.control.fabrics."
-        msg += f"Fabrics.{self.class_name}"
-        self.log.debug(msg)
+        msg = "ENTERED api.v1.lan_fabric.rest.control.fabrics.Fabrics.%s"
+        self.log.debug(msg, self.class_name)
 
     @property
     def path(self):
@@ -934,10 +979,9 @@ class EpMaintenanceModeEnable(Fabrics):
         - Raise ``ValueError`` if serial_number is not set.
         - self.ticket_id is mandatory if Change Control is enabled.
         """
-        _path = self.path_fabric_name_serial_number
-        _path += "/maintenance-mode"
+        _path = f"{self.path_fabric_name_serial_number}/maintenance-mode"
         if self.ticket_id:
-            _path += f"?ticketId={self.ticket_id}"
+            return f"{_path}?ticketId={self.ticket_id}"
         return _path
 
     @property
@@ -993,15 +1037,16 @@ class EpMaintenanceModeDisable(Fabrics):
     ```
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.class_name = self.__class__.__name__
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
         self.required_properties.add("fabric_name")
         self.required_properties.add("serial_number")
-        msg = "ENTERED api.v1.lan_fabric.rest.control.fabrics."
-        msg += f"Fabrics.{self.class_name}"
-        self.log.debug(msg)
+        msg = "ENTERED api.v1.lan_fabric.rest.control.fabrics.Fabrics.%s"
+        self.log.debug(msg, self.class_name)
 
     @property
     def path(self):
@@ -1011,10 +1056,9 @@ class EpMaintenanceModeDisable(Fabrics):
         - Raise ``ValueError`` if serial_number is not set.
         - self.ticket_id is mandatory if Change Control is enabled.
         """
-        _path = self.path_fabric_name_serial_number
-        _path += "/maintenance-mode"
+        _path = f"{self.path_fabric_name_serial_number}/maintenance-mode"
         if self.ticket_id:
-            _path += f"?ticketId={self.ticket_id}"
+            return f"{_path}?ticketId={self.ticket_id}"
         return _path
 
     @property
@@ -39,8 +39,8 @@ class Switches(Control):
         self.class_name = self.__class__.__name__
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
         self.switches = f"{self.control}/switches"
-        msg = f"ENTERED api.v1.lan_fabric.rest.control.switches.{self.class_name}"
-        self.log.debug(msg)
+        msg = "ENTERED api.v1.lan_fabric.rest.control.switches.%s"
+        self.log.debug(msg, self.class_name)
         self._build_properties()
 
     def _build_properties(self):
@@ -123,9 +123,8 @@ class EpFabricSummary(Switches):
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
         self.required_properties.add("fabric_name")
         self._build_properties()
-        msg = "ENTERED api.v1.lan_fabric.rest.control.switches."
-        msg += f"{self.class_name}"
-        self.log.debug(msg)
+        msg = "ENTERED api.v1.lan_fabric.rest.control.switches.%s"
+        self.log.debug(msg, self.class_name)
 
     def _build_properties(self):
         super()._build_properties()
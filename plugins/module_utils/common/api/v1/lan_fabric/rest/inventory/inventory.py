@@ -38,8 +38,8 @@ class Inventory(Rest):
         self.class_name = self.__class__.__name__
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
         self.inventory = f"{self.rest}/inventory"
-        msg = f"ENTERED api.v1.lan_fabric.rest.inventory.{self.class_name}"
-        self.log.debug(msg)
+        msg = "ENTERED api.v1.lan_fabric.rest.inventory.%s"
+        self.log.debug(msg, self.class_name)
         self._build_properties()
 
     def _build_properties(self):
@@ -81,9 +81,8 @@ class EpAllSwitches(Inventory):
         self.class_name = self.__class__.__name__
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
         self._build_properties()
-        msg = "ENTERED api.v1.lan_fabric.rest.inventory."
-        msg += f"{self.class_name}"
-        self.log.debug(msg)
+        msg = "ENTERED api.v1.lan_fabric.rest.inventory.%s"
+        self.log.debug(msg, self.class_name)
 
     def _build_properties(self):
         super()._build_properties()
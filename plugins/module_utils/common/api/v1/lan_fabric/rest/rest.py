@@ -33,10 +33,13 @@ class Rest(LanFabric):
     -   ``/api/v1/lan-fabric/rest``
     """
 
+    __slots__ = ()
+
+    rest = f"{LanFabric.lan_fabric}/rest"
+
     def __init__(self):
         super().__init__()
         self.class_name = self.__class__.__name__
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
-        self.rest = f"{self.lan_fabric}/rest"
-        msg = f"ENTERED api.v1.lan_fabric.rest.{self.class_name}"
-        self.log.debug(msg)
+        msg = "ENTERED api.v1.lan_fabric.rest.%s"
+        self.log.debug(msg, self.class_name)
@@ -33,9 +33,12 @@ class V1(Api):
     ``/appcenter/cisco/ndfc/api/v1/``
     """
 
+    __slots__ = ()
+
+    v1 = f"{Api.api}/v1"
+
     def __init__(self):
         super().__init__()
         self.class_name = self.__class__.__name__
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
         self.log.debug("ENTERED api.v1.V1()")
-        self.v1 = f"{self.api}/v1"
@@ -0,0 +1,57 @@
+# Copyright (c) 2024 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+__copyright__ = "Copyright (c) 2024 Cisco and/or its affiliates."
+__author__ = "Allen Robel"
+
+import random
+
+BACKOFF_BASE_INTERVAL = 0.5
+BACKOFF_JITTER = 0.1
+# Limit the exponent so that long polling loops do not overflow float.
+BACKOFF_MAX_EXPONENT = 16
+
+
+def backoff_interval(
+    attempt, max_interval, base_interval=BACKOFF_BASE_INTERVAL
+):
+    """
+    ### Summary
+    Return the number of seconds to sleep before polling attempt
+    ``attempt`` (0-based).
+
+    -   The interval starts at ``base_interval`` and doubles with each
+        attempt, up to ``max_interval``.
+    -   Up to ``BACKOFF_JITTER`` (10%) of the interval is added as random
+        jitter, so that concurrent pollers do not synchronize.
+
+    ### Raises
+    None
+
+    ### Usage
+    ```python
+    attempt = 0
+    while not done and timeout > 0:
+        interval = backoff_interval(attempt, self.check_interval)
+        sleep(interval)
+        timeout -= interval
+        attempt += 1
+    ```
+    """
+    exponent = min(attempt, BACKOFF_MAX_EXPONENT)
+    interval = min(max_interval, base_interval * 2**exponent)
+    return interval + random.uniform(0, interval * BACKOFF_JITTER)
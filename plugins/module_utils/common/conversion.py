@@ -20,6 +20,11 @@ __author__ = "Allen Robel"
 import inspect
 import re
 
+RE_VALID_FABRIC_NAME = re.compile(r"[a-zA-Z][a-zA-Z0-9_-]*")
+TRUE_STRINGS = frozenset(("true", "yes"))
+FALSE_STRINGS = frozenset(("false", "no"))
+NONE_STRINGS = frozenset(("", "none", "null"))
+
 
 class ConversionUtils:
     """
@@ -46,7 +51,6 @@ class ConversionUtils:
         re_asn_str += "(\\.([1-5]\\d{4}|[1-9]\\d{0,3}|6[0-4]\\d{3}|65[0-4]"
         re_asn_str += "\\d{2}|655[0-2]\\d|6553[0-5]|0))?)$"
         self.re_asn = re.compile(re_asn_str)
-        self.re_valid_fabric_name = re.compile(r"[a-zA-Z]+[a-zA-Z0-9_-]*")
 
         self.bgp_as_invalid_reason = None
 
@@ -89,9 +93,12 @@ class ConversionUtils:
         - Return value converted to boolean, if possible.
         - Return value, otherwise.
         """
-        if str(value).lower() in ["true", "yes"]:
+        if isinstance(value, bool):
+            return value
+        lowered = str(value).lower()
+        if lowered in TRUE_STRINGS:
             return True
-        if str(value).lower() in ["false", "no"]:
+        if lowered in FALSE_STRINGS:
             return False
         return value
 
@@ -115,7 +122,9 @@ class ConversionUtils:
         - Return None if value is a string representation of a None type
         - Return value, otherwise.
         """
-        if str(value).lower() in {"", "none", "null"}:
+        if value is None or isinstance(value, bool):
+            return value
+        if str(value).lower() in NONE_STRINGS:
             return None
         return value
 
@@ -164,7 +173,7 @@ class ConversionUtils:
             msg += f"Invalid fabric name. Expected string. Got {value}."
             raise TypeError(msg)
 
-        if re.fullmatch(self.re_valid_fabric_name, value) is not None:
+        if RE_VALID_FABRIC_NAME.fullmatch(value) is not None:
             return
         msg = f"{self.class_name}.{method_name}: "
         msg += f"Invalid fabric name: {value}. "
@@ -0,0 +1,48 @@
+# Copyright (c) 2024 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+__copyright__ = "Copyright (c) 2024 Cisco and/or its affiliates."
+__author__ = "Allen Robel"
+
+import json
+
+# orjson is optional.  If installed, it is used to decode controller
+# responses, which is noticeably faster for large payloads.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_loads(data):
+    """
+    ### Summary
+    Decode a JSON document, using orjson if it is installed.
+
+    -   orjson rejects some documents which ``json.loads()`` accepts,
+        e.g. integers wider than 64 bits, NaN and Infinity.  These are
+        decoded with ``json.loads()`` instead.
+
+    ### Raises
+    -   ``ValueError`` if ``data`` is not a valid JSON document.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
@@ -19,8 +19,6 @@ __author__ = "Allen Robel"
 # Required for class decorators
 # pylint: disable=no-member
 
-import inspect
-
 
 class Properties:
     """
@@ -79,7 +77,7 @@ class Properties:
 
     @params.setter
     def params(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = "params"
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += "params must be a dictionary. "
@@ -115,20 +113,18 @@ class Properties:
 
     @rest_send.setter
     def rest_send(self, value):
-        method_name = inspect.stack()[0][3]
-        _class_have = None
+        method_name = "rest_send"
         _class_need = "RestSend"
+        if getattr(value, "class_name", None) == _class_need:
+            self._rest_send = value
+            return
         msg = f"{self.class_name}.{method_name}: "
         msg += f"value must be an instance of {_class_need}. "
         msg += f"Got value {value} of type {type(value).__name__}."
-        try:
-            _class_have = value.class_name
-        except AttributeError as error:
-            msg += f" Error detail: {error}."
-            raise TypeError(msg) from error
-        if _class_have != _class_need:
-            raise TypeError(msg)
-        self._rest_send = value
+        if not hasattr(value, "class_name"):
+            msg += f" Error detail: '{type(value).__name__}' object has no "
+            msg += "attribute 'class_name'."
+        raise TypeError(msg)
 
     @property
     def results(self):
@@ -149,20 +145,18 @@ class Properties:
 
     @results.setter
     def results(self, value):
-        method_name = inspect.stack()[0][3]
-        _class_have = None
+        method_name = "results"
         _class_need = "Results"
+        if getattr(value, "class_name", None) == _class_need:
+            self._results = value
+            return
         msg = f"{self.class_name}.{method_name}: "
         msg += f"value must be an instance of {_class_need}. "
         msg += f"Got value {value} of type {type(value).__name__}."
-        try:
-            _class_have = value.class_name
-        except AttributeError as error:
-            msg += f" Error detail: {error}."
-            raise TypeError(msg) from error
-        if _class_have != _class_need:
-            raise TypeError(msg)
-        self._results = value
+        if not hasattr(value, "class_name"):
+            msg += f" Error detail: '{type(value).__name__}' object has no "
+            msg += "attribute 'class_name'."
+        raise TypeError(msg)
 
     def add_params(self):
         """
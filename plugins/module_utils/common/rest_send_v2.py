@@ -397,18 +397,19 @@ class RestSend:
                 self.log.debug(msg)
                 raise ValueError(msg) from error
 
-            msg = f"{self.class_name}.{method_name}: "
-            msg += f"caller: {caller}. "
-            msg += f"timeout: {timeout}. "
-            msg += f"result_current: {json.dumps(self.result_current, indent=4, sort_keys=True)}."
-            self.log.debug(msg)
+            if self.log.isEnabledFor(logging.DEBUG):
+                msg = f"{self.class_name}.{method_name}: "
+                msg += f"caller: {caller}. "
+                msg += f"timeout: {timeout}. "
+                msg += f"result_current: {json.dumps(self.result_current, indent=4, sort_keys=True)}."
+                self.log.debug(msg)
 
-            msg = f"{self.class_name}.{method_name}: "
-            msg += f"caller: {caller}. "
-            msg += f"timeout: {timeout}. "
-            msg += "response_current: "
-            msg += f"{json.dumps(self.response_current, indent=4, sort_keys=True)}."
-            self.log.debug(msg)
+                msg = f"{self.class_name}.{method_name}: "
+                msg += f"caller: {caller}. "
+                msg += f"timeout: {timeout}. "
+                msg += "response_current: "
+                msg += f"{json.dumps(self.response_current, indent=4, sort_keys=True)}."
+                self.log.debug(msg)
 
             success = self.result_current["success"]
             if success is False and self.unit_test is False:
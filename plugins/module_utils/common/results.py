@@ -314,6 +314,9 @@ class Results:
             self.log.debug(msg)
             self.failed = False
 
+        if not self.log.isEnabledFor(logging.DEBUG):
+            return
+
         msg = f"{self.class_name}.{method_name}: "
         msg += f"self.diff: {json.dumps(self.diff, indent=4, sort_keys=True)}, "
         self.log.debug(msg)
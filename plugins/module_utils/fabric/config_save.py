@@ -17,8 +17,6 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 __author__ = "Allen Robel"
 
-import copy
-import inspect
 import logging
 
 from ..common.api.v1.lan_fabric.rest.control.fabrics.fabrics import \
@@ -62,6 +60,22 @@ class FabricConfigSave:
     ```
     """
 
+    __slots__ = (
+        "class_name",
+        "log",
+        "action",
+        "cannot_save_fabric_reason",
+        "config_save_failed",
+        "fabric_can_be_saved",
+        "config_save_result",
+        "conversion",
+        "ep_config_save",
+        "_fabric_name",
+        "_payload",
+        "_rest_send",
+        "_results",
+    )
+
     def __init__(self):
         self.class_name = self.__class__.__name__
 
@@ -90,86 +104,100 @@ class FabricConfigSave:
             can be saved.
         -   Set self.fabric_can_be_saved to False otherwise.
         """
-        self.fabric_can_be_saved = False
-
         deploy = self.payload.get("DEPLOY", None)
-        if deploy is False or deploy is None:
-            msg = f"Fabric {self.fabric_name} DEPLOY is False or None. "
-            msg += "Skipping config-save."
-            self.log.debug(msg)
-            self.cannot_save_fabric_reason = msg
-            self.config_save_failed = False
-            self.fabric_can_be_saved = False
+        if deploy is not False and deploy is not None:
+            self.fabric_can_be_saved = True
             return
-        self.fabric_can_be_saved = True
+
+        msg = (
+            f"Fabric {self.fabric_name} DEPLOY is False or None. "
+            "Skipping config-save."
+        )
+        self.log.debug(msg)
+        self.cannot_save_fabric_reason = msg
+        self.config_save_failed = False
+        self.fabric_can_be_saved = False
 
     def commit(self):
         """
         -   Save the fabric configuration to the controller.
         -   Raise ``ValueError`` if the endpoint assignment fails.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "commit"
         # pylint: disable=no-member
 
         if self.payload is None:
-            msg = f"{self.class_name}.{method_name}: "
-            msg += f"{self.class_name}.payload must be set "
-            msg += "before calling commit."
+            msg = (
+                f"{self.class_name}.{method_name}: "
+                f"{self.class_name}.payload must be set "
+                "before calling commit."
+            )
             raise ValueError(msg)
         if self.rest_send is None:
-            msg = f"{self.class_name}.{method_name}: "
-            msg += f"{self.class_name}.rest_send must be set "
-            msg += "before calling commit."
+            msg = (
+                f"{self.class_name}.{method_name}: "
+                f"{self.class_name}.rest_send must be set "
+                "before calling commit."
+            )
             raise ValueError(msg)
         if self.results is None:
-            msg = f"{self.class_name}.{method_name}: "
-            msg += f"{self.class_name}.results must be set "
-            msg += "before calling commit."
+            msg = (
+                f"{self.class_name}.{method_name}: "
+                f"{self.class_name}.results must be set "
+                "before calling commit."
+            )
             raise ValueError(msg)
 
         self._can_fabric_be_saved()
 
+        rest_send = self.rest_send
+        results = self.results
+
         if self.fabric_can_be_saved is False:
-            self.results.diff_current = {}
-            self.results.action = self.action
-            self.results.check_mode = self.rest_send.check_mode
-            self.results.state = self.rest_send.state
-            self.results.response_current = {
+            results.diff_current = {}
+            results.action = self.action
+            results.check_mode = rest_send.check_mode
+            results.state = rest_send.state
+            results.response_current = {
                 "RETURN_CODE": 200,
                 "MESSAGE": self.cannot_save_fabric_reason,
             }
             if self.config_save_failed is True:
-                self.results.result_current = {"changed": False, "success": False}
+                results.result_current = {"changed": False, "success": False}
             else:
-                self.results.result_current = {"changed": True, "success": True}
-            self.results.register_task_result()
+                results.result_current = {"changed": True, "success": True}
+            results.register_task_result()
             return
 
+        fabric_name = self.fabric_name
+        ep_config_save = self.ep_config_save
         try:
-            self.ep_config_save.fabric_name = self.fabric_name
-            self.rest_send.path = self.ep_config_save.path
-            self.rest_send.verb = self.ep_config_save.verb
-            self.rest_send.payload = None
-            self.rest_send.commit()
+            ep_config_save.fabric_name = fabric_name
+            rest_send.path = ep_config_save.path
+            rest_send.verb = ep_config_save.verb
+            rest_send.payload = None
+            rest_send.commit()
         except ValueError as error:
             raise ValueError(error) from error
 
-        result = self.rest_send.result_current["success"]
-        self.config_save_result[self.fabric_name] = result
-        if self.config_save_result[self.fabric_name] is False:
-            self.results.diff_current = {}
+        # RestSend already returns copies of response_current and
+        # result_current, so there is no need to copy them again here.
+        result_current = rest_send.result_current
+        self.config_save_result[fabric_name] = result_current["success"]
+        if self.config_save_result[fabric_name] is False:
+            results.diff_current = {}
         else:
-            self.results.diff_current = {
-                "FABRIC_NAME": self.fabric_name,
+            results.diff_current = {
+                "FABRIC_NAME": fabric_name,
                 f"{self.action}": "OK",
             }
 
-        self.results.action = self.action
-        self.results.check_mode = self.rest_send.check_mode
-        self.results.state = self.rest_send.state
-        self.results.response_current = copy.deepcopy(self.rest_send.response_current)
-        self.results.result_current = copy.deepcopy(self.rest_send.result_current)
-        self.results.register_task_result()
+        results.action = self.action
+        results.check_mode = rest_send.check_mode
+        results.state = rest_send.state
+        results.response_current = rest_send.response_current
+        results.result_current = result_current
+        results.register_task_result()
 
     @property
     def fabric_name(self):
@@ -197,20 +225,21 @@ class FabricConfigSave:
 
     @payload.setter
     def payload(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = "payload"
 
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name} must be a dictionary. "
             msg += f"Got type: {type(value).__name__}."
             self.log.debug(msg)
             raise ValueError(msg)
-        if value.get("FABRIC_NAME", None) is None:
+        fabric_name = value.get("FABRIC_NAME", None)
+        if fabric_name is None:
             msg = f"{self.class_name}.{method_name} payload is missing "
             msg += "FABRIC_NAME."
             self.log.debug(msg)
             raise ValueError(msg)
         try:
-            self.fabric_name = value["FABRIC_NAME"]
+            self.fabric_name = fabric_name
         except ValueError as error:
             raise ValueError(error) from error
         self._payload = value
@@ -68,6 +68,8 @@ class FabricTypes:
         -   fabric_type_to_template_name_map dict()
         -   fabric_type_to_feature_name_map dict()
         -   _valid_fabric_types - Sorted list() of fabric types
+        -   _valid_fabric_template_names - Sorted list() of template names
+        -   _valid_fabric_template_names_set - frozenset() of template names
         -  _mandatory_parameters_all_fabrics list()
         -  _mandatory_parameters dict() keyed on fabric type
             - Value is a list of mandatory parameters for the fabric type
@@ -100,6 +102,12 @@ class FabricTypes:
         self._fabric_type_to_ext_fabric_type_map["ISN"] = "Multi-Site External Network"
 
         self._valid_fabric_types = sorted(self._fabric_type_to_template_name_map.keys())
+        self._valid_fabric_template_names = sorted(
+            self._fabric_type_to_template_name_map.values()
+        )
+        self._valid_fabric_template_names_set = frozenset(
+            self._valid_fabric_template_names
+        )
 
         # self._external_fabric_types is used in conjunction with
         # self._fabric_type_to_ext_fabric_type_map.  This is used in (at least)
@@ -250,4 +258,12 @@ class FabricTypes:
         """
         Return a sorted list() of valid fabric template names.
         """
-        return sorted(self._fabric_type_to_template_name_map.values())
+        return list(self._valid_fabric_template_names)
+
+    @property
+    def valid_fabric_template_names_set(self):
+        """
+        Return a frozenset() of valid fabric template names, for use in
+        membership tests.
+        """
+        return self._valid_fabric_template_names_set
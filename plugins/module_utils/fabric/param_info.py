@@ -17,10 +17,8 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 __author__ = "Allen Robel"
 
-import inspect
 import json
 import logging
-import re
 
 from ..common.conversion import ConversionUtils
 
@@ -91,7 +89,7 @@ class ParamInfo:
 
     @template.setter
     def template(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = "template"
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += "template must be a dict. "
@@ -108,7 +106,7 @@ class ParamInfo:
         - raise ValueError if template has no parameters key
         - raise ValueError if template[parameters] is not a list
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "refresh"
         msg = f"{self.class_name}.{method_name}: "
         if self.template is None:
             msg += "Call instance.template before calling instance.refresh()."
@@ -156,7 +154,7 @@ class ParamInfo:
         - default: (``str``, ``int``, etc, or ``None``)
 
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "parameter"
         try:
             return self.info[value]
         except KeyError as error:
@@ -187,7 +185,7 @@ class ParamInfo:
         choices = parameter.get("annotations", {}).get("Enum", None)
         if choices is None:
             return None
-        choices = re.sub(r"\"", "", choices)
+        choices = choices.replace('"', "")
         choices = choices.split(",")
         choices = [self.conversion.make_int(choice) for choice in choices]
         return sorted(choices)
@@ -208,7 +206,7 @@ class ParamInfo:
             value = parameter.get("defaultValue", None)
         if value is None:
             return None
-        value = re.sub('"', "", value)
+        value = value.replace('"', "")
         value_type = self._get_type(parameter)
         if value_type == "string":
             # This prevents things like MPLS_ISIS_AREA_NUM
@@ -256,7 +254,7 @@ class ParamInfo:
         -   Return the ``name`` key from the parameter dict.
         -   Raise ``KeyError`` if ``name`` key is missing
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "_get_param_name"
 
         param_name = parameter.get("name", None)
         if param_name is None:
@@ -315,12 +313,13 @@ class ParamInfo:
         ```
 
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "_build_info"
         self.info = {}
         for parameter in self.template.get("parameters", []):
-            msg = f"{self.class_name}.{method_name}: "
-            msg += f"parameter: {json.dumps(parameter, indent=4, sort_keys=True)}"
-            self.log.debug(msg)
+            if self.log.isEnabledFor(logging.DEBUG):
+                msg = f"{self.class_name}.{method_name}: "
+                msg += f"parameter: {json.dumps(parameter, indent=4, sort_keys=True)}"
+                self.log.debug(msg)
             param_name = self._get_param_name(parameter)
             if param_name not in self.info:
                 self.info[param_name] = {}
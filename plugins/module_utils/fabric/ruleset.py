@@ -18,7 +18,6 @@ __metaclass__ = type
 __author__ = "Allen Robel"
 
 
-import inspect
 import json
 import logging
 import re
@@ -87,7 +86,7 @@ class RuleSetCommon:
 
     @template.setter
     def template(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = "template"
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name} must be a dictionary."
             raise ValueError(msg)
@@ -246,7 +245,7 @@ class RuleSet(RuleSetCommon):
         }
 
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "_update_ruleset_no_boolean"
         msg = f"key {self.param_name}: {self.rule}"
         self.log.debug(msg)
 
@@ -267,9 +266,10 @@ class RuleSet(RuleSetCommon):
         term["value"] = rhs
         self.ruleset[self.param_name]["terms"]["na"].append(term)
 
-        msg = f"{self.param_name}: "
-        msg += f"{json.dumps(self.ruleset[self.param_name], indent=4, sort_keys=True)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = f"{self.param_name}: "
+            msg += f"{json.dumps(self.ruleset[self.param_name], indent=4, sort_keys=True)}"
+            self.log.debug(msg)
 
     def _update_ruleset_boolean(self):
         """
@@ -338,8 +338,7 @@ class RuleSet(RuleSetCommon):
 
         self.rule = [x.strip() for x in self.rule]
         self.rule = [re.sub(r"\s+", " ", x) for x in self.rule]
-        self.rule = [re.sub(r"\"", "", x) for x in self.rule]
-        self.rule = [re.sub(r"\'", "", x) for x in self.rule]
+        self.rule = [x.replace('"', "").replace("'", "") for x in self.rule]
         new_rule = []
 
         self.ruleset[self.param_name] = {}
@@ -360,9 +359,10 @@ class RuleSet(RuleSetCommon):
             self.ruleset[self.param_name]["terms"][boolean_type].append(term)
         msg = f"{boolean_type.upper()}: key {self.param_name}: {new_rule}"
         self.log.debug(msg)
-        msg = f"{boolean_type.upper()}: key {self.param_name}: "
-        msg += f"{json.dumps(self.ruleset[self.param_name], indent=4, sort_keys=True)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = f"{boolean_type.upper()}: key {self.param_name}: "
+            msg += f"{json.dumps(self.ruleset[self.param_name], indent=4, sort_keys=True)}"
+            self.log.debug(msg)
 
     def _update_ruleset(self) -> None:
         """
@@ -406,7 +406,7 @@ class RuleSet(RuleSetCommon):
         - raise ValueError if template has no parameters.
         - raise ValueError if template[parameters] is not a list.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "refresh"
         msg = f"{self.class_name}.{method_name}: "
         if self.template is None:
             msg += "template is not set.  "
@@ -16,14 +16,26 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 __author__ = "Allen Robel"
 
-import inspect
 import json
 import logging
+import operator
 
 from ..common.conversion import ConversionUtils
 from .param_info import ParamInfo
 from .ruleset import RuleSet
 
+# Map ruleset operators to their equivalent functions.
+RULE_OPERATORS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "in": lambda user_value, rule_value: user_value in rule_value,
+    "not in": lambda user_value, rule_value: user_value not in rule_value,
+}
+
 
 class VerifyPlaybookParams:
     """
@@ -106,6 +118,15 @@ class VerifyPlaybookParams:
 
         self.conversion = ConversionUtils()
         self._ruleset = RuleSet()
+        # frozenset of valid choices, keyed on parameter name.
+        # Reset whenever the parameter info is refreshed.
+        self._choices = {}
+        self._param_info_template = None
+        self._ruleset_template = None
+        # Converted parameter values, keyed on parameter name.
+        # Reset whenever the corresponding config is set.
+        self._controller_values = {}
+        self._playbook_values = {}
         self._param_info = ParamInfo()
         self.bad_params = {}
         self.fabric_name = None
@@ -116,16 +137,9 @@ class VerifyPlaybookParams:
         msg = "ENTERED VerifyPlaybookParams(): "
         self.log.debug(msg)
 
-        self._init_properties()
-
-    def _init_properties(self):
-        """
-        self.properties holds property values for the class
-        """
-        self.properties = {}
-        self.properties["config_playbook"] = None
-        self.properties["config_controller"] = None
-        self.properties["template"] = None
+        self._config_controller = None
+        self._config_playbook = None
+        self._template = None
 
     @property
     def config_controller(self):
@@ -134,13 +148,14 @@ class VerifyPlaybookParams:
         -   setter: set the controller fabric config to be verified.
         -   setter: raise ``TypeError`` if the controller config is not a dict.
         """
-        return self.properties["config_controller"]
+        return self._config_controller
 
     @config_controller.setter
     def config_controller(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = "config_controller"
+        self._controller_values = {}
         if value is None:
-            self.properties["config_controller"] = {}
+            self._config_controller = {}
             return
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
@@ -148,7 +163,7 @@ class VerifyPlaybookParams:
             msg += f"got {type(value).__name__} for "
             msg += f"value {value}"
             raise TypeError(msg)
-        self.properties["config_controller"] = value
+        self._config_controller = value
 
     @property
     def config_playbook(self):
@@ -157,18 +172,19 @@ class VerifyPlaybookParams:
         -   setter: set the playbook config to be verified
         -   setter: raise TypeError if playbook config is not a dict
         """
-        return self.properties["config_playbook"]
+        return self._config_playbook
 
     @config_playbook.setter
     def config_playbook(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = "config_playbook"
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += "config_playbook must be a dict. "
             msg += f"got {type(value).__name__} for "
             msg += f"value {value}"
             raise TypeError(msg)
-        self.properties["config_playbook"] = value
+        self._playbook_values = {}
+        self._config_playbook = value
 
     @property
     def template(self):
@@ -177,18 +193,18 @@ class VerifyPlaybookParams:
         -   setter: set the template used to verify the playbook config
         -   setter: raise TypeError if template is not a dict
         """
-        return self.properties["template"]
+        return self._template
 
     @template.setter
     def template(self, value):
-        method_name = inspect.stack()[0][3]
+        method_name = "template"
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += "template must be a dict. "
             msg += f"got {type(value).__name__} for "
             msg += f"value {value}"
             raise TypeError(msg)
-        self.properties["template"] = value
+        self._template = value
 
     def eval_parameter_rule(self, rule) -> bool:
         """
@@ -196,6 +212,7 @@ class VerifyPlaybookParams:
             the fabric template.
         -   Return the result of the evaluation.
         -   Raise KeyError if the rule does not contain expected keys.
+        -   Raise ValueError if the rule operator is not supported.
 
         - rule format:
         ```python
@@ -208,11 +225,10 @@ class VerifyPlaybookParams:
         ```
 
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "eval_parameter_rule"
 
-        msg = f"{self.class_name}.{method_name}: "
-        msg += f"rule: {rule}"
-        self.log.debug(msg)
+        msg = "%s.%s: rule: %s"
+        self.log.debug(msg, self.class_name, method_name, rule)
 
         parameter = rule.get("parameter", None)
         if parameter is None:
@@ -226,8 +242,8 @@ class VerifyPlaybookParams:
             msg += f"'user_value' not found in parameter {parameter} rule: {rule}"
             raise KeyError(msg)
 
-        operator = rule.get("operator", None)
-        if operator is None:
+        rule_operator = rule.get("operator", None)
+        if rule_operator is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"'operator' not found in parameter {parameter} rule: {rule}"
             raise KeyError(msg)
@@ -238,17 +254,21 @@ class VerifyPlaybookParams:
             msg += f"'value' not found in parameter {parameter} rule: {rule}"
             raise KeyError(msg)
 
-        msg = f"{self.class_name}.{method_name}: "
-        msg += f"parameter: {parameter}, "
-        msg += f"user_value: {user_value}, "
-        msg += f"operator: {operator}, "
-        msg += f"rule_value: {rule_value}"
-        self.log.debug(msg)
+        msg = "%s.%s: parameter: %s, user_value: %s, "
+        msg += "operator: %s, rule_value: %s"
+        self.log.debug(
+            msg,
+            self.class_name,
+            method_name,
+            parameter,
+            user_value,
+            rule_operator,
+            rule_value,
+        )
 
         if rule_value in [None, "", "null"]:
-            msg = f"{self.class_name}.{method_name}: "
-            msg += "rule_value is None. Returning True."
-            self.log.debug(msg)
+            msg = "%s.%s: rule_value is None. Returning True."
+            self.log.debug(msg, self.class_name, method_name)
             return True
         if user_value in [None, "", "null"]:
             msg = f"{self.class_name}.{method_name}: "
@@ -256,22 +276,24 @@ class VerifyPlaybookParams:
             self.log.debug(msg)
             raise ValueError(msg)
 
-        eval_string = f"user_value {operator} rule_value"
-        msg = f"{self.class_name}.{method_name}: "
-        msg += f"eval_string {eval_string}"
-        self.log.debug(msg)
-        # While eval() can be dangerous with unknown input, the input
-        # we're feeding it is from a known source and has been pretty
-        # heavily massaged before it gets here.
-        result = eval(eval_string)  # pylint: disable=eval-used
-
-        msg = f"{self.class_name}.{method_name}: "
-        msg += "EVAL: "
-        msg += f"{user_value} "
-        msg += f"{operator} "
-        msg += f"{rule_value} "
-        msg += f"result: {result}"
-        self.log.debug(msg)
+        operator_function = RULE_OPERATORS.get(rule_operator)
+        if operator_function is None:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"Unsupported operator {rule_operator} in parameter "
+            msg += f"{parameter} rule: {rule}"
+            raise ValueError(msg)
+        result = operator_function(user_value, rule_value)
+
+        msg = "%s.%s: EVAL: %s %s %s result: %s"
+        self.log.debug(
+            msg,
+            self.class_name,
+            method_name,
+            user_value,
+            rule_operator,
+            rule_value,
+            result,
+        )
 
         return result
 
@@ -295,48 +317,56 @@ class VerifyPlaybookParams:
 
         -   raise KeyError if self.eval_parameter_rule() fails
         """
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = "controller_param_is_valid"
         rule_parameter = item.get("parameter", None)
         rule_value = item.get("value", None)
         rule_operator = item.get("operator", None)
 
-        msg = f"{self.class_name}.{method_name}: "
-        msg = f"rule_parameter: {rule_parameter}, "
-        msg += f"rule_operator: {rule_operator}, "
-        msg += f"rule_value: {rule_value}, "
-        self.log.debug(msg)
+        msg = "%s.%s: rule_parameter: %s, rule_operator: %s, rule_value: %s"
+        self.log.debug(
+            msg,
+            self.class_name,
+            method_name,
+            rule_parameter,
+            rule_operator,
+            rule_value,
+        )
 
         # Caller indicated that the fabric does not exist.
         # Return None to remove controller parameter result from consideration.
-        if self.config_controller == {}:
-            msg = f"Early return: {rule_parameter} fabric does not exist. "
-            msg += "Returning None."
-            self.log.debug(msg)
+        config_controller = self._config_controller
+        if config_controller == {}:
+            msg = "Early return: %s fabric does not exist. Returning None."
+            self.log.debug(msg, rule_parameter)
             return None
 
         # The controller config does not contain the parameter.
         # Return None to remove controller parameter result from consideration.
-        if rule_parameter not in self.config_controller:
-            msg = f"Early return: {rule_parameter} not in config_controller. "
-            msg += "Returning None."
-            self.log.debug(msg)
+        if rule_parameter not in config_controller:
+            msg = "Early return: %s not in config_controller. Returning None."
+            self.log.debug(msg, rule_parameter)
             return None
 
-        controller_value = self.conversion.make_none(
-            self.conversion.make_boolean(self.config_controller[rule_parameter])
+        if rule_parameter not in self._controller_values:
+            self._controller_values[rule_parameter] = self.conversion.make_none(
+                self.conversion.make_boolean(config_controller[rule_parameter])
+            )
+        controller_value = self._controller_values[rule_parameter]
+
+        msg = "%s.%s: parameter %s, controller_value: type %s, value %s"
+        self.log.debug(
+            msg,
+            self.class_name,
+            method_name,
+            rule_parameter,
+            type(controller_value),
+            controller_value,
         )
 
-        msg = f"{self.class_name}.{method_name}: "
-        msg += f"parameter {rule_parameter}, "
-        msg += f"controller_value: type {type(controller_value)}, "
-        msg += f"value {controller_value}"
-        self.log.debug(msg)
-
         # If the controller value is None, remove it from consideration.
         if controller_value is None:
-            msg = f"{self.class_name}.{method_name}: "
-            msg += f"Early return: {rule_parameter} is None.  Returning None."
-            self.log.debug(msg)
+            msg = "%s.%s: Early return: %s is None.  Returning None."
+            self.log.debug(msg, self.class_name, method_name, rule_parameter)
             return None
         # update item with user's parameter value
         item["user_value"] = controller_value
@@ -358,36 +388,46 @@ class VerifyPlaybookParams:
 
         -   raise KeyError if self.eval_parameter_rule() fails
         """
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = "playbook_param_is_valid"
 
         rule_parameter = item.get("parameter", None)
         rule_value = item.get("value", None)
         rule_operator = item.get("operator", None)
 
-        msg = f"{self.class_name}.{method_name}: "
-        msg += f"rule_parameter: {rule_parameter}, "
-        msg += f"rule_operator: {rule_operator}, "
-        msg += f"rule_value: {rule_value}, "
-        self.log.debug(msg)
+        msg = "%s.%s: rule_parameter: %s, rule_operator: %s, rule_value: %s"
+        self.log.debug(
+            msg,
+            self.class_name,
+            method_name,
+            rule_parameter,
+            rule_operator,
+            rule_value,
+        )
 
         # The playbook config does not contain the parameter.
         # Return None to remove playbook parameter result from consideration.
-        if rule_parameter not in self.config_playbook:
-            msg = f"Early return: {rule_parameter} not in config_playbook. "
-            msg += "Returning None."
-            self.log.debug(msg)
+        config_playbook = self._config_playbook
+        if rule_parameter not in config_playbook:
+            msg = "Early return: %s not in config_playbook. Returning None."
+            self.log.debug(msg, rule_parameter)
             return None
 
-        playbook_value = self.conversion.make_none(
-            self.conversion.make_boolean(self.config_playbook[rule_parameter])
+        if rule_parameter not in self._playbook_values:
+            self._playbook_values[rule_parameter] = self.conversion.make_none(
+                self.conversion.make_boolean(config_playbook[rule_parameter])
+            )
+        playbook_value = self._playbook_values[rule_parameter]
+
+        msg = "%s.%s: parameter %s, playbook_value: type %s, value %s"
+        self.log.debug(
+            msg,
+            self.class_name,
+            method_name,
+            rule_parameter,
+            type(playbook_value),
+            playbook_value,
         )
 
-        msg = f"{self.class_name}.{method_name}: "
-        msg += f"parameter {rule_parameter}, "
-        msg += f"controller_value: type {type(playbook_value)}, "
-        msg += f"value {playbook_value}"
-        self.log.debug(msg)
-
         # update item with playbook's parameter value
         item["user_value"] = playbook_value
         try:
@@ -409,38 +449,41 @@ class VerifyPlaybookParams:
 
         -   raise KeyError if self.eval_parameter_rule() fails
         """
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = "default_param_is_valid"
 
         rule_parameter = item.get("parameter", None)
         rule_value = item.get("value", None)
         rule_operator = item.get("operator", None)
 
-        msg = f"{self.class_name}.{method_name}: "
-        msg = f"rule_parameter: {rule_parameter}, "
-        msg += f"rule_operator: {rule_operator}, "
-        msg += f"rule_value: {rule_value}, "
-        self.log.debug(msg)
+        msg = "%s.%s: rule_parameter: %s, rule_operator: %s, rule_value: %s"
+        self.log.debug(
+            msg,
+            self.class_name,
+            method_name,
+            rule_parameter,
+            rule_operator,
+            rule_value,
+        )
 
         # The playbook config contains the parameter.
         # Return None to remove default_param result from consideration.
-        if rule_parameter in self.config_playbook:
-            msg = f"Early return: parameter: {rule_parameter} in config_playbook. "
-            msg += "Returning None."
-            self.log.debug(msg)
+        config_playbook = self._config_playbook
+        if rule_parameter in config_playbook:
+            msg = "Early return: parameter: %s in config_playbook. Returning None."
+            self.log.debug(msg, rule_parameter)
             return None
         # The controller config contains the parameter.
         # Return None to remove default_param result from consideration.
-        if rule_parameter in self.config_controller:
-            msg = f"Early return: parameter: {rule_parameter} in config_controller. "
-            msg += "Returning None."
-            self.log.debug(msg)
+        config_controller = self._config_controller
+        if rule_parameter in config_controller:
+            msg = "Early return: parameter: %s in config_controller. Returning None."
+            self.log.debug(msg, rule_parameter)
             return None
 
         default_value = self._param_info.parameter(rule_parameter).get("default", None)
         if default_value is None:
-            msg = f"Early return: parameter: {rule_parameter} "
-            msg += "has no default value. Returning None."
-            self.log.debug(msg)
+            msg = "Early return: parameter: %s has no default value. Returning None."
+            self.log.debug(msg, rule_parameter)
             return None
 
         # update item with user's parameter value
@@ -451,15 +494,15 @@ class VerifyPlaybookParams:
         except KeyError as error:
             raise KeyError(f"{error}") from error
 
-    def update_decision_set(self, item) -> set:
+    def update_decision_set(self, item) -> bool:
         """
         ### Summary
-        Update the decision set with the aggregate of results from the
-        - controller fabric configuration
+        Decide whether a rule term is satisfied, based on the results from the
         - playbook configuration
+        - controller fabric configuration
         - fabric defaults (from the fabric template)
 
-        - Return the decision set if no errors occur
+        - Return True if the rule term is satisfied, else False
         - Raise KeyError if controller_param_is_valid() fails
         - Raise KeyError if playbook_param_is_valid() fails
         - Raise KeyError if default_param_is_valid() fails
@@ -475,101 +518,60 @@ class VerifyPlaybookParams:
           ```
 
         ### Notes
-        1. If all of the following return None, then we add True to the decision_set.
+        1. The playbook result overrides all other results.  If
+           playbook_param_is_valid() returns True or False, return it
+           without evaluating the controller and default values.
+        2. Otherwise, return True if either the controller or default
+           result is True.
+        3. If all of the following return None, return True.
            - controller_param_is_valid()
            - playbook_param_is_valid()
            - default_param_is_valid()
         """
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
-        decision_set = set()
+        method_name = "update_decision_set"
 
-        msg = f"{self.class_name}.{method_name}: "
-        msg += f"item {item}"
-        self.log.debug(msg)
+        msg = "%s.%s: item %s"
+        self.log.debug(msg, self.class_name, method_name, item)
 
         parameter = item.get("parameter")
 
         try:
-            controller_is_valid = self.controller_param_is_valid(item)
+            playbook_is_valid = self.playbook_param_is_valid(item)
         except KeyError as error:
             raise KeyError(f"{error}") from error
 
-        msg = f"{self.class_name}.{method_name}: "
-        msg += f"parameter: {parameter}, "
-        msg += f"controller_is_valid: {controller_is_valid}"
-        self.log.debug(msg)
+        msg = "%s.%s: parameter: %s, playbook_is_valid: %s"
+        self.log.debug(msg, self.class_name, method_name, parameter, playbook_is_valid)
+
+        # The playbook result, if any, overrides all other results.
+        # default_param_is_valid() would return None in this case anyway.
+        if playbook_is_valid is not None:
+            return playbook_is_valid
 
         try:
-            playbook_is_valid = self.playbook_param_is_valid(item)
+            controller_is_valid = self.controller_param_is_valid(item)
         except KeyError as error:
             raise KeyError(f"{error}") from error
 
-        msg = f"{self.class_name}.{method_name}: "
-        msg += f"parameter: {parameter}, "
-        msg += f"playbook_is_valid: {playbook_is_valid}"
-        self.log.debug(msg)
+        msg = "%s.%s: parameter: %s, controller_is_valid: %s"
+        self.log.debug(msg, self.class_name, method_name, parameter, controller_is_valid)
+
+        if controller_is_valid is True:
+            return True
 
         try:
             default_is_valid = self.default_param_is_valid(item)
         except KeyError as error:
             raise KeyError(f"{error}") from error
 
-        msg = f"{self.class_name}.{method_name}: "
-        msg += f"parameter: {parameter}, "
-        msg += f"default_is_valid: {default_is_valid}"
-        self.log.debug(msg)
-
-        if controller_is_valid is not None:
-            msg = f"{self.class_name}.{method_name}: "
-            msg += f"parameter: {parameter}, add to decision set: "
-            msg += f"controller_is_valid: {controller_is_valid}"
-            self.log.debug(msg)
-            decision_set.add(controller_is_valid)
-        if default_is_valid is not None:
-            msg = f"{self.class_name}.{method_name}: "
-            msg += f"parameter: {parameter}, add to decision set: "
-            msg += f"default_is_valid: {default_is_valid}"
-            self.log.debug(msg)
-            decision_set.add(default_is_valid)
-        if playbook_is_valid is not None:
-            msg = f"{self.class_name}.{method_name}: "
-            msg += f"parameter: {parameter}, add to decision set: "
-            msg += f"playbook_is_valid: {playbook_is_valid}"
-            self.log.debug(msg)
-            decision_set.add(playbook_is_valid)
-
-        # If playbook config is not valid, ignore all other results
-        if playbook_is_valid is False:
-            msg = f"{self.class_name}.{method_name}: "
-            msg += f"parameter: {parameter}, "
-            msg += f"playbook is invalid: {playbook_is_valid}. "
-            msg += "Setting decision_set to False."
-            self.log.debug(msg)
-            decision_set = {False}
-
-        msg = f"{self.class_name}.{method_name}: "
-        msg += f"parameter: {parameter}, "
-        msg += f"decision_set: ({decision_set})"
-        self.log.debug(msg)
+        msg = "%s.%s: parameter: %s, default_is_valid: %s"
+        self.log.debug(msg, self.class_name, method_name, parameter, default_is_valid)
 
-        # If the decision_set is empty, add True.
-        if len(decision_set) == 0:
-            msg = f"{self.class_name}.{method_name}: "
-            msg += f"parameter: {parameter}, "
-            msg += "decision_set is empty. Setting to True."
-            self.log.debug(msg)
-            decision_set = {True}
-
-        msg = f"parameter {self.parameter}, "
-        msg += f"item: {item}, "
-        msg += f"controller_is_valid: {controller_is_valid}, "
-        msg += f"playbook_is_valid: {playbook_is_valid}, "
-        msg += f"default_is_valid: {default_is_valid}, "
-        msg += f"params_are_valid: {self.params_are_valid}, "
-        msg += f"decision_set: {decision_set}"
-        self.log.debug(msg)
+        if default_is_valid is True:
+            return True
 
-        return decision_set
+        # All results are None, or at least one is False.
+        return controller_is_valid is None and default_is_valid is None
 
     def verify_parameter_value(self) -> None:
         """
@@ -587,8 +589,9 @@ class VerifyPlaybookParams:
         -   Raise ``ValueError`` for all parameters, if the parameter value
             is a boolean string.
         """
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
-        playbook_value = self.config_playbook.get(self.parameter)
+        method_name = "verify_parameter_value"  # pylint: disable=unused-variable
+        parameter = self.parameter
+        playbook_value = self.config_playbook.get(parameter)
 
         # Reject quoted boolean values e.g. "False", "true"
         # try:
@@ -600,17 +603,15 @@ class VerifyPlaybookParams:
         # Skip "local" parameters i.e. parameters that are valid in a
         # playbook but not found in the template retrieved from the controller
         # e.g. DEPLOY
-        if self.parameter in self.local_params:
+        if parameter in self.local_params:
             return
 
         # raise KeyError if the parameter is not found in the template
         try:
-            param_info = self._param_info.parameter(self.parameter)
+            param_info = self._param_info.parameter(parameter)
         except KeyError as error:
-            msg = f"{self.class_name}.{method_name}: "
-            msg += f"parameter: {self.parameter} not found in template. "
-            msg += f"Error detail: {error}"
-            self.log.debug(msg)
+            msg = "%s.%s: parameter: %s not found in template. Error detail: %s"
+            self.log.debug(msg, self.class_name, method_name, parameter, error)
             return
 
         # Return if the parameter is found in the template and the template
@@ -623,122 +624,132 @@ class VerifyPlaybookParams:
 
         # Try to convert to boolean, for comparison purposes, if the
         # parameter's type is defined to be boolean in the template.
-        if param_info["type"] == "boolean":
+        is_boolean = param_info["type"] == "boolean"
+        if is_boolean:
             playbook_value = self.conversion.make_boolean(playbook_value)
         # If the user specifies 0/1 for False/True, NDFC fails with a 500 error
         # (at least for ADVERTISE_PIP_BGP).  Let's mandate that the user cannot
         # use 0/1 as a substitute for boolean values and fail here instead.
         # NOTE: self.conversion.make_int() should not (and does not)
         # convert boolean values to integers.
-        if param_info["type"] == "boolean" and not isinstance(playbook_value, bool):
+        if is_boolean and not isinstance(playbook_value, bool):
             msg = f"{self.class_name}.{method_name}: "
-            msg += f"Parameter: {self.parameter}, "
+            msg += f"Parameter: {parameter}, "
             msg += f"Invalid value: ({playbook_value}). "
             msg += f"Valid values: {param_info['choices']}"
             raise ValueError(msg)
 
+        choices = self._choices.get(parameter)
+        if choices is None:
+            choices = frozenset(param_info["choices"])
+            self._choices[parameter] = choices
+        try:
+            is_valid_choice = playbook_value in choices
+        except TypeError:
+            # Unhashable playbook values (e.g. list) cannot match a choice.
+            is_valid_choice = False
+
         # Return if the parameter is found in the template and the parameter
         # value matches a valid choice for the parameter
-        if playbook_value in param_info["choices"]:
-            msg = f"{self.class_name}.{method_name}: "
-            msg += f"Parameter: {self.parameter}, "
-            msg += f"playbook_value ({playbook_value}). "
-            msg += f"in valid values: {param_info['choices']}. "
-            msg += "Returning."
-            self.log.debug(msg)
+        if is_valid_choice:
+            msg = "%s.%s: Parameter: %s, playbook_value (%s). "
+            msg += "in valid values: %s. Returning."
+            self.log.debug(
+                msg,
+                self.class_name,
+                method_name,
+                parameter,
+                playbook_value,
+                param_info["choices"],
+            )
             return
 
         # Raise ValueError if the parameter value does not match any of the
         # choices specified in the template for the parameter
         msg = f"{self.class_name}.{method_name}: "
-        msg += f"Parameter: {self.parameter}, "
+        msg += f"Parameter: {parameter}, "
         msg += f"Invalid value: ({playbook_value}). "
         msg += f"Valid values: {param_info['choices']}"
         raise ValueError(msg)
 
     def update_decision_set_for_and_rules(self, param_rule) -> None:
         """
-        -   Update the decision set for rules containing only AND'd terms.
-        -   Update self.params_are_valid with the result of the decision set.
+        -   Evaluate rules containing only AND'd terms.
+        -   Update self.params_are_valid with the result.
         -   Add the parameter to the bad_params dict if the controller
-            would return an error for the parameter (i.e. the updated
-            decision set does not contain True).
-        -   Raise ``KeyError`` if an error is encountered while updating
-            the decision set.
+            would return an error for the parameter (i.e. update_decision_set()
+            returns False).
+        -   Raise ``KeyError`` if an error is encountered while evaluating
+            the rule terms.
         """
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = "update_decision_set_for_and_rules"  # pylint: disable=unused-variable
+        parameter = self.parameter
         for item in param_rule.get("terms", {}).get("and"):
             try:
-                decision_set = self.update_decision_set(item)
+                is_valid = self.update_decision_set(item)
             except KeyError as error:
                 raise KeyError(f"{error}") from error
 
-            msg = f"{self.class_name}.{method_name}: "
-            msg += f"decision_set: ({decision_set})"
-            self.log.debug(msg)
+            msg = "%s.%s: is_valid: %s"
+            self.log.debug(msg, self.class_name, method_name, is_valid)
 
             # bad_params[fabric][param] = <list of bad_param dict>
-            if True not in decision_set:
+            if not is_valid:
                 self.params_are_valid.add(False)
 
-                if self.fabric_name not in self.bad_params:
-                    self.bad_params[self.fabric_name] = {}
-                if self.parameter not in self.bad_params[self.fabric_name]:
-                    self.bad_params[self.fabric_name][self.parameter] = []
-                bad_param = {}
-                bad_param["fabric_name"] = self.fabric_name
-                bad_param["config_param"] = self.parameter
-                bad_param["config_value"] = self.config_playbook[self.parameter]
-                bad_param["dependent_param"] = item.get("parameter")
-                bad_param["dependent_operator"] = item.get("operator")
-                bad_param["dependent_value"] = item.get("value")
-                bad_param["boolean_operator"] = "and"
-                self.bad_params[self.fabric_name][self.parameter].append(bad_param)
+                bad_params = self.bad_params.setdefault(self.fabric_name, {})
+                bad_param_list = bad_params.setdefault(parameter, [])
+                bad_param = {
+                    "fabric_name": self.fabric_name,
+                    "config_param": parameter,
+                    "config_value": self.config_playbook[parameter],
+                    "dependent_param": item.get("parameter"),
+                    "dependent_operator": item.get("operator"),
+                    "dependent_value": item.get("value"),
+                    "boolean_operator": "and",
+                }
+                bad_param_list.append(bad_param)
             else:
                 self.params_are_valid.add(True)
 
     def update_decision_set_for_or_rules(self, param_rule) -> None:
         """
-        -   Update the decision set for rules containing only OR'd terms.
-        -   Update self.params_are_valid with the result of the decision set.
+        -   Evaluate rules containing only OR'd terms.
+        -   Update self.params_are_valid with the result.
         -   Add the parameter to the bad_params dict if the controller
-            would return an error for the parameter (i.e. the updated
-            decision set does not contain True).
-        -   Raise ``KeyError`` if an error is encountered while updating
-            the decision set.
+            would return an error for the parameter (i.e. update_decision_set()
+            returns False).
+        -   Raise ``KeyError`` if an error is encountered while evaluating
+            the rule terms.
         -   Raise ``ValueError`` if an unexpected number of dependent
             parameters are found in param_rule.
         """
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = "update_decision_set_for_or_rules"  # pylint: disable=unused-variable
+        parameter = self.parameter
 
-        decision_set = set()
         # valid_values is used in the error message for OR'd parameters
         valid_values = set()
         terms = param_rule.get("terms", {}).get("or")
 
-        # update decision_set with the aggregate of results from
-        # all terms in the rule.
+        # Update params_are_valid with True and return as soon as
+        # any term in the rule is satisfied.
         for item in terms:
             valid_values.add(item.get("value"))
             try:
-                decision_set.update(self.update_decision_set(item))
+                is_valid = self.update_decision_set(item)
             except KeyError as error:
                 raise KeyError(f"{error}") from error
-
-        # Update params_are_valid with True and return if all params are valid.
-        if True in decision_set:
-            self.params_are_valid.add(True)
-            return
+            if is_valid:
+                self.params_are_valid.add(True)
+                return
 
         # Update params_are_valid with False and populate self.bad_params
         # if any of the params were invalid.
         self.params_are_valid.add(False)
 
         # bad_params[fabric][param] = <list of bad_param dict>
-        if self.fabric_name not in self.bad_params:
-            self.bad_params[self.fabric_name] = {}
-        if self.parameter not in self.bad_params[self.fabric_name]:
-            self.bad_params[self.fabric_name][self.parameter] = []
+        bad_params = self.bad_params.setdefault(self.fabric_name, {})
+        bad_param_list = bad_params.setdefault(parameter, [])
 
         # OR'd parameters have (thus far) only had one dependent parameter.
         # Specifically, STP_BRIDGE_PRIORITY has two rule terms, each with the
@@ -755,18 +766,19 @@ class VerifyPlaybookParams:
             # unit test regex match.  Also, it's good for consistent
             # (i.e. alphabetized) error messages for the user.
             msg += f"{sorted(list(verify_one_dependent_parameter_is_present))}. "
-            msg += f"parameter {self.parameter}, rule {param_rule}."
+            msg += f"parameter {parameter}, rule {param_rule}."
             raise ValueError(msg)
 
-        bad_param = {}
-        bad_param["fabric_name"] = self.fabric_name
-        bad_param["config_param"] = self.parameter
-        bad_param["config_value"] = self.config_playbook[self.parameter]
-        bad_param["dependent_param"] = terms[0].get("parameter")
-        bad_param["dependent_operator"] = terms[0].get("operator")
-        bad_param["dependent_value"] = valid_values
-        bad_param["boolean_operator"] = "or"
-        self.bad_params[self.fabric_name][self.parameter].append(bad_param)
+        bad_param = {
+            "fabric_name": self.fabric_name,
+            "config_param": parameter,
+            "config_value": self.config_playbook[parameter],
+            "dependent_param": terms[0].get("parameter"),
+            "dependent_operator": terms[0].get("operator"),
+            "dependent_value": valid_values,
+            "boolean_operator": "or",
+        }
+        bad_param_list.append(bad_param)
 
     def update_decision_set_for_na_rules(self, param_rule) -> str:
         """
@@ -776,7 +788,8 @@ class VerifyPlaybookParams:
             - ["na"]["terms")
         - Raise ``ValueError`` if the rule["na"]["terms"] does not contain one element
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "update_decision_set_for_na_rules"
+        parameter = self.parameter
         msg = f"{self.class_name}.{method_name}: "
 
         if len(param_rule.get("terms", {}).get("na")) != 1:
@@ -787,27 +800,26 @@ class VerifyPlaybookParams:
 
         for item in param_rule.get("terms", {}).get("na"):
             try:
-                decision_set = self.update_decision_set(item)
+                is_valid = self.update_decision_set(item)
             except KeyError as error:
                 raise KeyError(f"{error}") from error
 
             # bad_params[fabric][param] = <list of bad_param dict>
-            if True not in decision_set:
+            if not is_valid:
                 self.params_are_valid.add(False)
 
-                if self.fabric_name not in self.bad_params:
-                    self.bad_params[self.fabric_name] = {}
-                if self.parameter not in self.bad_params[self.fabric_name]:
-                    self.bad_params[self.fabric_name][self.parameter] = []
-                bad_param = {}
-                bad_param["fabric_name"] = self.fabric_name
-                bad_param["config_param"] = self.parameter
-                bad_param["config_value"] = self.config_playbook[self.parameter]
-                bad_param["dependent_param"] = item.get("parameter")
-                bad_param["dependent_operator"] = item.get("operator")
-                bad_param["dependent_value"] = item.get("value")
-                bad_param["boolean_operator"] = "na"
-                self.bad_params[self.fabric_name][self.parameter].append(bad_param)
+                bad_params = self.bad_params.setdefault(self.fabric_name, {})
+                bad_param_list = bad_params.setdefault(parameter, [])
+                bad_param = {
+                    "fabric_name": self.fabric_name,
+                    "config_param": parameter,
+                    "config_value": self.config_playbook[parameter],
+                    "dependent_param": item.get("parameter"),
+                    "dependent_operator": item.get("operator"),
+                    "dependent_value": item.get("value"),
+                    "boolean_operator": "na",
+                }
+                bad_param_list.append(bad_param)
             else:
                 self.params_are_valid.add(True)
 
@@ -815,20 +827,15 @@ class VerifyPlaybookParams:
         """
         Verify a parameter against the template.
 
-        -   Raise ``ValueError`` if FABRIC_NAME is not present in the playbook.
+        -   commit() sets self.fabric_name before calling this method.
         -   Raise ``ValueError`` if the parameter does not match any of the
             valid values specified in the template for the parameter
         """
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = "verify_parameter"  # pylint: disable=unused-variable
 
-        # self.fabric_name is used in:
-        #   - bad_params to help the user identify which
-        #     fabric contains the bad parameter(s)
-        #   - verify_parameter_value() raise message
-        self.fabric_name = self.config_playbook.get("FABRIC_NAME", None)
-        if self.fabric_name is None:
-            msg = "FABRIC_NAME not found in playbook config."
-            raise ValueError(msg)
+        config_playbook = self._config_playbook
+        parameter = self.parameter
+        ruleset = self._ruleset.ruleset
 
         # Verify the parameter value against a list of valid choices
         # in the template.
@@ -837,63 +844,76 @@ class VerifyPlaybookParams:
         except ValueError as error:
             raise ValueError(error) from error
 
-        if self.parameter not in self._ruleset.ruleset:
-            msg = f"SKIP {self.parameter}: Not in ruleset."
-            self.log.debug(msg)
+        param_rule = ruleset.get(parameter)
+        if param_rule is None:
+            msg = "SKIP %s: Not in ruleset."
+            self.log.debug(msg, parameter)
             return
 
-        msg = "self.parameter: "
-        msg += f"{self.parameter}, "
-        msg += "config_playbook_value: "
-        msg += f"{self.config_playbook.get(self.parameter)}, "
-        msg += "config_controller_value: "
-        msg += f"{self.config_controller.get(self.parameter)}"
-        self.log.debug(msg)
-
-        param_rule = self._ruleset.ruleset[self.parameter]
-        case_and_rule = "and" in param_rule.get("terms") and "or" not in param_rule.get(
-            "terms"
+        msg = "self.parameter: %s, config_playbook_value: %s, "
+        msg += "config_controller_value: %s"
+        self.log.debug(
+            msg,
+            parameter,
+            config_playbook.get(parameter),
+            self._config_controller.get(parameter),
         )
-        case_or_rule = "or" in param_rule.get("terms") and "and" not in param_rule.get(
-            "terms"
-        )
-        case_na_rule = "na" in param_rule.get("terms")
-        msg = f"{self.class_name}.{method_name}: "
-        msg += f"PRE_UPDATE: self.params_are_valid: {self.params_are_valid}"
-        self.log.debug(msg)
+
+        terms = param_rule.get("terms")
+        case_and_rule = "and" in terms and "or" not in terms
+        case_or_rule = "or" in terms and "and" not in terms
+        case_na_rule = "na" in terms
+        msg = "%s.%s: PRE_UPDATE: self.params_are_valid: %s"
+        self.log.debug(msg, self.class_name, method_name, self.params_are_valid)
         try:
             if case_and_rule:
                 self.update_decision_set_for_and_rules(param_rule)
-                msg = f"{self.class_name}.{method_name}: "
-                msg += f"UPDATE_FOR_AND_RULES: parameter: {self.parameter} self.params_are_valid: {self.params_are_valid}"
-                self.log.debug(msg)
+                msg = "%s.%s: UPDATE_FOR_AND_RULES: parameter: %s "
+                msg += "self.params_are_valid: %s"
+                self.log.debug(
+                    msg,
+                    self.class_name,
+                    method_name,
+                    parameter,
+                    self.params_are_valid,
+                )
             elif case_or_rule:
                 self.update_decision_set_for_or_rules(param_rule)
-                msg = f"{self.class_name}.{method_name}: "
-                msg += f"UPDATE_FOR_OR_RULES: parameter: {self.parameter} self.params_are_valid: {self.params_are_valid}"
-                self.log.debug(msg)
+                msg = "%s.%s: UPDATE_FOR_OR_RULES: parameter: %s "
+                msg += "self.params_are_valid: %s"
+                self.log.debug(
+                    msg,
+                    self.class_name,
+                    method_name,
+                    parameter,
+                    self.params_are_valid,
+                )
             elif case_na_rule:
                 self.update_decision_set_for_na_rules(param_rule)
-                msg = f"{self.class_name}.{method_name}: "
-                msg += f"UPDATE_FOR_NA_RULES: parameter: {self.parameter} self.params_are_valid: {self.params_are_valid}"
-                self.log.debug(msg)
+                msg = "%s.%s: UPDATE_FOR_NA_RULES: parameter: %s "
+                msg += "self.params_are_valid: %s"
+                self.log.debug(
+                    msg,
+                    self.class_name,
+                    method_name,
+                    parameter,
+                    self.params_are_valid,
+                )
             else:
-                msg = f"{self.class_name}.{method_name}: "
-                msg += "TODO: Unhandled parameter rule: "
-                msg += f"parameter {self.parameter}, "
-                msg += f"rule: {param_rule}"
-                self.log.debug(msg)
+                msg = "%s.%s: TODO: Unhandled parameter rule: "
+                msg += "parameter %s, rule: %s"
+                self.log.debug(msg, self.class_name, method_name, parameter, param_rule)
         except (KeyError, ValueError) as error:
             raise ValueError(error) from error
 
-        msg = f"self.params_are_valid: {self.params_are_valid}"
-        self.log.debug(msg)
+        msg = "self.params_are_valid: %s"
+        self.log.debug(msg, self.params_are_valid)
 
     def validate_commit_parameters(self):
         """
         raise ValueError if required parameters are not set
         """
-        method_name = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name = "validate_commit_parameters"  # pylint: disable=unused-variable
         if self.config_controller is None:
             msg = f"{self.class_name}.{method_name}: "
             msg += "instance.config_controller "
@@ -918,7 +938,14 @@ class VerifyPlaybookParams:
 
         -   raise TypeError if the template is not a dict
         -   raise ValueError if ParamInfo.refresh() fails
+        -   The parameter info is rebuilt only when the template object
+            changes (see update_ruleset()).
         """
+        if (
+            self._param_info_template is not None
+            and self._param_info_template is self.template
+        ):
+            return
         try:
             self._param_info.template = self.template
         except TypeError as error:
@@ -928,21 +955,35 @@ class VerifyPlaybookParams:
             self._param_info.refresh()
         except ValueError as error:
             raise ValueError(error) from error
+        self._choices = {}
+        self._param_info_template = self.template
 
-        msg = "self._param_info.info: "
-        msg += f"{json.dumps(self._param_info.info, indent=4, sort_keys=True)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = "self._param_info.info: "
+            msg += f"{json.dumps(self._param_info.info, indent=4, sort_keys=True)}"
+            self.log.debug(msg)
 
     def update_ruleset(self):
         """
         Update the fabric parameter ruleset based on the fabric template
+
+        -   The ruleset is rebuilt only when the template object changes,
+            so that repeated calls to commit() (e.g. once per fabric
+            when many fabrics share a template) reuse the ruleset.
         """
+        if (
+            self._ruleset_template is not None
+            and self._ruleset_template is self.template
+        ):
+            return
         self._ruleset.template = self.template
         self._ruleset.refresh()
+        self._ruleset_template = self.template
 
-        msg = "self._ruleset.ruleset: "
-        msg += f"{json.dumps(self._ruleset.ruleset, indent=4, sort_keys=True)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = "self._ruleset.ruleset: "
+            msg += f"{json.dumps(self._ruleset.ruleset, indent=4, sort_keys=True)}"
+            self.log.debug(msg)
 
     def generate_error_message(self):
         """
@@ -951,12 +992,14 @@ class VerifyPlaybookParams:
         -   Raise ``ValueError`` with this error message so the the main
             task module can catch and handle the error.
         """
-        msg = "The following parameter(value) combination(s) are invalid "
-        msg += "and need to be reviewed: "
+        parts = [
+            "The following parameter(value) combination(s) are invalid ",
+            "and need to be reviewed: ",
+        ]
 
         # bad_params[fabric][param] = <list of bad param dict>
         for fabric_name, fabric_dict in self.bad_params.items():
-            msg += f"Fabric: {fabric_name}, "
+            parts.append(f"Fabric: {fabric_name}, ")
             for bad_param_list in fabric_dict.values():
                 for bad_param in bad_param_list:
                     boolean_operator = bad_param.get("boolean_operator")
@@ -965,23 +1008,23 @@ class VerifyPlaybookParams:
                     dependent_param = bad_param.get("dependent_param")
                     dependent_operator = bad_param.get("dependent_operator")
                     dependent_value = bad_param.get("dependent_value")
+                    choices = self._param_info.info[dependent_param]["choices"]
 
-                    msg += f"{config_param}({config_value}) requires "
+                    parts.append(f"{config_param}({config_value}) requires ")
                     if boolean_operator == "or":
-                        msg += f"{dependent_param} to be one of "
-                        msg += f"[{', '.join(sorted(dependent_value))}]. "
-                        msg += f"{dependent_param} valid values: "
-                        msg += f"{self._param_info.info[dependent_param]['choices']}. "
+                        parts.append(f"{dependent_param} to be one of ")
+                        parts.append(f"[{', '.join(sorted(dependent_value))}]. ")
                     if boolean_operator == "and":
-                        msg += f"{dependent_param} {dependent_operator} {dependent_value}, "
-                        msg += f"{dependent_param} valid values: "
-                        msg += f"{self._param_info.info[dependent_param]['choices']}. "
+                        parts.append(
+                            f"{dependent_param} {dependent_operator} {dependent_value}, "
+                        )
                     if boolean_operator == "na":
-                        msg += f"{dependent_param} {dependent_operator} {dependent_value}. "
-                        msg += f"{dependent_param} valid values: "
-                        msg += f"{self._param_info.info[dependent_param]['choices']}. "
+                        parts.append(
+                            f"{dependent_param} {dependent_operator} {dependent_value}. "
+                        )
+                    parts.append(f"{dependent_param} valid values: {choices}. ")
 
-            msg.rstrip(", ")
+        msg = "".join(parts)
         self.log.debug(msg)
         raise ValueError(msg)
 
@@ -992,6 +1035,7 @@ class VerifyPlaybookParams:
         -   Raise ValueError in the following cases:
             - Required parameters are not set prior to calling commit()
             - ParamInfo() returns errors(s)
+            - FABRIC_NAME is not present in the playbook config
             - A parameter fails verification
         """
         try:
@@ -1006,12 +1050,23 @@ class VerifyPlaybookParams:
         except (TypeError, ValueError) as error:
             raise ValueError(error) from error
 
-        msg = "self.config_playbook: "
-        msg += f"{json.dumps(self.config_playbook, indent=4, sort_keys=True)}"
-        self.log.debug(msg)
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = "self.config_playbook: "
+            msg += f"{json.dumps(self.config_playbook, indent=4, sort_keys=True)}"
+            self.log.debug(msg)
+
+        # self.fabric_name is used in:
+        #   - bad_params to help the user identify which
+        #     fabric contains the bad parameter(s)
+        #   - verify_parameter_value() raise message
+        self.fabric_name = self.config_playbook.get("FABRIC_NAME", None)
+        if self.fabric_name is None:
+            msg = "FABRIC_NAME not found in playbook config."
+            raise ValueError(msg)
 
         self.params_are_valid = set()
-        for self.parameter in self.config_playbook:
+        for parameter in self.config_playbook:
+            self.parameter = parameter
             try:
                 self.verify_parameter()
             except ValueError as error:
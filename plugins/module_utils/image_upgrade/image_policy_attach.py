@@ -267,13 +267,13 @@ class ImagePolicyAttach:
 
         ### Raises
         -   ValueError: if:
-                -   ``items`` is not a set.
+                -   ``items`` is not iterable.
                 -   ``item_type`` is not a valid item type.
                 -   The action times out.
         """
         method_name = inspect.stack()[0][3]
         try:
-            self.wait_for_controller_done.items = set(copy.copy(self.serial_numbers))
+            self.wait_for_controller_done.items = self.serial_numbers
             self.wait_for_controller_done.item_type = "serial_number"
             self.wait_for_controller_done.rest_send = (
                 self.rest_send  # pylint: disable=no-member
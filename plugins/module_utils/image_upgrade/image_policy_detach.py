@@ -18,7 +18,6 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 __author__ = "Allen Robel"
 
-import copy
 import inspect
 import json
 import logging
@@ -215,12 +214,12 @@ class ImagePolicyDetach:
 
         ### Raises
         -   ValueError: if:
-                -   ``items`` is not a set.
+                -   ``items`` is not iterable.
                 -   ``item_type`` is not a valid item type.
                 -   The action times out.
         """
         try:
-            self.wait_for_controller_done.items = set(copy.copy(self.serial_numbers))
+            self.wait_for_controller_done.items = self.serial_numbers
             self.wait_for_controller_done.item_type = "serial_number"
             self.wait_for_controller_done.rest_send = (
                 self.rest_send  # pylint: disable=no-member
@@ -26,6 +26,7 @@ from time import sleep
 
 from ..common.api.v1.imagemanagement.rest.stagingmanagement.stagingmanagement import \
     EpImageStage
+from ..common.backoff import backoff_interval
 from ..common.controller_version import ControllerVersion
 from ..common.exceptions import ControllerResponseError
 from ..common.properties import Properties
@@ -215,12 +216,45 @@ class ImageStage:
         msg += f"self.serial_numbers {self.serial_numbers}"
         self.log.debug(msg)
 
-        serial_numbers = copy.copy(self.serial_numbers)
         self.issu_detail.refresh()
-        for serial_number in serial_numbers:
+        self._prune_staged_serial_numbers()
+
+    def _prune_staged_serial_numbers(self) -> None:
+        """
+        Remove the serial numbers for which "imageStaged" is "Success",
+        using the switch issu details as last refreshed.
+        """
+        staged = set()
+        for serial_number in self.serial_numbers:
             self.issu_detail.filter = serial_number
             if self.issu_detail.image_staged == "Success":
-                self.serial_numbers.remove(serial_number)
+                staged.add(serial_number)
+        # Prune in place, so callers holding the list see the result
+        self.serial_numbers[:] = [
+            serial_number
+            for serial_number in self.serial_numbers
+            if serial_number not in staged
+        ]
+
+    def _prune_and_validate(self) -> None:
+        """
+        ### Summary
+        Refresh the switch issu details once, then prune and validate
+        ``serial_numbers`` against them.
+
+        ### Raises
+        -   ``ControllerResponseError`` if:
+                -   "imageStaged" is "Failed" for any serial_number.
+        """
+        method_name = inspect.stack()[0][3]
+
+        msg = f"ENTERED {self.class_name}.{method_name}: "
+        msg += f"self.serial_numbers: {self.serial_numbers}"
+        self.log.debug(msg)
+
+        self.issu_detail.refresh()
+        self._prune_staged_serial_numbers()
+        self._validate_staged_serial_numbers()
 
     def register_unchanged_result(self, response_message) -> None:
         """
@@ -260,11 +294,17 @@ class ImageStage:
         self.log.debug(msg)
 
         self.issu_detail.refresh()
+        self._validate_staged_serial_numbers()
+
+    def _validate_staged_serial_numbers(self) -> None:
+        """
+        Raise ``ControllerResponseError`` if "imageStaged" is "Failed" for
+        any serial number, using the switch issu details as last refreshed.
+        """
         for serial_number in self.serial_numbers:
             self.issu_detail.filter = serial_number
 
             if self.issu_detail.image_staged == "Failed":
-                msg = f"{self.class_name}.{method_name}: "
                 msg = "Image staging is failing for the following switch: "
                 msg += f"{self.issu_detail.device_name}, "
                 msg += f"{self.issu_detail.ip_address}, "
@@ -353,8 +393,7 @@ class ImageStage:
         # We don't want the results to show up in the user's result output.
         self.issu_detail.results = Results()
 
-        self.prune_serial_numbers()
-        self.validate_serial_numbers()
+        self._prune_and_validate()
         self.wait_for_controller()
         self.build_payload()
 
@@ -418,7 +457,7 @@ class ImageStage:
 
         ### Raises
         -   ValueError: if:
-                -   ``items`` is not a set.
+                -   ``items`` is not iterable.
                 -   ``item_type`` is not a valid item type.
                 -   The action times out.
         """
@@ -428,7 +467,7 @@ class ImageStage:
         self.log.debug(msg)
 
         try:
-            self.wait_for_controller_done.items = set(copy.copy(self.serial_numbers))
+            self.wait_for_controller_done.items = self.serial_numbers
             self.wait_for_controller_done.item_type = "serial_number"
             self.wait_for_controller_done.rest_send = (
                 self.rest_send  # pylint: disable=no-member
@@ -458,12 +497,12 @@ class ImageStage:
 
         self.serial_numbers_done = set()
         timeout = self.check_timeout
-        self.serial_numbers_todo = set(copy.copy(self.serial_numbers))
+        self.serial_numbers_todo = set(self.serial_numbers)
 
+        check_interval = self.check_interval
+        unit_test = self.rest_send.unit_test  # pylint: disable=no-member
+        attempt = 0
         while self.serial_numbers_done != self.serial_numbers_todo and timeout > 0:
-            if self.rest_send.unit_test is False:  # pylint: disable=no-member
-                sleep(self.check_interval)
-            timeout -= self.check_interval
             self.issu_detail.refresh()
 
             for serial_number in self.serial_numbers:
@@ -471,19 +510,20 @@ class ImageStage:
                     continue
 
                 self.issu_detail.filter = serial_number
-                ip_address = self.issu_detail.ip_address
-                device_name = self.issu_detail.device_name
-                staged_percent = self.issu_detail.image_staged_percent
                 staged_status = self.issu_detail.image_staged
 
+                if staged_status == "Success":
+                    self.serial_numbers_done.add(serial_number)
+                    continue
                 if staged_status == "Failed":
+                    ip_address = self.issu_detail.ip_address
+                    device_name = self.issu_detail.device_name
+                    staged_percent = self.issu_detail.image_staged_percent
                     msg = f"{self.class_name}.{method_name}: "
                     msg += f"Seconds remaining {timeout}: stage image failed "
                     msg += f"for {device_name}, {serial_number}, {ip_address}. "
                     msg += f"image staged percent: {staged_percent}"
                     raise ValueError(msg)
-                if staged_status == "Success":
-                    self.serial_numbers_done.add(serial_number)
 
             msg = f"seconds remaining {timeout}"
             self.log.debug(msg)
@@ -492,6 +532,15 @@ class ImageStage:
             msg = f"serial_numbers_done: {sorted(self.serial_numbers_done)}"
             self.log.debug(msg)
 
+            if self.serial_numbers_done == self.serial_numbers_todo:
+                break
+            interval = check_interval
+            if unit_test is False:
+                interval = backoff_interval(attempt, check_interval)
+                sleep(interval)
+            attempt += 1
+            timeout -= interval
+
         if self.serial_numbers_done != self.serial_numbers_todo:
             msg = f"{self.class_name}.{method_name}: "
             msg += "Timed out waiting for image stage to complete. "
@@ -25,6 +25,7 @@ import logging
 from time import sleep
 
 from ..common.api.v1.imagemanagement.rest.imageupgrade.imageupgrade import EpUpgradeImage
+from ..common.backoff import backoff_interval
 from ..common.conversion import ConversionUtils
 from ..common.exceptions import ControllerResponseError
 from ..common.properties import Properties
@@ -671,7 +672,7 @@ class ImageUpgrade:
 
         ### Raises
         -   ValueError: if:
-                -   ``items`` is not a set.
+                -   ``items`` is not iterable.
                 -   ``item_type`` is not a valid item type.
                 -   The action times out.
         """
@@ -681,7 +682,7 @@ class ImageUpgrade:
         self.log.debug(msg)
 
         try:
-            self.wait_for_controller_done.items = set(copy.copy(self.ip_addresses))
+            self.wait_for_controller_done.items = self.ip_addresses
             self.wait_for_controller_done.item_type = "ipv4_address"
             self.wait_for_controller_done.rest_send = (
                 self.rest_send  # pylint: disable=no-member
@@ -709,16 +710,16 @@ class ImageUpgrade:
         msg = f"ENTERED: {self.class_name}.{method_name}."
         self.log.debug(msg)
 
-        self.ipv4_todo = set(copy.copy(self.ip_addresses))
+        self.ipv4_todo = set(self.ip_addresses)
         if self.rest_send.unit_test is False:  # pylint: disable=no-member
             # See unit test test_image_upgrade_upgrade_00240
             self.ipv4_done = set()
         timeout = self.check_timeout
 
+        check_interval = self.check_interval
+        unit_test = self.rest_send.unit_test  # pylint: disable=no-member
+        attempt = 0
         while self.ipv4_done != self.ipv4_todo and timeout > 0:
-            if self.rest_send.unit_test is False:  # pylint: disable=no-member
-                sleep(self.check_interval)
-            timeout -= self.check_interval
             self.issu_detail.refresh()
 
             for ipv4 in self.ip_addresses:
@@ -753,6 +754,15 @@ class ImageUpgrade:
             msg = f"ipv4_todo: {sorted(self.ipv4_todo)}"
             self.log.debug(msg)
 
+            if self.ipv4_done == self.ipv4_todo:
+                break
+            interval = check_interval
+            if unit_test is False:
+                interval = backoff_interval(attempt, check_interval)
+                sleep(interval)
+            attempt += 1
+            timeout -= interval
+
         if self.ipv4_done != self.ipv4_todo:
             msg = f"{self.class_name}.{method_name}: "
             msg += "The following device(s) did not complete upgrade: "
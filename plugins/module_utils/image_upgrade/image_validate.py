@@ -18,14 +18,13 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 __author__ = "Allen Robel"
 
-import copy
-import inspect
 import json
 import logging
 from time import sleep
 
 from ..common.api.v1.imagemanagement.rest.stagingmanagement.stagingmanagement import \
     EpImageValidate
+from ..common.backoff import backoff_interval
 from ..common.conversion import ConversionUtils
 from ..common.exceptions import ControllerResponseError
 from ..common.properties import Properties
@@ -88,15 +87,40 @@ class ImageValidate:
     validation status using ``SwitchIssuDetailsBySerialNumber``.
     """
 
+    __slots__ = (
+        "_check_interval",
+        "_check_timeout",
+        "_non_disruptive",
+        "_payload_key",
+        "_rest_send",
+        "_results",
+        "_serial_numbers",
+        "action",
+        "class_name",
+        "conversion",
+        "diff",
+        "ep_image_validate",
+        "issu_detail",
+        "log",
+        "payload",
+        "saved_response_current",
+        "saved_result_current",
+        "serial_numbers_done",
+        "serial_numbers_todo",
+        "wait_for_controller_done",
+    )
+
     def __init__(self):
         self.class_name = self.__class__.__name__
-        method_name = inspect.stack()[0][3]
+        method_name = "__init__"
 
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
 
         self.action = "image_validate"
         self.diff: dict = {}
         self.payload = None
+        # (serial_numbers, non_disruptive) that self.payload was built from
+        self._payload_key = None
         self.saved_response_current: dict = {}
         self.saved_result_current: dict = {}
         # _wait_for_image_validate_to_complete() populates these
@@ -126,7 +150,7 @@ class ImageValidate:
         ### Raises
         None
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "build_diff"
 
         msg = f"ENTERED {self.class_name}.{method_name}"
         self.log.debug(msg)
@@ -137,52 +161,88 @@ class ImageValidate:
             self.issu_detail.filter = serial_number
             ipv4 = self.issu_detail.ip_address
 
-            if ipv4 not in self.diff:
-                self.diff[ipv4] = {}
-
-            self.diff[ipv4]["action"] = self.action
-            self.diff[ipv4]["ip_address"] = self.issu_detail.ip_address
-            self.diff[ipv4]["logical_name"] = self.issu_detail.device_name
-            self.diff[ipv4]["policy_name"] = self.issu_detail.policy
-            self.diff[ipv4]["serial_number"] = serial_number
-            msg = f"{self.class_name}.{method_name}: "
-            msg += f"self.diff[{ipv4}]: "
-            msg += f"{json.dumps(self.diff[ipv4], indent=4)}"
-            self.log.debug(msg)
+            self.diff[ipv4] = {
+                "action": self.action,
+                "ip_address": ipv4,
+                "logical_name": self.issu_detail.device_name,
+                "policy_name": self.issu_detail.policy,
+                "serial_number": serial_number,
+            }
+            if self.log.isEnabledFor(logging.DEBUG):
+                msg = f"{self.class_name}.{method_name}: "
+                msg += f"self.diff[{ipv4}]: "
+                msg += f"{json.dumps(self.diff[ipv4], indent=4)}"
+                self.log.debug(msg)
 
     def build_payload(self) -> None:
         """
-        Build the payload for the image validation request
+        Build the payload for the image validation request.
+
+        The payload is reused if serial_numbers and non_disruptive
+        have not changed since it was last built.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "build_payload"
         msg = f"ENTERED {self.class_name}.{method_name}: "
         msg += f"self.serial_numbers: {self.serial_numbers}"
         self.log.debug(msg)
 
+        payload_key = (tuple(self.serial_numbers), self.non_disruptive)
+        if self.payload is not None and payload_key == self._payload_key:
+            return
+        self._payload_key = payload_key
+
         self.payload = {}
         self.payload["serialNum"] = self.serial_numbers
         self.payload["nonDisruptive"] = self.non_disruptive
 
-    def prune_serial_numbers(self) -> None:
+    def _prune_and_validate(self) -> bool:
         """
-        If the image is already validated on a switch, remove that switch's
-        serial number from the list of serial numbers to validate.
+        ### Summary
+        Refresh the switch issu details once, then make a single pass
+        over ``serial_numbers``.
+
+        -   Remove serial numbers for which "validated" is "Success".
+        -   Fail if "validated" is "Failed" for any serial number.
+        -   Return True if any remaining switch has actions in progress,
+            so that ``commit()`` can skip ``wait_for_controller()``
+            when the switches are already idle.
+
+        ### Raises
+        -   ``ControllerResponseError`` if:
+                -   "validated" is "Failed" for any serial_number.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "_prune_and_validate"
 
-        msg = f"ENTERED: {self.class_name}.{method_name}: "
-        msg += f"self.serial_numbers {self.serial_numbers}"
+        msg = f"ENTERED {self.class_name}.{method_name}: "
+        msg += f"self.serial_numbers: {self.serial_numbers}"
         self.log.debug(msg)
 
         self.issu_detail.refresh()
-        serial_numbers = copy.copy(self.serial_numbers)
-        for serial_number in serial_numbers:
+        actions_in_progress = False
+        keep = []
+        for serial_number in self.serial_numbers:
             self.issu_detail.filter = serial_number
-            if self.issu_detail.validated == "Success":
-                self.serial_numbers.remove(self.issu_detail.serial_number)
+            validated = self.issu_detail.validated
+            if validated == "Success":
+                continue
+            if validated == "Failed":
+                msg = f"{self.class_name}.{method_name}: "
+                msg += "image validation is failing for the following switch: "
+                msg += f"{self.issu_detail.device_name}, "
+                msg += f"{self.issu_detail.ip_address}, "
+                msg += f"{self.issu_detail.serial_number}. "
+                msg += "If this persists, check the switch connectivity to "
+                msg += "the controller and try again."
+                raise ControllerResponseError(msg)
+            keep.append(serial_number)
+            if not actions_in_progress:
+                actions_in_progress = self.issu_detail.actions_in_progress
+        self.serial_numbers[:] = keep
 
-        msg = f"DONE: self.serial_numbers {self.serial_numbers}"
+        msg = f"DONE: self.serial_numbers {self.serial_numbers}, "
+        msg += f"actions_in_progress {actions_in_progress}"
         self.log.debug(msg)
+        return actions_in_progress
 
     def register_unchanged_result(self, response_message) -> None:
         """
@@ -190,7 +250,7 @@ class ImageValidate:
         Register a successful unchanged result with the results object.
         """
         # pylint: disable=no-member
-        method_name = inspect.stack()[0][3]
+        method_name = "register_unchanged_result"
 
         msg = f"ENTERED {self.class_name}().{method_name}"
         self.log.debug(msg)
@@ -202,34 +262,6 @@ class ImageValidate:
         self.results.response_data = {"response": response_message}
         self.results.register_task_result()
 
-    def validate_serial_numbers(self) -> None:
-        """
-        ### Summary
-        Fail if "validated" is "Failed" for any serial number.
-
-        ### Raises
-        -   ``ControllerResponseError`` if:
-                -   "validated" is "Failed" for any serial_number.
-        """
-        method_name = inspect.stack()[0][3]
-
-        msg = f"ENTERED {self.class_name}.{method_name}: "
-        msg += f"self.serial_numbers: {self.serial_numbers}"
-        self.log.debug(msg)
-
-        self.issu_detail.refresh()
-        for serial_number in self.serial_numbers:
-            self.issu_detail.filter = serial_number
-            if self.issu_detail.validated == "Failed":
-                msg = f"{self.class_name}.{method_name}: "
-                msg += "image validation is failing for the following switch: "
-                msg += f"{self.issu_detail.device_name}, "
-                msg += f"{self.issu_detail.ip_address}, "
-                msg += f"{self.issu_detail.serial_number}. "
-                msg += "If this persists, check the switch connectivity to "
-                msg += "the controller and try again."
-                raise ControllerResponseError(msg)
-
     def validate_commit_parameters(self) -> None:
         """
         ### Summary
@@ -241,7 +273,7 @@ class ImageValidate:
                 -   ``results`` is not set.
                 -   ``serial_numbers`` is not set.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "validate_commit_parameters"
         msg = f"ENTERED {self.class_name}.{method_name}"
         self.log.debug(msg)
 
@@ -274,7 +306,7 @@ class ImageValidate:
         -   ``ControllerResponseError`` if:
                 -   The controller response is unsuccessful.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "commit"
 
         msg = f"{self.class_name}.{method_name}: "
         msg += f"self.serial_numbers: {self.serial_numbers}"
@@ -293,9 +325,10 @@ class ImageValidate:
         # We don't want the results to show up in the user's result output.
         self.issu_detail.results = Results()
 
-        self.prune_serial_numbers()
-        self.validate_serial_numbers()
-        self.wait_for_controller()
+        # The issu details fetched by _prune_and_validate() tell us whether
+        # any switch is busy; if none are, skip the separate wait loop.
+        if self._prune_and_validate():
+            self.wait_for_controller()
         self.build_payload()
 
         msg = f"{self.class_name}.{method_name}: "
@@ -311,10 +344,8 @@ class ImageValidate:
         except (TypeError, ValueError) as error:
             self.results.diff_current = {}
             self.results.action = self.action
-            self.results.response_current = copy.deepcopy(
-                self.rest_send.response_current
-            )
-            self.results.result_current = copy.deepcopy(self.rest_send.result_current)
+            self.results.response_current = self.rest_send.response_current
+            self.results.result_current = self.rest_send.result_current
             self.results.register_task_result()
             msg = f"{self.class_name}.{method_name}: "
             msg += "Error while sending request. "
@@ -324,10 +355,8 @@ class ImageValidate:
         if not self.rest_send.result_current["success"]:
             self.results.diff_current = {}
             self.results.action = self.action
-            self.results.response_current = copy.deepcopy(
-                self.rest_send.response_current
-            )
-            self.results.result_current = copy.deepcopy(self.rest_send.result_current)
+            self.results.response_current = self.rest_send.response_current
+            self.results.result_current = self.rest_send.result_current
             self.results.register_task_result()
             msg = f"{self.class_name}.{method_name}: "
             msg += "failed. "
@@ -338,17 +367,23 @@ class ImageValidate:
         # by _wait_for_image_validate_to_complete(), which needs to run
         # before we can build the diff, since the diff is based on the
         # serial_numbers_done set, which isn't populated until image
-        # validate is complete.
-        self.saved_response_current = copy.deepcopy(self.rest_send.response_current)
-        self.saved_result_current = copy.deepcopy(self.rest_send.result_current)
+        # validate is complete.  RestSend rebinds (rather than mutates)
+        # response_current and result_current on each request, and Results
+        # stores its own copy in register_task_result(), so keeping a
+        # reference is sufficient.
+        self.saved_response_current = self.rest_send.response_current
+        self.saved_result_current = self.rest_send.result_current
 
         self._wait_for_image_validate_to_complete()
 
         self.build_diff()
         self.results.action = self.action
-        self.results.diff_current = copy.deepcopy(self.diff)
-        self.results.response_current = copy.deepcopy(self.saved_response_current)
-        self.results.result_current = copy.deepcopy(self.saved_result_current)
+        # Results adds a sequence_number key to diff_current and stores a
+        # deep copy of it, so a shallow copy is enough to keep self.diff
+        # unchanged.
+        self.results.diff_current = dict(self.diff)
+        self.results.response_current = self.saved_response_current
+        self.results.result_current = self.saved_result_current
         self.results.register_task_result()
 
     def wait_for_controller(self):
@@ -358,17 +393,17 @@ class ImageValidate:
 
         ### Raises
         -   ValueError: if:
-                -   ``items`` is not a set.
+                -   ``items`` is not iterable.
                 -   ``item_type`` is not a valid item type.
                 -   The action times out.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "wait_for_controller"
 
         msg = f"ENTERED {self.class_name}().{method_name}"
         self.log.debug(msg)
 
         try:
-            self.wait_for_controller_done.items = set(copy.copy(self.serial_numbers))
+            self.wait_for_controller_done.items = self.serial_numbers
             self.wait_for_controller_done.item_type = "serial_number"
             self.wait_for_controller_done.rest_send = (
                 self.rest_send  # pylint: disable=no-member
@@ -389,19 +424,19 @@ class ImageValidate:
                 -   The image validation does not complete within the timeout.
                 -   The image validation fails.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "_wait_for_image_validate_to_complete"
 
         msg = f"ENTERED {self.class_name}.{method_name}"
         self.log.debug(msg)
 
         self.serial_numbers_done = set()
         timeout = self.check_timeout
-        self.serial_numbers_todo = set(copy.copy(self.serial_numbers))
+        self.serial_numbers_todo = set(self.serial_numbers)
 
+        check_interval = self.check_interval
+        unit_test = self.rest_send.unit_test  # pylint: disable=no-member
+        attempt = 0
         while self.serial_numbers_done != self.serial_numbers_todo and timeout > 0:
-            if self.rest_send.unit_test is False:  # pylint: disable=no-member
-                sleep(self.check_interval)
-            timeout -= self.check_interval
             self.issu_detail.refresh()
 
             for serial_number in self.serial_numbers:
@@ -409,13 +444,16 @@ class ImageValidate:
                     continue
 
                 self.issu_detail.filter = serial_number
-
-                ip_address = self.issu_detail.ip_address
-                device_name = self.issu_detail.device_name
-                validated_percent = self.issu_detail.validated_percent
                 validated_status = self.issu_detail.validated
 
+                if validated_status == "Success":
+                    self.serial_numbers_done.add(serial_number)
+                    continue
                 if validated_status == "Failed":
+                    # Only needed for the error message.
+                    ip_address = self.issu_detail.ip_address
+                    device_name = self.issu_detail.device_name
+                    validated_percent = self.issu_detail.validated_percent
                     msg = f"{self.class_name}.{method_name}: "
                     msg = f"Seconds remaining {timeout}: validate image "
                     msg += f"{validated_status} for "
@@ -427,21 +465,31 @@ class ImageValidate:
                     msg += "Devices > View Details > Validate on the "
                     msg += "controller GUI for more details."
                     raise ValueError(msg)
-                if validated_status == "Success":
-                    self.serial_numbers_done.add(serial_number)
 
-            msg = f"seconds remaining {timeout}"
-            self.log.debug(msg)
-            msg = f"serial_numbers_todo: {sorted(self.serial_numbers_todo)}"
-            self.log.debug(msg)
-            msg = f"serial_numbers_done: {sorted(self.serial_numbers_done)}"
+            if self.log.isEnabledFor(logging.DEBUG):
+                self.log.debug("seconds remaining %s", timeout)
+                self.log.debug(
+                    "serial_numbers_todo: %s", sorted(self.serial_numbers_todo)
+                )
+                self.log.debug(
+                    "serial_numbers_done: %s", sorted(self.serial_numbers_done)
+                )
+
+            if self.serial_numbers_done == self.serial_numbers_todo:
+                break
+            interval = check_interval
+            if unit_test is False:
+                interval = backoff_interval(attempt, check_interval)
+                sleep(interval)
+            attempt += 1
+            timeout -= interval
+
+        if self.log.isEnabledFor(logging.DEBUG):
+            msg = f"{self.class_name}.{method_name}: "
+            msg += "Completed. "
+            msg += f"serial_numbers_done: {sorted(self.serial_numbers_done)}."
             self.log.debug(msg)
 
-        msg = f"{self.class_name}.{method_name}: "
-        msg += "Completed. "
-        msg += f"serial_numbers_done: {sorted(self.serial_numbers_done)}."
-        self.log.debug(msg)
-
         if self.serial_numbers_done != self.serial_numbers_todo:
             msg = f"{self.class_name}.{method_name}: "
             msg += "Timed out waiting for image validation to complete. "
@@ -451,6 +499,27 @@ class ImageValidate:
             msg += f"{','.join(sorted(self.serial_numbers_todo))}"
             raise ValueError(msg)
 
+    def _verify_non_negative_int(self, method_name, value) -> None:
+        """
+        ### Summary
+        Verify that value is an integer greater than or equal to zero.
+
+        ### Raises
+        -   ``TypeError`` if value is not an integer (bool included).
+        -   ``ValueError`` if value is less than zero.
+        """
+        # isinstance(True, int) is True so we need to exclude bool explicitly
+        if not isinstance(value, bool) and isinstance(value, int):
+            if value >= 0:
+                return
+            error = ValueError
+        else:
+            error = TypeError
+        msg = f"{self.class_name}.{method_name}: "
+        msg += "must be a positive integer or zero. "
+        msg += f"Got value {value} of type {type(value)}."
+        raise error(msg)
+
     @property
     def response_data(self) -> dict:
         """
@@ -479,7 +548,7 @@ class ImageValidate:
 
     @serial_numbers.setter
     def serial_numbers(self, value) -> None:
-        method_name = inspect.stack()[0][3]
+        method_name = "serial_numbers"
         if not isinstance(value, list):
             msg = f"{self.class_name}.{method_name}: "
             msg += "must be a python list of switch serial numbers."
@@ -504,7 +573,7 @@ class ImageValidate:
 
     @non_disruptive.setter
     def non_disruptive(self, value) -> None:
-        method_name = inspect.stack()[0][3]
+        method_name = "non_disruptive"
 
         value = self.conversion.make_boolean(value)
         if not isinstance(value, bool):
@@ -529,17 +598,7 @@ class ImageValidate:
 
     @check_interval.setter
     def check_interval(self, value) -> None:
-        method_name = inspect.stack()[0][3]
-        msg = f"{self.class_name}.{method_name}: "
-        msg += "must be a positive integer or zero. "
-        msg += f"Got value {value} of type {type(value)}."
-        # isinstance(True, int) is True so we need to check for bool first
-        if isinstance(value, bool):
-            raise TypeError(msg)
-        if not isinstance(value, int):
-            raise TypeError(msg)
-        if value < 0:
-            raise ValueError(msg)
+        self._verify_non_negative_int("check_interval", value)
         self._check_interval = value
 
     @property
@@ -556,15 +615,5 @@ class ImageValidate:
 
     @check_timeout.setter
     def check_timeout(self, value) -> None:
-        method_name = inspect.stack()[0][3]
-        msg = f"{self.class_name}.{method_name}: "
-        msg += "must be a positive integer or zero. "
-        msg += f"Got value {value} of type {type(value)}."
-        # isinstance(True, int) is True so we need to check for bool first
-        if isinstance(value, bool):
-            raise TypeError(msg)
-        if not isinstance(value, int):
-            raise TypeError(msg)
-        if value < 0:
-            raise ValueError(msg)
+        self._verify_non_negative_int("check_timeout", value)
         self._check_timeout = value
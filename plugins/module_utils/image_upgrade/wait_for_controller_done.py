@@ -18,11 +18,10 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 __author__ = "Allen Robel"
 
-import copy
-import inspect
 import logging
 from time import sleep
 
+from ..common.backoff import backoff_interval
 from ..common.properties import Properties
 from ..common.results import Results
 from .switch_issu_details import (
@@ -43,14 +42,34 @@ class WaitForControllerDone:
     ### Raises
     -   ``ValueError`` if:
             - Controller actions do not complete within ``rest_send.timeout`` seconds.
-            - ``items`` is not a set prior to calling ``commit()``.
+            - ``items`` is not set prior to calling ``commit()``.
             - ``item_type`` is not set prior to calling ``commit()``.
             - ``rest_send`` is not set prior to calling ``commit()``.
     """
 
+    __slots__ = (
+        "_issu_details_cache",
+        "_item_type",
+        "_items",
+        "_rest_send",
+        "_valid_item_types",
+        "action",
+        "class_name",
+        "done",
+        "issu_details",
+        "log",
+        "todo",
+    )
+
+    _filter_classes = {
+        "device_name": SwitchIssuDetailsByDeviceName,
+        "ipv4_address": SwitchIssuDetailsByIpAddress,
+        "serial_number": SwitchIssuDetailsBySerialNumber,
+    }
+
     def __init__(self):
         self.class_name = self.__class__.__name__
-        method_name = inspect.stack()[0][3]
+        method_name = "__init__"
 
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
 
@@ -59,6 +78,7 @@ class WaitForControllerDone:
         self.todo = set()
         self.issu_details = None
 
+        self._issu_details_cache = {}
         self._items = None
         self._item_type = None
         self._rest_send = None
@@ -74,16 +94,17 @@ class WaitForControllerDone:
         ``item_type``.
 
         The subclass is used to filter the issu_details controller data
-        by item_type.
+        by item_type.  One instance per item_type is created and reused
+        across calls to ``commit()``.
 
         ### Raises
         None
         """
-        _select = {}
-        _select["device_name"] = SwitchIssuDetailsByDeviceName
-        _select["ipv4_address"] = SwitchIssuDetailsByIpAddress
-        _select["serial_number"] = SwitchIssuDetailsBySerialNumber
-        self.issu_details = _select[self.item_type]()
+        issu_details = self._issu_details_cache.get(self.item_type)
+        if issu_details is None:
+            issu_details = self._filter_classes[self.item_type]()
+            self._issu_details_cache[self.item_type] = issu_details
+        self.issu_details = issu_details
         self.issu_details.rest_send = self.rest_send  # pylint: disable=no-member
         self.issu_details.results = Results()
         self.issu_details.results.action = self.action
@@ -99,7 +120,7 @@ class WaitForControllerDone:
                 - ``item_type`` is not set.
                 - ``rest_send`` is not set.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "verify_commit_parameters"
         msg = f"{self.class_name}.{method_name}: "
 
         if self.items is None:
@@ -127,35 +148,43 @@ class WaitForControllerDone:
         ### Raises
         -   ``ValueError`` if:
                 -   Actions do not complete within ``rest_send.timeout`` seconds.
-                -   ``items`` is not a set.
+                -   ``items`` is not iterable.
                 -   ``item_type`` is not set.
                 -   ``rest_send`` is not set.
         """
         # pylint: disable=no-member
-        method_name = inspect.stack()[0][3]
+        method_name = "commit"
 
         self.verify_commit_parameters()
 
         if len(self.items) == 0:
             return
         self.get_filter_class()
-        self.todo = copy.copy(self.items)
+        self.todo = self.items
         timeout = self.rest_send.timeout
 
+        send_interval = self.rest_send.send_interval
+        unit_test = self.rest_send.unit_test  # pylint: disable=no-member
+        attempt = 0
         while self.done != self.todo and timeout > 0:
-            if self.rest_send.unit_test is False:  # pylint: disable=no-member
-                sleep(self.rest_send.send_interval)
-            timeout -= self.rest_send.send_interval
-
             self.issu_details.refresh()
 
-            for item in self.todo:
-                if item in self.done:
-                    continue
+            for item in self.todo - self.done:
                 self.issu_details.filter = item
                 if self.issu_details.actions_in_progress is False:
                     self.done.add(item)
 
+            # Check before sleeping, so that we don't wait a full
+            # interval when the controller has already finished.
+            if self.done == self.todo:
+                break
+            interval = send_interval
+            if unit_test is False:
+                interval = backoff_interval(attempt, send_interval)
+                sleep(interval)
+            attempt += 1
+            timeout -= interval
+
         if self.done != self.todo:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"Timed out after {self.rest_send.timeout} seconds "
@@ -170,23 +199,36 @@ class WaitForControllerDone:
     def items(self):
         """
         ### Summary
-        A set of serial_number, ipv4_address, or device_name to wait for.
+        The serial_number, ipv4_address, or device_name items to wait for.
+
+        Any iterable (e.g. ``list`` or ``set``) is accepted and stored
+        as a ``frozenset``.
 
         ### Raises
-        ValueError: If ``items`` is not a set.
+        TypeError: If ``items`` is a string or is not iterable.
 
         ### Example
         ```python
-        instance.items = {"192.168.1.1", "192.168.1.2"}
+        instance.items = ["192.168.1.1", "192.168.1.2"]
         ```
         """
         return self._items
 
     @items.setter
     def items(self, value):
-        if not isinstance(value, set):
-            raise TypeError("items must be a set")
-        self._items = value
+        method_name = "items"
+        if isinstance(value, (str, bytes)):
+            msg = f"{self.class_name}.{method_name}: "
+            msg += "items must be an iterable of items, not a string. "
+            msg += f"Got {value}."
+            raise TypeError(msg)
+        try:
+            self._items = frozenset(value)
+        except TypeError as error:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += "items must be an iterable of items. "
+            msg += f"Got type {type(value).__name__}."
+            raise TypeError(msg) from error
 
     @property
     def item_type(self):
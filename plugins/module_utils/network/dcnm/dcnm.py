@@ -486,7 +486,7 @@ def parse_response(response):
     return False, False
 
 
-def dcnm_get_url(module, fabric, path, items, module_name):
+def dcnm_get_url(module, fabric, path, items, module_name, fail_on_error=True):
     """
     Query DCNM/NDFC and return query values.
     Some queries like network/vrf queries send thier names
@@ -499,6 +499,9 @@ def dcnm_get_url(module, fabric, path, items, module_name):
         path: String representing the path to query
         items: String representing query items
         module_name: String representing the name of calling module
+        fail_on_error: Fail the module if a query is not answered with
+            an OK response. If False, the DATA of such queries is left
+            out of the consolidated response instead.
 
     Returns:
         dict: Response DATA from DCNM/NDFC
@@ -519,6 +522,7 @@ def dcnm_get_url(module, fabric, path, items, module_name):
 
     itemlist = items.split(",")
 
+    attach_objects = None
     iter = 0
     while iter < send_count:
         if send_count == 1:
@@ -542,6 +546,10 @@ def dcnm_get_url(module, fabric, path, items, module_name):
 
         missing_fabric, not_ok = parse_response(att_objects)
 
+        if (missing_fabric or not_ok) and not fail_on_error:
+            iter += 1
+            continue
+
         if missing_fabric or not_ok:
             msg1 = "Fabric {0} not present on DCNM".format(fabric)
             msg2 = "Unable to find " "{0}: {1} under fabric: {2}".format(
@@ -551,13 +559,16 @@ def dcnm_get_url(module, fabric, path, items, module_name):
             module.fail_json(msg=msg1 if missing_fabric else msg2)
             return
 
-        if iter == 0:
+        if attach_objects is None:
             attach_objects = att_objects
         else:
             attach_objects["DATA"].extend(att_objects["DATA"])
 
         iter += 1
 
+    if attach_objects is None:
+        attach_objects = {"DATA": []}
+
     return attach_objects
 
 
@@ -480,8 +480,17 @@ from ansible_collections.cisco.dcnm.plugins.module_utils.network.dcnm.dcnm impor
     dcnm_version_supported,
     dcnm_get_url,
 )
+from ansible_collections.cisco.dcnm.plugins.module_utils.common.backoff import (
+    backoff_interval,
+)
+from ansible_collections.cisco.dcnm.plugins.module_utils.common.json_decode import (
+    json_loads,
+)
 from ansible.module_utils.basic import AnsibleModule
 
+# Matches the "switch(port)" entries of attachment portNames with tor ports
+TOR_PORT_NAMES_RE = re.compile(r"\S+\(\S+\d+\/\d+\)")
+
 
 class DcnmNetwork:
 
@@ -506,11 +515,30 @@ class DcnmNetwork:
         },
     }
 
+    # Fields of the controller attachments which are not part of the attach payload
+    have_attach_skip_keys = frozenset(
+        (
+            "vlanId",
+            "switchSerialNo",
+            "switchName",
+            "switchRole",
+            "ipAddress",
+            "lanAttachState",
+            "isLanAttached",
+            "fabricName",
+            "portNames",
+            "switchDbId",
+            "networkId",
+            "displayName",
+            "interfaceGroups",
+        )
+    )
+
     def __init__(self, module):
         self.module = module
         self.params = module.params
         self.fabric = module.params["fabric"]
-        self.config = copy.deepcopy(module.params.get("config"))
+        self.config = module.params.get("config")
         self.check_mode = False
         self.have_create = []
         self.want_create = []
@@ -555,6 +583,10 @@ class DcnmNetwork:
 
         self.failed_to_rollback = False
         self.WAIT_TIME_FOR_DELETE_LOOP = 5  # in seconds
+        # Total time and the longest single wait, in seconds, when retrying
+        # attachments which collide with a network update in progress
+        self.UPDATE_IN_PROGRESS_TIMEOUT = 50
+        self.UPDATE_IN_PROGRESS_MAX_INTERVAL = 8
 
     def diff_for_attach_deploy(self, want_a, have_a, replace=False):
 
@@ -563,207 +595,203 @@ class DcnmNetwork:
         if not want_a:
             return attach_list
 
+        have_by_serial = {}
+        for have in have_a or []:
+            have_by_serial.setdefault(have["serialNumber"], have)
+
         dep_net = False
         for want in want_a:
-            found = False
-            if have_a:
-                for have in have_a:
-                    if want["serialNumber"] == have["serialNumber"]:
-                        found = True
-
-                        if want.get("isAttached") is not None:
-                            if bool(have["isAttached"]) and bool(want["isAttached"]):
-                                torports_configured = False
-
-                                # Handle tor ports first if configured.
-                                if want.get("torports"):
-                                    for tor_w in want["torports"]:
-                                        torports_present = False
-                                        if have.get("torports"):
-                                            for tor_h in have["torports"]:
-                                                if tor_w["switch"] == tor_h["switch"]:
-                                                    atch_tor_ports = []
-                                                    torports_present = True
-                                                    h_tor_ports = (
-                                                        tor_h["torPorts"].split(",")
-                                                        if tor_h["torPorts"]
-                                                        else []
-                                                    )
-                                                    w_tor_ports = (
-                                                        tor_w["torPorts"].split(",")
-                                                        if tor_w["torPorts"]
-                                                        else []
-                                                    )
-
-                                                    if sorted(h_tor_ports) != sorted(w_tor_ports):
-                                                        atch_tor_ports = list(
-                                                            set(w_tor_ports) - set(h_tor_ports)
-                                                        )
-
-                                                    if replace:
-                                                        atch_tor_ports = w_tor_ports
-                                                    else:
-                                                        atch_tor_ports.extend(h_tor_ports)
-
-                                                    torconfig = tor_w["switch"] + "(" + ",".join(atch_tor_ports) + ")"
-                                                    want.update({"torPorts": torconfig})
-                                                    # Update torports_configured to True. If there is no other config change for attach
-                                                    # We will still append this attach to attach_list as there is tor port change
-                                                    if sorted(atch_tor_ports) != sorted(h_tor_ports):
-                                                        torports_configured = True
-
-                                        if not torports_present:
-                                            torconfig = tor_w["switch"] + "(" + tor_w["torPorts"] + ")"
-                                            want.update({"torPorts": torconfig})
-                                            # Update torports_configured to True. If there is no other config change for attach
-                                            # We will still append this attach to attach_list as there is tor port change
-                                            torports_configured = True
-
-                                    if have.get("torports"):
-                                        del have["torports"]
-
-                                elif have.get("torports"):
-                                    if replace:
-                                        # There are tor ports configured, but it has to be removed as want tor ports are not present
-                                        # and state is replaced/overridden. Update torports_configured to True to remove tor ports
-                                        want.update({"torPorts": ""})
-                                        torports_configured = True
-
-                                    else:
-                                        # Dont update torports_configured to True.
-                                        # If at all there is any other config change, this attach to will be appended attach_list there
-                                        for tor_h in have.get("torports"):
-                                            torconfig = tor_h["switch"] + "(" + tor_h["torPorts"] + ")"
-                                            want.update({"torPorts": torconfig})
-
-                                    del have["torports"]
-
-                                if want.get("torports"):
-                                    del want["torports"]
-
-                                h_sw_ports = (
-                                    have["switchPorts"].split(",")
-                                    if have["switchPorts"]
+            have = have_by_serial.get(want["serialNumber"])
+            if have is not None:
+
+                if want.get("isAttached") is not None:
+                    if bool(have["isAttached"]) and bool(want["isAttached"]):
+                        torports_configured = False
+
+                        # Handle tor ports first if configured.
+                        if want.get("torports"):
+                            h_tor_ports_by_switch = {
+                                tor_h["switch"]: (
+                                    tor_h["torPorts"].split(",")
+                                    if tor_h["torPorts"]
                                     else []
                                 )
-                                w_sw_ports = (
-                                    want["switchPorts"].split(",")
-                                    if want["switchPorts"]
+                                for tor_h in have.get("torports") or []
+                            }
+                            for tor_w in want["torports"]:
+                                h_tor_ports = h_tor_ports_by_switch.get(tor_w["switch"])
+                                if h_tor_ports is None:
+                                    torconfig = tor_w["switch"] + "(" + tor_w["torPorts"] + ")"
+                                    want.update({"torPorts": torconfig})
+                                    # Update torports_configured to True. If there is no other config change for attach
+                                    # We will still append this attach to attach_list as there is tor port change
+                                    torports_configured = True
+                                    continue
+
+                                w_tor_ports = (
+                                    tor_w["torPorts"].split(",")
+                                    if tor_w["torPorts"]
                                     else []
                                 )
 
-                                # This is needed to handle cases where vlan is updated after deploying the network
-                                # and attachments. This ensures that the attachments before vlan update will use previous
-                                # vlan id. All the active attachments on DCNM will have a vlan-id.
-                                if have.get("vlan"):
-                                    want["vlan"] = have.get("vlan")
-
-                                if sorted(h_sw_ports) != sorted(w_sw_ports):
-                                    atch_sw_ports = list(
-                                        set(w_sw_ports) - set(h_sw_ports)
-                                    )
-
-                                    # Adding some logic which is needed for replace and override.
-                                    if replace:
-                                        dtach_sw_ports = list(
-                                            set(h_sw_ports) - set(w_sw_ports)
-                                        )
+                                # Keep the port order of the playbook and of the controller
+                                # so the generated torPorts string is stable.
+                                h_tor_ports_set = set(h_tor_ports)
+                                if replace:
+                                    atch_tor_ports = w_tor_ports
+                                else:
+                                    atch_tor_ports = [
+                                        port for port in w_tor_ports if port not in h_tor_ports_set
+                                    ] + h_tor_ports
+
+                                torconfig = tor_w["switch"] + "(" + ",".join(atch_tor_ports) + ")"
+                                want.update({"torPorts": torconfig})
+                                # Update torports_configured to True. If there is no other config change for attach
+                                # We will still append this attach to attach_list as there is tor port change
+                                if set(atch_tor_ports) != h_tor_ports_set:
+                                    torports_configured = True
+
+                            if have.get("torports"):
+                                del have["torports"]
+
+                        elif have.get("torports"):
+                            if replace:
+                                # There are tor ports configured, but it has to be removed as want tor ports are not present
+                                # and state is replaced/overridden. Update torports_configured to True to remove tor ports
+                                want.update({"torPorts": ""})
+                                torports_configured = True
 
-                                        if not atch_sw_ports and not dtach_sw_ports:
-                                            if torports_configured:
-                                                del want["isAttached"]
-                                                attach_list.append(want)
-                                                if bool(want["is_deploy"]):
-                                                    dep_net = True
-
-                                            continue
-
-                                        want.update(
-                                            {
-                                                "switchPorts": ",".join(atch_sw_ports)
-                                                if atch_sw_ports
-                                                else ""
-                                            }
-                                        )
-                                        want.update(
-                                            {
-                                                "detachSwitchPorts": ",".join(
-                                                    dtach_sw_ports
-                                                )
-                                                if dtach_sw_ports
-                                                else ""
-                                            }
-                                        )
+                            else:
+                                # Dont update torports_configured to True.
+                                # If at all there is any other config change, this attach to will be appended attach_list there
+                                for tor_h in have.get("torports"):
+                                    torconfig = tor_h["switch"] + "(" + tor_h["torPorts"] + ")"
+                                    want.update({"torPorts": torconfig})
+
+                            del have["torports"]
 
+                        if want.get("torports"):
+                            del want["torports"]
+
+                        h_sw_ports = (
+                            set(have["switchPorts"].split(","))
+                            if have["switchPorts"]
+                            else set()
+                        )
+                        w_sw_ports = (
+                            set(want["switchPorts"].split(","))
+                            if want["switchPorts"]
+                            else set()
+                        )
+
+                        # This is needed to handle cases where vlan is updated after deploying the network
+                        # and attachments. This ensures that the attachments before vlan update will use previous
+                        # vlan id. All the active attachments on DCNM will have a vlan-id.
+                        if have.get("vlan"):
+                            want["vlan"] = have.get("vlan")
+
+                        if h_sw_ports != w_sw_ports:
+                            atch_sw_ports = w_sw_ports - h_sw_ports
+
+                            # Adding some logic which is needed for replace and override.
+                            if replace:
+                                dtach_sw_ports = h_sw_ports - w_sw_ports
+
+                                if not atch_sw_ports and not dtach_sw_ports:
+                                    if torports_configured:
                                         del want["isAttached"]
                                         attach_list.append(want)
                                         if bool(want["is_deploy"]):
                                             dep_net = True
 
-                                        continue
-
-                                    if not atch_sw_ports:
-                                        # The attachments in the have consist of attachments in want and more.
-                                        if torports_configured:
-                                            del want["isAttached"]
-                                            attach_list.append(want)
-                                            if bool(want["is_deploy"]):
-                                                dep_net = True
+                                    continue
 
-                                        continue
-                                    else:
-                                        want.update(
-                                            {"switchPorts": ",".join(atch_sw_ports)}
+                                want.update(
+                                    {
+                                        "switchPorts": ",".join(atch_sw_ports)
+                                        if atch_sw_ports
+                                        else ""
+                                    }
+                                )
+                                want.update(
+                                    {
+                                        "detachSwitchPorts": ",".join(
+                                            dtach_sw_ports
                                         )
+                                        if dtach_sw_ports
+                                        else ""
+                                    }
+                                )
 
-                                    del want["isAttached"]
-                                    attach_list.append(want)
-                                    if bool(want["is_deploy"]):
-                                        dep_net = True
-                                    continue
+                                del want["isAttached"]
+                                attach_list.append(want)
+                                if bool(want["is_deploy"]):
+                                    dep_net = True
+
+                                continue
 
-                                elif torports_configured:
+                            if not atch_sw_ports:
+                                # The attachments in the have consist of attachments in want and more.
+                                if torports_configured:
                                     del want["isAttached"]
                                     attach_list.append(want)
                                     if bool(want["is_deploy"]):
                                         dep_net = True
-                                    continue
-
-                            if bool(have["isAttached"]) is not bool(want["isAttached"]):
-                                # When the attachment is to be detached and undeployed, ignore any changes
-                                # to the attach section in the want(i.e in the playbook).
 
-                                if not bool(want["isAttached"]):
-                                    del have["isAttached"]
-                                    have.update({"deployment": False})
-                                    attach_list.append(have)
-                                    if bool(want["is_deploy"]):
-                                        dep_net = True
-                                    continue
-                                del want["isAttached"]
-                                if want.get("torports"):
-                                    for tor_w in want["torports"]:
-                                        torconfig = tor_w["switch"] + "(" + tor_w["torPorts"] + ")"
-                                        want.update({"torPorts": torconfig})
-                                del want["torports"]
-                                want.update({"deployment": True})
-                                attach_list.append(want)
-                                if bool(want["is_deploy"]):
-                                    dep_net = True
                                 continue
+                            else:
+                                want.update(
+                                    {"switchPorts": ",".join(atch_sw_ports)}
+                                )
 
-                        if bool(have["deployment"]) is not bool(want["deployment"]):
-                            # We hit this section when attachment is successful, but, deployment is stuck in PENDING or
-                            # OUT-OF-SYNC. In such cases, we just add the object to deploy list only. have['deployment']
-                            # is set to False when deployment is PENDING or OUT-OF-SYNC - ref - get_have()
+                            del want["isAttached"]
+                            attach_list.append(want)
                             if bool(want["is_deploy"]):
                                 dep_net = True
+                            continue
 
-                        if bool(want.get("is_deploy")) is not bool(have.get("is_deploy")):
-                            if bool(want.get("is_deploy")):
+                        elif torports_configured:
+                            del want["isAttached"]
+                            attach_list.append(want)
+                            if bool(want["is_deploy"]):
                                 dep_net = True
+                            continue
 
-            if not found:
+                    if bool(have["isAttached"]) is not bool(want["isAttached"]):
+                        # When the attachment is to be detached and undeployed, ignore any changes
+                        # to the attach section in the want(i.e in the playbook).
+
+                        if not bool(want["isAttached"]):
+                            del have["isAttached"]
+                            have.update({"deployment": False})
+                            attach_list.append(have)
+                            if bool(want["is_deploy"]):
+                                dep_net = True
+                            continue
+                        del want["isAttached"]
+                        if want.get("torports"):
+                            for tor_w in want["torports"]:
+                                torconfig = tor_w["switch"] + "(" + tor_w["torPorts"] + ")"
+                                want.update({"torPorts": torconfig})
+                        del want["torports"]
+                        want.update({"deployment": True})
+                        attach_list.append(want)
+                        if bool(want["is_deploy"]):
+                            dep_net = True
+                        continue
+
+                if bool(have["deployment"]) is not bool(want["deployment"]):
+                    # We hit this section when attachment is successful, but, deployment is stuck in PENDING or
+                    # OUT-OF-SYNC. In such cases, we just add the object to deploy list only. have['deployment']
+                    # is set to False when deployment is PENDING or OUT-OF-SYNC - ref - get_have()
+                    if bool(want["is_deploy"]):
+                        dep_net = True
+
+                if bool(want.get("is_deploy")) is not bool(have.get("is_deploy")):
+                    if bool(want.get("is_deploy")):
+                        dep_net = True
+
+            else:
                 if bool(want["isAttached"]):
                     if want.get("torports"):
                         for tor_w in want["torports"]:
@@ -776,29 +804,27 @@ class DcnmNetwork:
                     if bool(want["is_deploy"]):
                         dep_net = True
 
+        sn_ip = {}
+        for ip, ser in self.ip_sn.items():
+            sn_ip.setdefault(ser, ip)
+        attach_serials = {attach["serialNumber"] for attach in attach_list}
+
         for attach in attach_list[:]:
-            for ip, ser in self.ip_sn.items():
-                if ser == attach["serialNumber"]:
-                    ip_addr = ip
-                    break
+            ip_addr = sn_ip[attach["serialNumber"]]
             is_vpc = self.inventory_data[ip_addr].get("isVpcConfigured")
             if is_vpc is True:
-                peer_found = False
                 peer_ser = self.inventory_data[ip_addr].get(
                     "peerSerialNumber"
                 )
-                for attch in attach_list:
-                    if peer_ser == attch["serialNumber"]:
-                        peer_found = True
-                if not peer_found:
-                    for hav in have_a:
-                        if hav["serialNumber"] == peer_ser:
-                            havtoattach = copy.deepcopy(hav)
-                            havtoattach.update({"switchPorts": ""})
-                            del havtoattach["isAttached"]
-                            havtoattach["deployment"] = True
-                            attach_list.append(havtoattach)
-                            break
+                if peer_ser not in attach_serials:
+                    hav = have_by_serial.get(peer_ser)
+                    if hav is not None:
+                        havtoattach = copy.deepcopy(hav)
+                        havtoattach.update({"switchPorts": ""})
+                        del havtoattach["isAttached"]
+                        havtoattach["deployment"] = True
+                        attach_list.append(havtoattach)
+                        attach_serials.add(peer_ser)
 
         # self.module.fail_json(msg="attach done")
 
@@ -832,25 +858,25 @@ class DcnmNetwork:
             )
             self.module.fail_json(msg=msg)
 
-        attach.update({"fabric": self.fabric})
-        attach.update({"networkName": net_name})
-        attach.update({"serialNumber": serial})
-        attach.update({"switchPorts": ",".join(attach["ports"])})
+        attach["fabric"] = self.fabric
+        attach["networkName"] = net_name
+        attach["serialNumber"] = serial
+        attach["switchPorts"] = ",".join(attach["ports"])
         attach.update(
             {"detachSwitchPorts": ""}
         )  # Is this supported??Need to handle correct
-        attach.update({"vlan": 0})
-        attach.update({"dot1QVlan": 0})
-        attach.update({"untagged": False})
+        attach["vlan"] = 0
+        attach["dot1QVlan"] = 0
+        attach["untagged"] = False
         # This flag is not to be confused for deploy of attachment.
         # "deployment" should be set True for attaching an attachment
         # and set to False for detaching an attachment
-        attach.update({"deployment": True})
-        attach.update({"isAttached": True})
-        attach.update({"extensionValues": ""})
-        attach.update({"instanceValues": ""})
-        attach.update({"freeformConfig": ""})
-        attach.update({"is_deploy": deploy})
+        attach["deployment"] = True
+        attach["isAttached"] = True
+        attach["extensionValues"] = ""
+        attach["instanceValues"] = ""
+        attach["freeformConfig"] = ""
+        attach["is_deploy"] = deploy
         if attach.get("tor_ports"):
             torports = {}
             if role.lower() != "leaf":
@@ -859,11 +885,11 @@ class DcnmNetwork:
                 )
                 self.module.fail_json(msg=msg)
             for tor in attach.get("tor_ports"):
-                torports.update({"switch": self.inventory_data[tor["ip_address"]].get("logicalName")})
-                torports.update({"torPorts": ",".join(tor["ports"])})
+                torports["switch"] = self.inventory_data[tor["ip_address"]].get("logicalName")
+                torports["torPorts"] = ",".join(tor["ports"])
                 torlist.append(torports)
             del attach["tor_ports"]
-        attach.update({"torports": torlist})
+        attach["torports"] = torlist
 
         if "deploy" in attach:
             del attach["deploy"]
@@ -925,8 +951,8 @@ class DcnmNetwork:
                 )
             )
 
-        json_to_dict_want = json.loads(want["networkTemplateConfig"])
-        json_to_dict_have = json.loads(have["networkTemplateConfig"])
+        json_to_dict_want = json_loads(want["networkTemplateConfig"])
+        json_to_dict_have = json_loads(have["networkTemplateConfig"])
 
         gw_ip_want = json_to_dict_want.get("gatewayIpAddress", "")
         gw_ip_have = json_to_dict_have.get("gatewayIpAddress", "")
@@ -1312,10 +1338,66 @@ class DcnmNetwork:
             if template_conf["VLAN_NETFLOW_MONITOR"] is None:
                 template_conf["VLAN_NETFLOW_MONITOR"] = ""
 
-        net_upd.update({"networkTemplateConfig": json.dumps(template_conf)})
+        net_upd["networkTemplateConfig"] = json.dumps(template_conf)
 
         return net_upd
 
+    def index_by_network_name(self, items):
+        """
+        Return a dict mapping networkName to the first item in items with
+        that networkName.  Used to replace repeated linear scans of the
+        have/want lists with a single dict lookup.
+        """
+        index = {}
+        for item in items:
+            index.setdefault(item["networkName"], item)
+        return index
+
+    def trim_have_net(self, net, json_to_dict):
+
+        # Keep only the template parameters managed by this module, and drop
+        # the fields that are not part of the network payload.
+        t_conf = {
+            "vlanId": json_to_dict.get("vlanId", ""),
+            "gatewayIpAddress": json_to_dict.get("gatewayIpAddress", ""),
+            "isLayer2Only": json_to_dict.get("isLayer2Only", False),
+            "tag": json_to_dict.get("tag", ""),
+            "vlanName": json_to_dict.get("vlanName", ""),
+            "intfDescription": json_to_dict.get("intfDescription", ""),
+            "mtu": json_to_dict.get("mtu", ""),
+            "suppressArp": json_to_dict.get("suppressArp", False),
+            "dhcpServerAddr1": json_to_dict.get("dhcpServerAddr1", ""),
+            "dhcpServerAddr2": json_to_dict.get("dhcpServerAddr2", ""),
+            "dhcpServerAddr3": json_to_dict.get("dhcpServerAddr3", ""),
+            "vrfDhcp": json_to_dict.get("vrfDhcp", ""),
+            "vrfDhcp2": json_to_dict.get("vrfDhcp2", ""),
+            "vrfDhcp3": json_to_dict.get("vrfDhcp3", ""),
+            "loopbackId": json_to_dict.get("loopbackId", ""),
+            "mcastGroup": json_to_dict.get("mcastGroup", ""),
+            "gatewayIpV6Address": json_to_dict.get("gatewayIpV6Address", ""),
+            "secondaryGW1": json_to_dict.get("secondaryGW1", ""),
+            "secondaryGW2": json_to_dict.get("secondaryGW2", ""),
+            "secondaryGW3": json_to_dict.get("secondaryGW3", ""),
+            "secondaryGW4": json_to_dict.get("secondaryGW4", ""),
+            "trmEnabled": json_to_dict.get("trmEnabled", False),
+            "rtBothAuto": json_to_dict.get("rtBothAuto", False),
+            "enableL3OnBorder": json_to_dict.get("enableL3OnBorder", False),
+        }
+
+        if self.dcnm_version > 11:
+            t_conf.update(ENABLE_NETFLOW=json_to_dict.get("ENABLE_NETFLOW", False))
+            t_conf.update(SVI_NETFLOW_MONITOR=json_to_dict.get("SVI_NETFLOW_MONITOR", ""))
+            t_conf.update(VLAN_NETFLOW_MONITOR=json_to_dict.get("VLAN_NETFLOW_MONITOR", ""))
+
+        have_net = {
+            key: value
+            for key, value in net.items()
+            if key not in ("displayName", "serviceNetworkTemplate", "source")
+        }
+        have_net["networkTemplateConfig"] = json.dumps(t_conf)
+
+        return have_net
+
     def get_have(self):
 
         have_create = []
@@ -1377,43 +1459,7 @@ class DcnmNetwork:
                 continue
 
             for net in networks_per_vrf["DATA"]:
-                json_to_dict = json.loads(net["networkTemplateConfig"])
-                t_conf = {
-                    "vlanId": json_to_dict.get("vlanId", ""),
-                    "gatewayIpAddress": json_to_dict.get("gatewayIpAddress", ""),
-                    "isLayer2Only": json_to_dict.get("isLayer2Only", False),
-                    "tag": json_to_dict.get("tag", ""),
-                    "vlanName": json_to_dict.get("vlanName", ""),
-                    "intfDescription": json_to_dict.get("intfDescription", ""),
-                    "mtu": json_to_dict.get("mtu", ""),
-                    "suppressArp": json_to_dict.get("suppressArp", False),
-                    "dhcpServerAddr1": json_to_dict.get("dhcpServerAddr1", ""),
-                    "dhcpServerAddr2": json_to_dict.get("dhcpServerAddr2", ""),
-                    "dhcpServerAddr3": json_to_dict.get("dhcpServerAddr3", ""),
-                    "vrfDhcp": json_to_dict.get("vrfDhcp", ""),
-                    "vrfDhcp2": json_to_dict.get("vrfDhcp2", ""),
-                    "vrfDhcp3": json_to_dict.get("vrfDhcp3", ""),
-                    "loopbackId": json_to_dict.get("loopbackId", ""),
-                    "mcastGroup": json_to_dict.get("mcastGroup", ""),
-                    "gatewayIpV6Address": json_to_dict.get("gatewayIpV6Address", ""),
-                    "secondaryGW1": json_to_dict.get("secondaryGW1", ""),
-                    "secondaryGW2": json_to_dict.get("secondaryGW2", ""),
-                    "secondaryGW3": json_to_dict.get("secondaryGW3", ""),
-                    "secondaryGW4": json_to_dict.get("secondaryGW4", ""),
-                    "trmEnabled": json_to_dict.get("trmEnabled", False),
-                    "rtBothAuto": json_to_dict.get("rtBothAuto", False),
-                    "enableL3OnBorder": json_to_dict.get("enableL3OnBorder", False),
-                }
-
-                if self.dcnm_version > 11:
-                    t_conf.update(ENABLE_NETFLOW=json_to_dict.get("ENABLE_NETFLOW", False))
-                    t_conf.update(SVI_NETFLOW_MONITOR=json_to_dict.get("SVI_NETFLOW_MONITOR", ""))
-                    t_conf.update(VLAN_NETFLOW_MONITOR=json_to_dict.get("VLAN_NETFLOW_MONITOR", ""))
-
-                net.update({"networkTemplateConfig": json.dumps(t_conf)})
-                del net["displayName"]
-                del net["serviceNetworkTemplate"]
-                del net["source"]
+                net = self.trim_have_net(net, json_loads(net["networkTemplateConfig"]))
 
                 curr_networks.append(net["networkName"])
 
@@ -1425,44 +1471,9 @@ class DcnmNetwork:
 
             if networks_per_navrf.get("DATA"):
                 for l2net in networks_per_navrf["DATA"]:
-                    json_to_dict = json.loads(l2net["networkTemplateConfig"])
+                    json_to_dict = json_loads(l2net["networkTemplateConfig"])
                     if (json_to_dict.get("vrfName", "")) == "NA":
-                        t_conf = {
-                            "vlanId": json_to_dict.get("vlanId", ""),
-                            "gatewayIpAddress": json_to_dict.get("gatewayIpAddress", ""),
-                            "isLayer2Only": json_to_dict.get("isLayer2Only", False),
-                            "tag": json_to_dict.get("tag", ""),
-                            "vlanName": json_to_dict.get("vlanName", ""),
-                            "intfDescription": json_to_dict.get("intfDescription", ""),
-                            "mtu": json_to_dict.get("mtu", ""),
-                            "suppressArp": json_to_dict.get("suppressArp", False),
-                            "dhcpServerAddr1": json_to_dict.get("dhcpServerAddr1", ""),
-                            "dhcpServerAddr2": json_to_dict.get("dhcpServerAddr2", ""),
-                            "dhcpServerAddr3": json_to_dict.get("dhcpServerAddr3", ""),
-                            "vrfDhcp": json_to_dict.get("vrfDhcp", ""),
-                            "vrfDhcp2": json_to_dict.get("vrfDhcp2", ""),
-                            "vrfDhcp3": json_to_dict.get("vrfDhcp3", ""),
-                            "loopbackId": json_to_dict.get("loopbackId", ""),
-                            "mcastGroup": json_to_dict.get("mcastGroup", ""),
-                            "gatewayIpV6Address": json_to_dict.get("gatewayIpV6Address", ""),
-                            "secondaryGW1": json_to_dict.get("secondaryGW1", ""),
-                            "secondaryGW2": json_to_dict.get("secondaryGW2", ""),
-                            "secondaryGW3": json_to_dict.get("secondaryGW3", ""),
-                            "secondaryGW4": json_to_dict.get("secondaryGW4", ""),
-                            "trmEnabled": json_to_dict.get("trmEnabled", False),
-                            "rtBothAuto": json_to_dict.get("rtBothAuto", False),
-                            "enableL3OnBorder": json_to_dict.get("enableL3OnBorder", False),
-                        }
-
-                        if self.dcnm_version > 11:
-                            t_conf.update(ENABLE_NETFLOW=json_to_dict.get("ENABLE_NETFLOW", False))
-                            t_conf.update(SVI_NETFLOW_MONITOR=json_to_dict.get("SVI_NETFLOW_MONITOR", ""))
-                            t_conf.update(VLAN_NETFLOW_MONITOR=json_to_dict.get("VLAN_NETFLOW_MONITOR", ""))
-
-                        l2net.update({"networkTemplateConfig": json.dumps(t_conf)})
-                        del l2net["displayName"]
-                        del l2net["serviceNetworkTemplate"]
-                        del l2net["source"]
+                        l2net = self.trim_have_net(l2net, json_to_dict)
 
                         curr_networks.append(l2net["networkName"])
 
@@ -1487,7 +1498,7 @@ class DcnmNetwork:
                 continue
             attach_list = net_attach["lanAttachList"]
             dep_net = ""
-            for attach in attach_list:
+            for attach_idx, attach in enumerate(attach_list):
                 torlist = []
                 attach_state = False if attach["lanAttachState"] == "NA" else True
                 deploy = attach["isLanAttached"]
@@ -1506,56 +1517,52 @@ class DcnmNetwork:
                 sn = attach["switchSerialNo"]
                 vlan = attach["vlanId"]
 
-                if attach["portNames"] and re.match(r"\S+\(\S+\d+\/\d+\)", attach["portNames"]):
-                    for idx, sw_list in enumerate(re.findall(r"\S+\(\S+\d+\/\d+\)", attach["portNames"])):
-                        torports = {}
-                        sw = sw_list.split("(")
-                        eth_list = sw[1].split(")")
+                # A single scan finds all the "switch(ports)" entries. They are only
+                # used when portNames starts with one.
+                tor_matches = (
+                    list(TOR_PORT_NAMES_RE.finditer(attach["portNames"]))
+                    if attach["portNames"]
+                    else []
+                )
+                if tor_matches and tor_matches[0].start() == 0:
+                    for idx, tor_match in enumerate(tor_matches):
+                        sw_name, _, sw_ports = tor_match.group().partition("(")
+                        sw_ports = sw_ports.partition(")")[0]
                         if idx == 0:
-                            ports = eth_list[0]
+                            ports = sw_ports
                             continue
-                        torports.update({"switch": sw[0]})
-                        torports.update({"torPorts": eth_list[0]})
-                        torlist.append(torports)
-                    attach.update({"torports": torlist})
+                        torlist.append({"switch": sw_name, "torPorts": sw_ports})
+                    attach["torports"] = torlist
                 else:
                     ports = attach["portNames"]
 
-                # The deletes and updates below are done to update the incoming dictionary format to
-                # match to what the outgoing payload requirements mandate.
+                # The incoming dictionary is converted to the format that the outgoing payload
+                # requirements mandate. The fields below are dropped, and the rest are set here.
                 # Ex: 'vlanId' in the attach section of incoming payload needs to be changed to 'vlan'
                 # on the attach section of outgoing payload.
-
-                del attach["vlanId"]
-                del attach["switchSerialNo"]
-                del attach["switchName"]
-                del attach["switchRole"]
-                del attach["ipAddress"]
-                del attach["lanAttachState"]
-                del attach["isLanAttached"]
-                del attach["fabricName"]
-                del attach["portNames"]
-                del attach["switchDbId"]
-                del attach["networkId"]
-
-                if "displayName" in attach.keys():
-                    del attach["displayName"]
-                if "interfaceGroups" in attach.keys():
-                    del attach["interfaceGroups"]
-
-                attach.update({"fabric": self.fabric})
-                attach.update({"vlan": vlan})
-                attach.update({"serialNumber": sn})
-                attach.update({"deployment": deploy})
-                attach.update({"extensionValues": ""})
-                attach.update({"instanceValues": ""})
-                attach.update({"freeformConfig": ""})
-                attach.update({"isAttached": attach_state})
-                attach.update({"dot1QVlan": 0})
-                attach.update({"detachSwitchPorts": ""})
-                attach.update({"switchPorts": ports})
-                attach.update({"untagged": False})
-                attach.update({"is_deploy": deployed})
+                attach = {
+                    key: value
+                    for key, value in attach.items()
+                    if key not in self.have_attach_skip_keys
+                }
+                attach.update(
+                    {
+                        "fabric": self.fabric,
+                        "vlan": vlan,
+                        "serialNumber": sn,
+                        "deployment": deploy,
+                        "extensionValues": "",
+                        "instanceValues": "",
+                        "freeformConfig": "",
+                        "isAttached": attach_state,
+                        "dot1QVlan": 0,
+                        "detachSwitchPorts": "",
+                        "switchPorts": ports,
+                        "untagged": False,
+                        "is_deploy": deployed,
+                    }
+                )
+                attach_list[attach_idx] = attach
 
             if dep_net:
                 dep_networks.append(dep_net)
@@ -1563,7 +1570,7 @@ class DcnmNetwork:
         have_attach = net_attach_objects["DATA"]
 
         if dep_networks:
-            have_deploy.update({"networkNames": ",".join(dep_networks)})
+            have_deploy["networkNames"] = ",".join(dep_networks)
 
         self.have_create = have_create
         self.have_attach = have_attach
@@ -1575,13 +1582,12 @@ class DcnmNetwork:
         want_attach = []
         want_deploy = {}
 
-        all_networks = ""
+        all_networks = []
 
         if not self.config:
             return
 
         for net in self.validated:
-            net_attach = {}
             networks = []
 
             net_deploy = net.get("deploy", True)
@@ -1634,84 +1640,70 @@ class DcnmNetwork:
                             #         attach_dict, net["net_name"], deploy
                             #     )
                             # )
-                net_attach.update({"networkName": net["net_name"]})
-                net_attach.update({"lanAttachList": networks})
-                want_attach.append(net_attach)
+                want_attach.append(
+                    {"networkName": net["net_name"], "lanAttachList": networks}
+                )
 
-            all_networks += net["net_name"] + ","
+            all_networks.append(net["net_name"])
 
         if all_networks:
-            want_deploy.update({"networkNames": all_networks[:-1]})
+            want_deploy["networkNames"] = ",".join(all_networks)
 
         self.want_create = want_create
         self.want_attach = want_attach
         self.want_deploy = want_deploy
 
+    def get_diff_detach(self, have_attach, diff_detach, all_nets):
+
+        # Mark every attached switch of the given networks for detach, and
+        # collect the networks which have to be undeployed.
+        for have_a in have_attach:
+            to_del = []
+            for a_h in have_a["lanAttachList"]:
+                if a_h["isAttached"]:
+                    del a_h["isAttached"]
+                    a_h.update({"deployment": False})
+                    to_del.append(a_h)
+            if to_del:
+                have_a.update({"lanAttachList": to_del})
+                diff_detach.append(have_a)
+                all_nets.append(have_a["networkName"])
+
     def get_diff_delete(self):
 
         diff_detach = []
         diff_undeploy = {}
         diff_delete = {}
 
-        all_nets = ""
+        all_nets = []
 
         if self.config:
 
-            for want_c in self.want_create:
-                if not next(
-                    (
-                        have_c
-                        for have_c in self.have_create
-                        if have_c["networkName"] == want_c["networkName"]
-                    ),
-                    None,
-                ):
-                    continue
-                diff_delete.update({want_c["networkName"]: "DEPLOYED"})
-
-                have_a = next(
-                    (
-                        attach
-                        for attach in self.have_attach
-                        if attach["networkName"] == want_c["networkName"]
-                    ),
-                    None,
-                )
+            have_create_by_name = self.index_by_network_name(self.have_create)
+            have_attach_by_name = self.index_by_network_name(self.have_attach)
 
-                if not have_a:
-                    continue
+            del_nets = [
+                want_c["networkName"]
+                for want_c in self.want_create
+                if want_c["networkName"] in have_create_by_name
+            ]
+            for net_name in del_nets:
+                diff_delete.update({net_name: "DEPLOYED"})
 
-                to_del = []
-                atch_h = have_a["lanAttachList"]
-                for a_h in atch_h:
-                    if a_h["isAttached"]:
-                        del a_h["isAttached"]
-                        a_h.update({"deployment": False})
-                        to_del.append(a_h)
-                if to_del:
-                    have_a.update({"lanAttachList": to_del})
-                    diff_detach.append(have_a)
-                    all_nets += have_a["networkName"] + ","
-            if all_nets:
-                diff_undeploy.update({"networkNames": all_nets[:-1]})
+            have_attach = [
+                have_attach_by_name[net_name]
+                for net_name in del_nets
+                if have_attach_by_name.get(net_name)
+            ]
 
         else:
-            for have_a in self.have_attach:
-                to_del = []
-                atch_h = have_a["lanAttachList"]
-                for a_h in atch_h:
-                    if a_h["isAttached"]:
-                        del a_h["isAttached"]
-                        a_h.update({"deployment": False})
-                        to_del.append(a_h)
-                if to_del:
-                    have_a.update({"lanAttachList": to_del})
-                    diff_detach.append(have_a)
-                    all_nets += have_a["networkName"] + ","
-
+            have_attach = self.have_attach
+            for have_a in have_attach:
                 diff_delete.update({have_a["networkName"]: "DEPLOYED"})
-            if all_nets:
-                diff_undeploy.update({"networkNames": all_nets[:-1]})
+
+        self.get_diff_detach(have_attach, diff_detach, all_nets)
+        if all_nets:
+            diff_undeploy.update({"networkNames": ",".join(all_nets)})
 
         self.diff_detach = diff_detach
         self.diff_undeploy = diff_undeploy
@@ -1719,7 +1711,7 @@ class DcnmNetwork:
 
     def get_diff_override(self):
 
-        all_nets = ""
+        all_nets = []
         diff_delete = {}
 
         warn_msg = self.get_diff_replace()
@@ -1730,40 +1722,25 @@ class DcnmNetwork:
         diff_deploy = self.diff_deploy
         diff_undeploy = self.diff_undeploy
 
-        for have_a in self.have_attach:
-            # This block will take care of deleting all the networks that are only present on DCNM but not on playbook
-            # The "if not found" block will go through all attachments under those networks and update them so that
-            # they will be detached and also the network name will be added to delete payload.
+        want_create_by_name = self.index_by_network_name(self.want_create)
 
-            found = next(
-                (
-                    net
-                    for net in self.want_create
-                    if net["networkName"] == have_a["networkName"]
-                ),
-                None,
-            )
-
-            to_del = []
-            if not found:
-                atch_h = have_a["lanAttachList"]
-                for a_h in atch_h:
-                    if a_h["isAttached"]:
-                        del a_h["isAttached"]
-                        a_h.update({"deployment": False})
-                        to_del.append(a_h)
+        # This block will take care of deleting all the networks that are only present on DCNM but not on playbook.
+        # All the attachments under those networks are updated so that they will be detached and also the
+        # network name will be added to delete payload.
+        have_attach = [
+            have_a
+            for have_a in self.have_attach
+            if have_a["networkName"] not in want_create_by_name
+        ]
+        self.get_diff_detach(have_attach, diff_detach, all_nets)
 
-                if to_del:
-                    have_a.update({"lanAttachList": to_del})
-                    diff_detach.append(have_a)
-                    all_nets += have_a["networkName"] + ","
-
-                # The following is added just to help in deletion, we need to wait for detach transaction to complete
-                # before attempting to delete the network.
-                diff_delete.update({have_a["networkName"]: "DEPLOYED"})
+        # The following is added just to help in deletion, we need to wait for detach transaction to complete
+        # before attempting to delete the network.
+        for have_a in have_attach:
+            diff_delete.update({have_a["networkName"]: "DEPLOYED"})
 
         if all_nets:
-            diff_undeploy.update({"networkNames": all_nets[:-1]})
+            diff_undeploy.update({"networkNames": ",".join(all_nets)})
 
         self.diff_create = diff_create
         self.diff_attach = diff_attach
@@ -1775,54 +1752,41 @@ class DcnmNetwork:
 
     def get_diff_replace(self):
 
-        all_nets = ""
+        all_nets = []
 
         warn_msg = self.get_diff_merge(replace=True)
         diff_create = self.diff_create
         diff_attach = self.diff_attach
         diff_deploy = self.diff_deploy
 
+        want_create_by_name = self.index_by_network_name(self.want_create)
+        want_attach_by_name = self.index_by_network_name(self.want_attach)
+        diff_attach_by_name = self.index_by_network_name(diff_attach)
+
         for have_a in self.have_attach:
             r_net_list = []
-            h_in_w = False
-            for want_a in self.want_attach:
+            want_a = want_attach_by_name.get(have_a["networkName"])
+            if want_a:
                 # This block will take care of deleting any attachments that are present only on DCNM
                 # but, not on the playbook. In this case, the playbook will have a network and few attaches under it,
                 # but, the attaches may be different to what the DCNM has for the same network.
-                if have_a["networkName"] == want_a["networkName"]:
-                    h_in_w = True
-                    atch_h = have_a["lanAttachList"]
-                    atch_w = want_a.get("lanAttachList")
+                want_serials = {
+                    a_w["serialNumber"] for a_w in want_a.get("lanAttachList") or []
+                }
 
-                    for a_h in atch_h:
-                        if not a_h["isAttached"]:
-                            continue
-                        a_match = False
-
-                        if atch_w:
-                            for a_w in atch_w:
-                                if a_h["serialNumber"] == a_w["serialNumber"]:
-                                    # Have is already in diff, no need to continue looking for it.
-                                    a_match = True
-                                    break
-                        if not a_match:
-                            del a_h["isAttached"]
-                            a_h.update({"deployment": False})
-                            r_net_list.append(a_h)
-                    break
+                for a_h in have_a["lanAttachList"]:
+                    if not a_h["isAttached"]:
+                        continue
+                    if a_h["serialNumber"] not in want_serials:
+                        del a_h["isAttached"]
+                        a_h.update({"deployment": False})
+                        r_net_list.append(a_h)
 
-            if not h_in_w:
+            else:
                 # This block will take care of deleting all the attachments which are in DCNM but
                 # are not mentioned in the playbook. The playbook just has the network, but, does not have any attach
                 # under it.
-                found = next(
-                    (
-                        net
-                        for net in self.want_create
-                        if net["networkName"] == have_a["networkName"]
-                    ),
-                    None,
-                )
+                found = want_create_by_name.get(have_a["networkName"])
                 if found:
                     atch_h = have_a["lanAttachList"]
                     for a_h in atch_h:
@@ -1833,20 +1797,17 @@ class DcnmNetwork:
                         r_net_list.append(a_h)
 
             if r_net_list:
-                in_diff = False
-                for d_attach in self.diff_attach:
-                    if have_a["networkName"] == d_attach["networkName"]:
-                        in_diff = True
-                        d_attach["lanAttachList"].extend(r_net_list)
-                        break
-
-                if not in_diff:
+                d_attach = diff_attach_by_name.get(have_a["networkName"])
+                if d_attach:
+                    d_attach["lanAttachList"].extend(r_net_list)
+                else:
                     r_net_dict = {
                         "networkName": have_a["networkName"],
                         "lanAttachList": r_net_list,
                     }
                     diff_attach.append(r_net_dict)
-                    all_nets += have_a["networkName"] + ","
+                    diff_attach_by_name[have_a["networkName"]] = r_net_dict
+                    all_nets.append(have_a["networkName"])
 
         if not all_nets:
             self.diff_create = diff_create
@@ -1854,11 +1815,9 @@ class DcnmNetwork:
             self.diff_deploy = diff_deploy
             return warn_msg
 
-        if not self.diff_deploy:
-            diff_deploy.update({"networkNames": all_nets[:-1]})
-        else:
-            nets = self.diff_deploy["networkNames"] + "," + all_nets[:-1]
-            diff_deploy.update({"networkNames": nets})
+        if self.diff_deploy:
+            all_nets.insert(0, self.diff_deploy["networkNames"])
+        diff_deploy.update({"networkNames": ",".join(all_nets)})
 
         self.diff_create = diff_create
         self.diff_attach = diff_attach
@@ -1885,45 +1844,52 @@ class DcnmNetwork:
         diff_deploy = {}
         prev_net_id_fetched = None
 
-        gw_changed = {}
-        tg_changed = {}
         warn_msg = None
-        l2only_changed = {}
-        vn_changed = {}
-        intdesc_changed = {}
-        mtu_changed = {}
-        arpsup_changed = {}
-        dhcp1_ip_changed = {}
-        dhcp2_ip_changed = {}
-        dhcp3_ip_changed = {}
-        dhcp1_vrf_changed = {}
-        dhcp2_vrf_changed = {}
-        dhcp3_vrf_changed = {}
-        dhcp_loopback_changed = {}
-        multicast_group_address_changed = {}
-        gwv6_changed = {}
-        sec_gw1_changed = {}
-        sec_gw2_changed = {}
-        sec_gw3_changed = {}
-        sec_gw4_changed = {}
-        trm_en_changed = {}
-        rt_both_changed = {}
-        l3gw_onbd_changed = {}
-        nf_en_changed = {}
-        intvlan_nfmon_changed = {}
-        vlan_nfmon_changed = {}
+        # Networks with a template parameter change which needs a redeploy
+        template_changed = set()
+
+        have_create_by_name = self.index_by_network_name(self.have_create)
+        have_attach_by_name = self.index_by_network_name(self.have_attach)
 
         for want_c in self.want_create:
             found = False
-            for have_c in self.have_create:
-                if want_c["networkName"] == have_c["networkName"]:
-
-                    found = True
+            have_c = have_create_by_name.get(want_c["networkName"])
+            if have_c is not None:
+                found = True
+                (
+                    diff,
+                    gw_chg,
+                    tg_chg,
+                    warn_msg,
+                    l2only_chg,
+                    vn_chg,
+                    idesc_chg,
+                    mtu_chg,
+                    arpsup_chg,
+                    dhcp1_ip_chg,
+                    dhcp2_ip_chg,
+                    dhcp3_ip_chg,
+                    dhcp1_vrf_chg,
+                    dhcp2_vrf_chg,
+                    dhcp3_vrf_chg,
+                    dhcp_loopbk_chg,
+                    mcast_grp_chg,
+                    gwv6_chg,
+                    sec_gw1_chg,
+                    sec_gw2_chg,
+                    sec_gw3_chg,
+                    sec_gw4_chg,
+                    trm_en_chg,
+                    rt_both_chg,
+                    l3gw_onbd_chg,
+                    nf_en_chg,
+                    intvlan_nfmon_chg,
+                    vlan_nfmon_chg
+                ) = self.diff_for_create(want_c, have_c)
+                if any(
                     (
-                        diff,
                         gw_chg,
                         tg_chg,
-                        warn_msg,
                         l2only_chg,
                         vn_chg,
                         idesc_chg,
@@ -1947,41 +1913,12 @@ class DcnmNetwork:
                         l3gw_onbd_chg,
                         nf_en_chg,
                         intvlan_nfmon_chg,
-                        vlan_nfmon_chg
-                    ) = self.diff_for_create(want_c, have_c)
-                    gw_changed.update({want_c["networkName"]: gw_chg})
-                    tg_changed.update({want_c["networkName"]: tg_chg})
-                    l2only_changed.update({want_c["networkName"]: l2only_chg})
-                    vn_changed.update({want_c["networkName"]: vn_chg})
-                    intdesc_changed.update({want_c["networkName"]: idesc_chg})
-                    mtu_changed.update({want_c["networkName"]: mtu_chg})
-                    arpsup_changed.update({want_c["networkName"]: arpsup_chg})
-                    dhcp1_ip_changed.update({want_c["networkName"]: dhcp1_ip_chg})
-                    dhcp2_ip_changed.update({want_c["networkName"]: dhcp2_ip_chg})
-                    dhcp3_ip_changed.update({want_c["networkName"]: dhcp3_ip_chg})
-                    dhcp1_vrf_changed.update({want_c["networkName"]: dhcp1_vrf_chg})
-                    dhcp2_vrf_changed.update({want_c["networkName"]: dhcp2_vrf_chg})
-                    dhcp3_vrf_changed.update({want_c["networkName"]: dhcp3_vrf_chg})
-                    dhcp_loopback_changed.update(
-                        {want_c["networkName"]: dhcp_loopbk_chg}
+                        vlan_nfmon_chg,
                     )
-                    multicast_group_address_changed.update(
-                        {want_c["networkName"]: mcast_grp_chg}
-                    )
-                    gwv6_changed.update({want_c["networkName"]: gwv6_chg})
-                    sec_gw1_changed.update({want_c["networkName"]: sec_gw1_chg})
-                    sec_gw2_changed.update({want_c["networkName"]: sec_gw2_chg})
-                    sec_gw3_changed.update({want_c["networkName"]: sec_gw3_chg})
-                    sec_gw4_changed.update({want_c["networkName"]: sec_gw4_chg})
-                    trm_en_changed.update({want_c["networkName"]: trm_en_chg})
-                    rt_both_changed.update({want_c["networkName"]: rt_both_chg})
-                    l3gw_onbd_changed.update({want_c["networkName"]: l3gw_onbd_chg})
-                    nf_en_changed.update({want_c["networkName"]: nf_en_chg})
-                    intvlan_nfmon_changed.update({want_c["networkName"]: intvlan_nfmon_chg})
-                    vlan_nfmon_changed.update({want_c["networkName"]: vlan_nfmon_chg})
-                    if diff:
-                        diff_create_update.append(diff)
-                    break
+                ):
+                    template_changed.add(want_c["networkName"])
+                if diff:
+                    diff_create_update.append(diff)
             if not found:
                 net_id = want_c.get("networkId", None)
 
@@ -2062,52 +1999,23 @@ class DcnmNetwork:
         for want_a in self.want_attach:
             dep_net = ""
             found = False
-            for have_a in self.have_attach:
-                if want_a["networkName"] == have_a["networkName"]:
-
-                    found = True
-                    diff, net = self.diff_for_attach_deploy(
-                        want_a["lanAttachList"], have_a["lanAttachList"], replace
-                    )
+            have_a = have_attach_by_name.get(want_a["networkName"])
+            if have_a is not None:
+                found = True
+                diff, net = self.diff_for_attach_deploy(
+                    want_a["lanAttachList"], have_a["lanAttachList"], replace
+                )
 
-                    if diff:
-                        base = want_a.copy()
-                        del base["lanAttachList"]
-                        base.update({"lanAttachList": diff})
-                        diff_attach.append(base)
-                        if net:
-                            dep_net = want_a["networkName"]
-                    else:
-                        if (
-                            net
-                            or gw_changed.get(want_a["networkName"], False)
-                            or tg_changed.get(want_a["networkName"], False)
-                            or l2only_changed.get(want_a["networkName"], False)
-                            or vn_changed.get(want_a["networkName"], False)
-                            or intdesc_changed.get(want_a["networkName"], False)
-                            or mtu_changed.get(want_a["networkName"], False)
-                            or arpsup_changed.get(want_a["networkName"], False)
-                            or dhcp1_ip_changed.get(want_a["networkName"], False)
-                            or dhcp2_ip_changed.get(want_a["networkName"], False)
-                            or dhcp3_ip_changed.get(want_a["networkName"], False)
-                            or dhcp1_vrf_changed.get(want_a["networkName"], False)
-                            or dhcp2_vrf_changed.get(want_a["networkName"], False)
-                            or dhcp3_vrf_changed.get(want_a["networkName"], False)
-                            or dhcp_loopback_changed.get(want_a["networkName"], False)
-                            or multicast_group_address_changed.get(want_a["networkName"], False)
-                            or gwv6_changed.get(want_a["networkName"], False)
-                            or sec_gw1_changed.get(want_a["networkName"], False)
-                            or sec_gw2_changed.get(want_a["networkName"], False)
-                            or sec_gw3_changed.get(want_a["networkName"], False)
-                            or sec_gw4_changed.get(want_a["networkName"], False)
-                            or trm_en_changed.get(want_a["networkName"], False)
-                            or rt_both_changed.get(want_a["networkName"], False)
-                            or l3gw_onbd_changed.get(want_a["networkName"], False)
-                            or nf_en_changed.get(want_a["networkName"], False)
-                            or intvlan_nfmon_changed.get(want_a["networkName"], False)
-                            or vlan_nfmon_changed.get(want_a["networkName"], False)
-                        ):
-                            dep_net = want_a["networkName"]
+                if diff:
+                    base = want_a.copy()
+                    del base["lanAttachList"]
+                    base.update({"lanAttachList": diff})
+                    diff_attach.append(base)
+                    if net:
+                        dep_net = want_a["networkName"]
+                else:
+                    if net or want_a["networkName"] in template_changed:
+                        dep_net = want_a["networkName"]
 
             if not found and want_a.get("lanAttachList"):
                 atch_list = []
@@ -2180,7 +2088,7 @@ class DcnmNetwork:
 
             found_c = want_d
 
-            json_to_dict = json.loads(found_c["networkTemplateConfig"])
+            json_to_dict = json_loads(found_c["networkTemplateConfig"])
 
             found_c.update({"net_name": found_c["networkName"]})
             found_c.update({"vrf_name": found_c.get("vrf", "NA")})
@@ -2310,122 +2218,130 @@ class DcnmNetwork:
             self.module.fail_json(msg=msg1 if missing_fabric else msg2)
             return
 
-        if self.config:
-            query = []
-            if self.have_create or self.have_attach:
-                for want_c in self.want_create:
-                    # Query the Network
-                    item = {"parent": {}, "attach": []}
-                    path = self.paths["GET_NET_NAME"].format(
-                        self.fabric, want_c["networkName"]
-                    )
-                    network = dcnm_send(self.module, method, path)
-
-                    if not network["DATA"]:
-                        continue
-                    missing_network, not_ok = self.handle_response(network, "query_dcnm")
-                    if missing_network or not_ok:
-                        continue
-
-                    net = network["DATA"]
-                    if want_c["networkName"] == net["networkName"]:
-                        item["parent"] = net
-                        item["parent"]["networkTemplateConfig"] = json.loads(
-                            net["networkTemplateConfig"]
-                        )
+        path = self.paths["GET_NET"].format(self.fabric)
 
-                        # Query the Attachment for the found Networks
-                        path = self.paths["GET_NET_ATTACH"].format(
-                            self.fabric, want_c["networkName"]
-                        )
-                        net_attach_objects = dcnm_send(self.module, method, path)
+        if self.config:
+            if not (self.have_create or self.have_attach):
+                return
 
-                        if not net_attach_objects["DATA"]:
-                            return
+            networks = dcnm_send(self.module, method, path)
 
-                        for net_attach in net_attach_objects["DATA"]:
-                            if want_c["networkName"] == net_attach["networkName"]:
-                                if not net_attach.get("lanAttachList"):
-                                    continue
-                                attach_list = net_attach["lanAttachList"]
+            missing_network, not_ok = self.handle_response(networks, "query_dcnm")
+            if missing_network or not_ok or not networks["DATA"]:
+                return
 
-                                for attach in attach_list:
-                                    # append the attach network details
-                                    item["attach"].append(attach)
-                                query.append(item)
+            # A network listed more than once in the config is queried only once
+            nets_by_name = {net["networkName"]: net for net in networks["DATA"]}
+            query_nets = []
+            for want_c in self.want_create:
+                net = nets_by_name.pop(want_c["networkName"], None)
+                if net is not None:
+                    query_nets.append(net)
 
         else:
-            query = []
-            path = self.paths["GET_NET"].format(self.fabric)
             networks = dcnm_send(self.module, method, path)
 
             if not networks["DATA"]:
                 return
 
-            for net in networks["DATA"]:
-                item = {"parent": {}, "attach": []}
-                # append the parent network details
-                item["parent"] = net
-                item["parent"]["networkTemplateConfig"] = json.loads(
-                    net["networkTemplateConfig"]
-                )
-
-                # fetch the attachment for the network
-                path = self.paths["GET_NET_ATTACH"].format(
-                    self.fabric, net["networkName"]
-                )
-                net_attach_objects = dcnm_send(self.module, method, path)
+            query_nets = networks["DATA"]
 
-                if not net_attach_objects["DATA"]:
-                    return
+        if not query_nets:
+            return
 
-                for net_attach in net_attach_objects["DATA"]:
-                    if not net_attach.get("lanAttachList"):
-                        continue
-                    attach_list = net_attach["lanAttachList"]
+        attach_by_name = self.get_net_attach_by_name(
+            [net["networkName"] for net in query_nets]
+        )
 
-                    for attach in attach_list:
-                        # append the attach network details
-                        item["attach"].append(attach)
-                    query.append(item)
+        query = []
+        for net in query_nets:
+            if not attach_by_name.get(net["networkName"]):
+                continue
+            item = {"parent": net, "attach": attach_by_name[net["networkName"]]}
+            item["parent"]["networkTemplateConfig"] = json_loads(
+                net["networkTemplateConfig"]
+            )
+            query.append(item)
 
         self.query = query
 
+    def get_net_attach_by_name(self, net_names):
+
+        # Query the attachments of the networks. dcnm_get_url() splits the query
+        # when the URL would be too long. A query which the controller does not
+        # answer with an OK response leaves its networks without attachments.
+        net_attach_objects = dcnm_get_url(
+            self.module,
+            self.fabric,
+            self.paths["GET_NET_ATTACH"],
+            ",".join(net_names),
+            "networks",
+            fail_on_error=False,
+        )
+
+        attach_by_name = {}
+        for net_attach in net_attach_objects["DATA"] or []:
+            attach_by_name.setdefault(net_attach["networkName"], []).extend(
+                net_attach.get("lanAttachList") or []
+            )
+
+        return attach_by_name
+
     def wait_for_del_ready(self):
 
-        method = "GET"
         if self.diff_delete:
-            for net in self.diff_delete:
-                state = False
-                path = self.paths["GET_NET_ATTACH"].format(self.fabric, net)
-                while not state:
-                    resp = dcnm_send(self.module, method, path)
-                    state = True
-                    if resp["DATA"]:
-                        attach_list = resp["DATA"][0]["lanAttachList"]
-                        for atch in attach_list:
-                            if (
-                                atch["lanAttachState"] == "OUT-OF-SYNC"
-                                or atch["lanAttachState"] == "FAILED"
-                            ):
-                                self.diff_delete.update({net: "OUT-OF-SYNC"})
-                                break
-                            if atch["lanAttachState"] != "NA":
-                                self.diff_delete.update({net: "DEPLOYED"})
-                                state = False
-                                time.sleep(self.WAIT_TIME_FOR_DELETE_LOOP)
-                                break
-                            self.diff_delete.update({net: "NA"})
+            # The attachments of all the networks which are still being detached are
+            # polled with one request per round, backing off between the rounds.
+            pending = list(self.diff_delete)
+            attempt = 0
+            while pending:
+                # A network whose attachments can not be fetched has nothing
+                # left to wait for.
+                attach_by_name = self.get_net_attach_by_name(pending)
+
+                still_pending = []
+                for net in pending:
+                    for atch in attach_by_name.get(net, []):
+                        if (
+                            atch["lanAttachState"] == "OUT-OF-SYNC"
+                            or atch["lanAttachState"] == "FAILED"
+                        ):
+                            self.diff_delete[net] = "OUT-OF-SYNC"
+                            break
+                        if atch["lanAttachState"] != "NA":
+                            self.diff_delete[net] = "DEPLOYED"
+                            still_pending.append(net)
+                            break
+                        self.diff_delete[net] = "NA"
+
+                pending = still_pending
+                if pending:
+                    time.sleep(
+                        backoff_interval(attempt, self.WAIT_TIME_FOR_DELETE_LOOP)
+                    )
+                    attempt += 1
 
             return True
 
-    def update_ms_fabric(self, diff):
-        if not self.is_ms_fabric:
-            return
+    def is_update_in_progress(self, text):
+
+        # Controller response when a network update collides with one in progress,
+        # i.e. "Failed" followed by "Please try after some time". Plain substring
+        # searches are used, as a ".*" regex can backtrack over long responses.
+        failed = text.find("Failed")
+        return failed != -1 and text.find("Please try after some time", failed) != -1
 
+    def update_attach_payload(self, diff):
+
+        # Drop the is_deploy key, which is only used while diffing, and on multisite
+        # fabrics update the fabric name to the specific fabric which the switches
+        # are part of. Both are done in a single pass over the attachments.
+        sn_fab = self.sn_fab if self.is_ms_fabric else None
         for list_elem in diff:
             for node in list_elem["lanAttachList"]:
-                node["fabric"] = self.sn_fab[node["serialNumber"]]
+                del node["is_deploy"]
+                if sn_fab is not None:
+                    node["fabric"] = sn_fab[node["serialNumber"]]
 
     def push_to_remote(self, is_rollback=False):
 
@@ -2454,12 +2370,7 @@ class DcnmNetwork:
         if self.diff_detach:
             detach_path = path + "/attachments"
 
-            # Update the fabric name to specific fabric which the switches are part of.
-            self.update_ms_fabric(self.diff_detach)
-
-            for d_a in self.diff_detach:
-                for v_a in d_a["lanAttachList"]:
-                    del v_a["is_deploy"]
+            self.update_attach_payload(self.diff_detach)
 
             resp = dcnm_send(
                 self.module, method, detach_path, json.dumps(self.diff_detach)
@@ -2475,18 +2386,15 @@ class DcnmNetwork:
         method = "POST"
         if self.diff_undeploy:
             deploy_path = path + "/deployments"
-            resp = dcnm_send(
-                self.module, method, deploy_path, json.dumps(self.diff_undeploy)
-            )
+            payload = json.dumps(self.diff_undeploy)
+            resp = dcnm_send(self.module, method, deploy_path, payload)
             # Use the self.wait_for_del_ready() function to refresh the state
             # of self.diff_delete dict and re-attempt the undeploy action if
             # the state of the network is "OUT-OF-SYNC"
             self.wait_for_del_ready()
             for net, state in self.diff_delete.items():
                 if state == "OUT-OF-SYNC":
-                    resp = dcnm_send(
-                        self.module, method, deploy_path, json.dumps(self.diff_undeploy)
-                    )
+                    resp = dcnm_send(self.module, method, deploy_path, payload)
 
             self.result["response"].append(resp)
             fail, self.result["changed"] = self.handle_response(resp, "deploy")
@@ -2523,7 +2431,7 @@ class DcnmNetwork:
 
         if self.diff_create:
             for net in self.diff_create:
-                json_to_dict = json.loads(net["networkTemplateConfig"])
+                json_to_dict = json_loads(net["networkTemplateConfig"])
                 vlanId = json_to_dict.get("vlanId", "")
 
                 if not vlanId:
@@ -2538,39 +2446,10 @@ class DcnmNetwork:
                         )
                     vlanId = vlan_data["DATA"]
 
-                t_conf = {
-                    "vlanId": vlanId,
-                    "gatewayIpAddress": json_to_dict.get("gatewayIpAddress", ""),
-                    "isLayer2Only": json_to_dict.get("isLayer2Only", False),
-                    "tag": json_to_dict.get("tag", ""),
-                    "vlanName": json_to_dict.get("vlanName", ""),
-                    "intfDescription": json_to_dict.get("intfDescription", ""),
-                    "mtu": json_to_dict.get("mtu", ""),
-                    "suppressArp": json_to_dict.get("suppressArp", False),
-                    "dhcpServerAddr1": json_to_dict.get("dhcpServerAddr1", ""),
-                    "dhcpServerAddr2": json_to_dict.get("dhcpServerAddr2", ""),
-                    "dhcpServerAddr3": json_to_dict.get("dhcpServerAddr3", ""),
-                    "vrfDhcp": json_to_dict.get("vrfDhcp", ""),
-                    "vrfDhcp2": json_to_dict.get("vrfDhcp2", ""),
-                    "vrfDhcp3": json_to_dict.get("vrfDhcp3", ""),
-                    "loopbackId": json_to_dict.get("loopbackId", ""),
-                    "mcastGroup": json_to_dict.get("mcastGroup", ""),
-                    "gatewayIpV6Address": json_to_dict.get("gatewayIpV6Address", ""),
-                    "secondaryGW1": json_to_dict.get("secondaryGW1", ""),
-                    "secondaryGW2": json_to_dict.get("secondaryGW2", ""),
-                    "secondaryGW3": json_to_dict.get("secondaryGW3", ""),
-                    "secondaryGW4": json_to_dict.get("secondaryGW4", ""),
-                    "trmEnabled": json_to_dict.get("trmEnabled", False),
-                    "rtBothAuto": json_to_dict.get("rtBothAuto", False),
-                    "enableL3OnBorder": json_to_dict.get("enableL3OnBorder", False),
-                }
-
-                if self.dcnm_version > 11:
-                    t_conf.update(ENABLE_NETFLOW=json_to_dict.get("ENABLE_NETFLOW", False))
-                    t_conf.update(SVI_NETFLOW_MONITOR=json_to_dict.get("SVI_NETFLOW_MONITOR", ""))
-                    t_conf.update(VLAN_NETFLOW_MONITOR=json_to_dict.get("VLAN_NETFLOW_MONITOR", ""))
-
-                net.update({"networkTemplateConfig": json.dumps(t_conf)})
+                    # The template config already holds every parameter managed by this
+                    # module, so it only needs to be serialized again for the new vlanId.
+                    json_to_dict["vlanId"] = vlanId
+                    net["networkTemplateConfig"] = json.dumps(json_to_dict)
 
                 method = "POST"
                 resp = dcnm_send(self.module, method, path, json.dumps(net))
@@ -2586,28 +2465,26 @@ class DcnmNetwork:
         if self.diff_attach:
             attach_path = path + "/attachments"
 
-            # Update the fabric name to specific fabric which the switches are part of.
-            self.update_ms_fabric(self.diff_attach)
-
-            for d_a in self.diff_attach:
-                for v_a in d_a["lanAttachList"]:
-                    del v_a["is_deploy"]
+            self.update_attach_payload(self.diff_attach)
 
-            for attempt in range(0, 50):
-                resp = dcnm_send(
-                    self.module, method, attach_path, json.dumps(self.diff_attach)
+            payload = json.dumps(self.diff_attach)
+            timeout = self.UPDATE_IN_PROGRESS_TIMEOUT
+            attempt = 0
+            while True:
+                resp = dcnm_send(self.module, method, attach_path, payload)
+                update_in_progress = any(
+                    self.is_update_in_progress(str(value))
+                    for value in resp["DATA"].values()
                 )
-                update_in_progress = False
-                for key in resp["DATA"].keys():
-                    if re.search(
-                        r"Failed.*Please try after some time", str(resp["DATA"][key])
-                    ):
-                        update_in_progress = True
-                if update_in_progress:
-                    time.sleep(1)
-                    continue
+                if not update_in_progress or timeout <= 0:
+                    break
 
-                break
+                interval = backoff_interval(
+                    attempt, self.UPDATE_IN_PROGRESS_MAX_INTERVAL
+                )
+                time.sleep(interval)
+                timeout -= interval
+                attempt += 1
             self.result["response"].append(resp)
             fail, self.result["changed"] = self.handle_response(resp, "attach")
             # If we get here and an update_in_progress is True then
@@ -2894,7 +2771,7 @@ class DcnmNetwork:
         fail = False
         changed = True
 
-        res = resp.copy()
+        res = resp
 
         if op == "query_dcnm":
             # This if blocks handles responses to the query APIs against DCNM.
@@ -2914,12 +2791,14 @@ class DcnmNetwork:
         if res.get("ERROR"):
             fail = True
             changed = False
-        if op == "attach" and "is in use already" in str(res.values()):
-            fail = True
-            changed = False
-        if op == "attach" and "Invalid interfaces" in str(res.values()):
-            fail = True
-            changed = True
+        if op == "attach":
+            res_values = str(res.values())
+            if "is in use already" in res_values:
+                fail = True
+                changed = False
+            if "Invalid interfaces" in res_values:
+                fail = True
+                changed = True
         if op == "deploy" and "No switches PENDING for deployment" in str(res.values()):
             changed = False
 
@@ -2986,8 +2865,8 @@ class DcnmNetwork:
         if cfg.get("net_extension_template", None) is None:
             want["networkExtensionTemplate"] = have["networkExtensionTemplate"]
 
-        json_to_dict_want = json.loads(want["networkTemplateConfig"])
-        json_to_dict_have = json.loads(have["networkTemplateConfig"])
+        json_to_dict_want = json_loads(want["networkTemplateConfig"])
+        json_to_dict_have = json_loads(have["networkTemplateConfig"])
 
         if cfg.get("vlan_id", None) is None:
             json_to_dict_want["vlanId"] = json_to_dict_have["vlanId"]
@@ -3128,15 +3007,13 @@ class DcnmNetwork:
         if self.want_create == []:
             return
 
+        have_create_by_name = self.index_by_network_name(self.have_create)
+
         for net in self.want_create:
 
             # Get the matching have to copy values if required
-            match_have = [
-                have
-                for have in self.have_create
-                if ((net["networkName"] == have["networkName"]))
-            ]
-            if match_have == []:
+            match_have = have_create_by_name.get(net["networkName"])
+            if match_have is None:
                 continue
 
             # Get the network from self.config to check if a particular object is included or not
@@ -3146,7 +3023,7 @@ class DcnmNetwork:
             if match_cfg == []:
                 continue
 
-            self.dcnm_update_network_information(net, match_have[0], match_cfg[0])
+            self.dcnm_update_network_information(net, match_have, match_cfg[0])
 
 
 def main():
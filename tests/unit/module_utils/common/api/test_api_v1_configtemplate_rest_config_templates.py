@@ -42,6 +42,22 @@ def test_ep_templates_00010():
     assert instance.verb == "GET"
 
 
+def test_ep_templates_00020():
+    """
+    ### Class
+    -   EpTemplate
+
+    ### Summary
+    -   Verify path is updated when template_name is changed.
+    """
+    with does_not_raise():
+        instance = EpTemplate()
+        instance.template_name = "Easy_Fabric"
+        instance.template_name = "LAN_Classic"
+    assert instance.path == f"{PATH_PREFIX}/LAN_Classic"
+    assert instance.path == instance.path_template_name
+
+
 def test_ep_templates_00040():
     """
     ### Class
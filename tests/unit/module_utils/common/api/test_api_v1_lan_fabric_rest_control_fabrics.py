@@ -16,6 +16,7 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import re
 
 import pytest
 from ansible_collections.cisco.dcnm.plugins.module_utils.common.api.v1.lan_fabric.rest.control.fabrics.fabrics import (
@@ -30,6 +31,10 @@ FABRIC_NAME = "MyFabric"
 SERIAL_NUMBER = "CHS12345678"
 TEMPLATE_NAME = "Easy_Fabric"
 TICKET_ID = "MyTicket1234"
+FABRIC_PATH = f"{PATH_PREFIX}/{FABRIC_NAME}"
+CONFIG_DEPLOY_PATH = f"{FABRIC_PATH}/config-deploy"
+CONFIG_SAVE_PATH = f"{FABRIC_PATH}/config-save"
+MAINTENANCE_MODE_PATH = f"{FABRIC_PATH}/switches/{SERIAL_NUMBER}/maintenance-mode"
 
 
 def test_ep_fabrics_00000():
@@ -59,7 +64,7 @@ def test_ep_fabrics_00000():
     assert instance.force_show_run is False
     assert instance.include_all_msd_switches is False
     assert instance.switch_id is None
-    match = r"EpFabricConfigDeploy.path_fabric_name:\s+"
+    match = r"EpFabricConfigDeploy\.path_fabric_name:\s+"
     with pytest.raises(ValueError, match=match):
         instance.path  # pylint: disable=pointless-statement
 
@@ -77,7 +82,7 @@ def test_ep_fabrics_00010():
     with does_not_raise():
         instance = EpFabricConfigDeploy()
         instance.fabric_name = FABRIC_NAME
-    assert f"{PATH_PREFIX}/{FABRIC_NAME}/config-deploy" in instance.path
+    assert CONFIG_DEPLOY_PATH in instance.path
     assert "forceShowRun=False" in instance.path
     assert "inclAllMSDSwitches=False" in instance.path
     assert instance.verb == "POST"
@@ -95,7 +100,7 @@ def test_ep_fabrics_00020():
         instance = EpFabricConfigDeploy()
         instance.fabric_name = FABRIC_NAME
         instance.force_show_run = True
-    assert f"{PATH_PREFIX}/{FABRIC_NAME}/config-deploy" in instance.path
+    assert CONFIG_DEPLOY_PATH in instance.path
     assert "forceShowRun=True" in instance.path
     assert "inclAllMSDSwitches=False" in instance.path
     assert instance.verb == "POST"
@@ -113,7 +118,7 @@ def test_ep_fabrics_00030():
         instance = EpFabricConfigDeploy()
         instance.fabric_name = FABRIC_NAME
         instance.include_all_msd_switches = True
-    assert f"{PATH_PREFIX}/{FABRIC_NAME}/config-deploy" in instance.path
+    assert CONFIG_DEPLOY_PATH in instance.path
     assert "forceShowRun=False" in instance.path
     assert "inclAllMSDSwitches=True" in instance.path
     assert instance.verb == "POST"
@@ -132,49 +137,10 @@ def test_ep_fabrics_00040():
         instance.fabric_name = FABRIC_NAME
         instance.switch_id = SERIAL_NUMBER
         instance.force_show_run = True
-    path = f"{PATH_PREFIX}/{FABRIC_NAME}/config-deploy/{SERIAL_NUMBER}"
-    path += "?forceShowRun=True"
-    assert instance.path == path
+    assert instance.path == f"{CONFIG_DEPLOY_PATH}/{SERIAL_NUMBER}?forceShowRun=True"
     assert instance.verb == "POST"
 
 
-def test_ep_fabrics_00050():
-    """
-    ### Class
-    -   EpFabricConfigDeploy
-
-    ### Summary
-    -   Verify ``ValueError`` is raised if path is accessed
-        before setting ``fabric_name``.
-
-    """
-    with does_not_raise():
-        instance = EpFabricConfigDeploy()
-    match = r"EpFabricConfigDeploy.path_fabric_name:\s+"
-    match += r"fabric_name must be set prior to accessing path\."
-    with pytest.raises(ValueError, match=match):
-        instance.path  # pylint: disable=pointless-statement
-
-
-def test_ep_fabrics_00060():
-    """
-    ### Class
-    -   EpFabricConfigDeploy
-
-    ### Summary
-    -   Verify ``ValueError`` is raised if ``fabric_name``
-        is invalid.
-    """
-    fabric_name = "1_InvalidFabricName"
-    with does_not_raise():
-        instance = EpFabricConfigDeploy()
-    match = r"EpFabricConfigDeploy.fabric_name:\s+"
-    match += r"ConversionUtils\.validate_fabric_name:\s+"
-    match += rf"Invalid fabric name: {fabric_name}\."
-    with pytest.raises(ValueError, match=match):
-        instance.fabric_name = fabric_name  # pylint: disable=pointless-statement
-
-
 def test_ep_fabrics_00070():
     """
     ### Class
@@ -186,7 +152,7 @@ def test_ep_fabrics_00070():
     """
     with does_not_raise():
         instance = EpFabricConfigDeploy()
-    match = r"EpFabricConfigDeploy.force_show_run:\s+"
+    match = r"EpFabricConfigDeploy\.force_show_run:\s+"
     match += r"Expected boolean for force_show_run\.\s+"
     match += r"Got NOT_BOOLEAN with type str\."
     with pytest.raises(ValueError, match=match):
@@ -204,7 +170,7 @@ def test_ep_fabrics_00080():
     """
     with does_not_raise():
         instance = EpFabricConfigDeploy()
-    match = r"EpFabricConfigDeploy.include_all_msd_switches:\s+"
+    match = r"EpFabricConfigDeploy\.include_all_msd_switches:\s+"
     match += r"Expected boolean for include_all_msd_switches\.\s+"
     match += r"Got NOT_BOOLEAN with type str\."
     with pytest.raises(ValueError, match=match):
@@ -213,40 +179,44 @@ def test_ep_fabrics_00080():
         )
 
 
-MATCH_00090 = r"EpFabricConfigDeploy.switch_id:\s+"
-MATCH_00090 += r"Expected string or list for switch_id\.\s+"
+MATCH_00090 = re.compile(
+    r"EpFabricConfigDeploy\.switch_id:\s+"
+    r"Expected string or list for switch_id\.\s+"
+)
 
 
-@pytest.mark.parametrize(
-    "value, does_raise, expected",
-    [
-        (SERIAL_NUMBER, False, does_not_raise()),
-        ([SERIAL_NUMBER], False, does_not_raise()),
-        (EpFabricCreate(), True, pytest.raises(TypeError, match=MATCH_00090)),
-        (None, True, pytest.raises(TypeError, match=MATCH_00090)),
-        (10, True, pytest.raises(TypeError, match=MATCH_00090)),
-        ([10], True, pytest.raises(TypeError, match=MATCH_00090)),
-        ({10}, True, pytest.raises(TypeError, match=MATCH_00090)),
-    ],
-)
-def test_ep_fabrics_00090(value, does_raise, expected):
+@pytest.mark.parametrize("value", [SERIAL_NUMBER, [SERIAL_NUMBER]])
+def test_ep_fabrics_00090(value):
     """
     ### Class
     -   EpFabricConfigDeploy
 
     ### Summary
     -   Verify exception is not raised if ``switch_id`` is a string or list.
-    -   Verify ``ValueError`` is raised if ``switch_id`` is not a str or list.
+    -   Verify a list ``switch_id`` is returned as a comma-separated string.
     """
     with does_not_raise():
         instance = EpFabricConfigDeploy()
-    with expected:
+        instance.switch_id = value
+    if isinstance(value, list):
+        assert instance.switch_id == ",".join(value)
+    else:
+        assert instance.switch_id == value
+
+
+@pytest.mark.parametrize("value", [EpFabricCreate(), None, 10, [10], {10}])
+def test_ep_fabrics_00095(value):
+    """
+    ### Class
+    -   EpFabricConfigDeploy
+
+    ### Summary
+    -   Verify ``TypeError`` is raised if ``switch_id`` is not a str or list.
+    """
+    with does_not_raise():
+        instance = EpFabricConfigDeploy()
+    with pytest.raises(TypeError, match=MATCH_00090):
         instance.switch_id = value  # pylint: disable=pointless-statement
-    if not does_raise:
-        if isinstance(value, list):
-            assert instance.switch_id == ",".join(value)
-        else:
-            assert instance.switch_id == value
 
 
 def test_ep_fabrics_00100():
@@ -260,7 +230,7 @@ def test_ep_fabrics_00100():
     with does_not_raise():
         instance = EpFabricConfigSave()
         instance.fabric_name = FABRIC_NAME
-    assert instance.path == f"{PATH_PREFIX}/{FABRIC_NAME}/config-save"
+    assert instance.path == CONFIG_SAVE_PATH
     assert instance.verb == "POST"
 
 
@@ -276,9 +246,7 @@ def test_ep_fabrics_00110():
         instance = EpFabricConfigSave()
         instance.fabric_name = FABRIC_NAME
         instance.ticket_id = TICKET_ID
-    ticket_id_path = f"{PATH_PREFIX}/{FABRIC_NAME}/config-save"
-    ticket_id_path += f"?ticketId={TICKET_ID}"
-    assert instance.path == ticket_id_path
+    assert instance.path == f"{CONFIG_SAVE_PATH}?ticketId={TICKET_ID}"
     assert instance.verb == "POST"
 
 
@@ -294,9 +262,7 @@ def test_ep_fabrics_00120():
         instance = EpFabricConfigSave()
         instance.fabric_name = FABRIC_NAME
         instance.ticket_id = TICKET_ID
-    ticket_id_path = f"{PATH_PREFIX}/{FABRIC_NAME}/config-save"
-    ticket_id_path += f"?ticketId={TICKET_ID}"
-    assert instance.path == ticket_id_path
+    assert instance.path == f"{CONFIG_SAVE_PATH}?ticketId={TICKET_ID}"
     assert instance.verb == "POST"
 
 
@@ -312,50 +278,13 @@ def test_ep_fabrics_00130():
     with does_not_raise():
         instance = EpFabricConfigSave()
         instance.fabric_name = FABRIC_NAME
-    match = r"EpFabricConfigSave.ticket_id:\s+"
+    match = r"EpFabricConfigSave\.ticket_id:\s+"
     match += r"Expected string for ticket_id\.\s+"
     match += r"Got 10 with type int\."
     with pytest.raises(ValueError, match=match):
         instance.ticket_id = 10  # pylint: disable=pointless-statement
 
 
-def test_ep_fabrics_00140():
-    """
-    ### Class
-    -   EpFabricConfigSave
-
-    ### Summary
-    -   Verify ``ValueError`` is raised if path is accessed
-        before setting ``fabric_name``.
-
-    """
-    with does_not_raise():
-        instance = EpFabricConfigSave()
-    match = r"EpFabricConfigSave.path_fabric_name:\s+"
-    match += r"fabric_name must be set prior to accessing path\."
-    with pytest.raises(ValueError, match=match):
-        instance.path  # pylint: disable=pointless-statement
-
-
-def test_ep_fabrics_00150():
-    """
-    ### Class
-    -   EpFabricConfigSave
-
-    ### Summary
-    -   Verify ``ValueError`` is raised if ``fabric_name``
-        is invalid.
-    """
-    fabric_name = "1_InvalidFabricName"
-    with does_not_raise():
-        instance = EpFabricConfigSave()
-    match = r"EpFabricConfigSave.fabric_name:\s+"
-    match += r"ConversionUtils\.validate_fabric_name:\s+"
-    match += rf"Invalid fabric name: {fabric_name}\."
-    with pytest.raises(ValueError, match=match):
-        instance.fabric_name = fabric_name  # pylint: disable=pointless-statement
-
-
 def test_ep_fabrics_00200():
     """
     ### Class
@@ -368,47 +297,10 @@ def test_ep_fabrics_00200():
         instance = EpFabricCreate()
         instance.fabric_name = FABRIC_NAME
         instance.template_name = TEMPLATE_NAME
-    assert instance.path == f"{PATH_PREFIX}/{FABRIC_NAME}/{TEMPLATE_NAME}"
+    assert instance.path == f"{FABRIC_PATH}/{TEMPLATE_NAME}"
     assert instance.verb == "POST"
 
 
-def test_ep_fabrics_00240():
-    """
-    ### Class
-    -   EpFabricCreate
-
-    ### Summary
-    -   Verify ``ValueError`` is raised if path is accessed
-        before setting ``fabric_name``.
-
-    """
-    with does_not_raise():
-        instance = EpFabricCreate()
-    match = r"EpFabricCreate\.path_fabric_name_template_name:\s+"
-    match += r"fabric_name must be set prior to accessing path\."
-    with pytest.raises(ValueError, match=match):
-        instance.path  # pylint: disable=pointless-statement
-
-
-def test_ep_fabrics_00250():
-    """
-    ### Class
-    -   EpFabricCreate
-
-    ### Summary
-    -   Verify ``ValueError`` is raised if ``fabric_name``
-        is invalid.
-    """
-    fabric_name = "1_InvalidFabricName"
-    with does_not_raise():
-        instance = EpFabricCreate()
-    match = r"EpFabricCreate.fabric_name:\s+"
-    match += r"ConversionUtils\.validate_fabric_name:\s+"
-    match += rf"Invalid fabric name: {fabric_name}\."
-    with pytest.raises(ValueError, match=match):
-        instance.fabric_name = fabric_name  # pylint: disable=pointless-statement
-
-
 def test_ep_fabrics_00260():
     """
     ### Class
@@ -441,7 +333,7 @@ def test_ep_fabrics_00270():
     with does_not_raise():
         instance = EpFabricCreate()
         instance.fabric_name = FABRIC_NAME
-    match = r"EpFabricCreate.template_name:\s+"
+    match = r"EpFabricCreate\.template_name:\s+"
     match += r"Invalid template_name: Invalid_Template_Name\.\s+"
     match += r"Expected one of:.*\."
     with pytest.raises(ValueError, match=match):
@@ -459,47 +351,10 @@ def test_ep_fabrics_00400():
     with does_not_raise():
         instance = EpFabricDelete()
         instance.fabric_name = FABRIC_NAME
-    assert instance.path == f"{PATH_PREFIX}/{FABRIC_NAME}"
+    assert instance.path == FABRIC_PATH
     assert instance.verb == "DELETE"
 
 
-def test_ep_fabrics_00440():
-    """
-    ### Class
-    -   EpFabricDelete
-
-    ### Summary
-    -   Verify ``ValueError`` is raised if path is accessed
-        before setting ``fabric_name``.
-
-    """
-    with does_not_raise():
-        instance = EpFabricDelete()
-    match = r"EpFabricDelete.path_fabric_name:\s+"
-    match += r"fabric_name must be set prior to accessing path\."
-    with pytest.raises(ValueError, match=match):
-        instance.path  # pylint: disable=pointless-statement
-
-
-def test_ep_fabrics_00450():
-    """
-    ### Class
-    -   EpFabricDelete
-
-    ### Summary
-    -   Verify ``ValueError`` is raised if ``fabric_name``
-        is invalid.
-    """
-    fabric_name = "1_InvalidFabricName"
-    with does_not_raise():
-        instance = EpFabricDelete()
-    match = r"EpFabricDelete.fabric_name:\s+"
-    match += r"ConversionUtils\.validate_fabric_name:\s+"
-    match += rf"Invalid fabric name: {fabric_name}\."
-    with pytest.raises(ValueError, match=match):
-        instance.fabric_name = fabric_name  # pylint: disable=pointless-statement
-
-
 def test_ep_fabrics_00500():
     """
     ### Class
@@ -511,47 +366,10 @@ def test_ep_fabrics_00500():
     with does_not_raise():
         instance = EpFabricDetails()
         instance.fabric_name = FABRIC_NAME
-    assert instance.path == f"{PATH_PREFIX}/{FABRIC_NAME}"
+    assert instance.path == FABRIC_PATH
     assert instance.verb == "GET"
 
 
-def test_ep_fabrics_00540():
-    """
-    ### Class
-    -   EpFabricDetails
-
-    ### Summary
-    -   Verify ``ValueError`` is raised if path is accessed
-        before setting ``fabric_name``.
-
-    """
-    with does_not_raise():
-        instance = EpFabricDetails()
-    match = r"EpFabricDetails.path_fabric_name:\s+"
-    match += r"fabric_name must be set prior to accessing path\."
-    with pytest.raises(ValueError, match=match):
-        instance.path  # pylint: disable=pointless-statement
-
-
-def test_ep_fabrics_00550():
-    """
-    ### Class
-    -   EpFabricDetails
-
-    ### Summary
-    -   Verify ``ValueError`` is raised if ``fabric_name``
-        is invalid.
-    """
-    fabric_name = "1_InvalidFabricName"
-    with does_not_raise():
-        instance = EpFabricDetails()
-    match = r"EpFabricDetails.fabric_name:\s+"
-    match += r"ConversionUtils\.validate_fabric_name:\s+"
-    match += rf"Invalid fabric name: {fabric_name}\."
-    with pytest.raises(ValueError, match=match):
-        instance.fabric_name = fabric_name  # pylint: disable=pointless-statement
-
-
 def test_ep_fabrics_00600():
     """
     ### Class
@@ -563,47 +381,10 @@ def test_ep_fabrics_00600():
     with does_not_raise():
         instance = EpFabricFreezeMode()
         instance.fabric_name = FABRIC_NAME
-    assert instance.path == f"{PATH_PREFIX}/{FABRIC_NAME}/freezemode"
+    assert instance.path == f"{FABRIC_PATH}/freezemode"
     assert instance.verb == "GET"
 
 
-def test_ep_fabrics_00640():
-    """
-    ### Class
-    -   EpFabricFreezeMode
-
-    ### Summary
-    -   Verify ``ValueError`` is raised if path is accessed
-        before setting ``fabric_name``.
-
-    """
-    with does_not_raise():
-        instance = EpFabricFreezeMode()
-    match = r"EpFabricFreezeMode.path_fabric_name:\s+"
-    match += r"fabric_name must be set prior to accessing path\."
-    with pytest.raises(ValueError, match=match):
-        instance.path  # pylint: disable=pointless-statement
-
-
-def test_ep_fabrics_00650():
-    """
-    ### Class
-    -   EpFabricFreezeMode
-
-    ### Summary
-    -   Verify ``ValueError`` is raised if ``fabric_name``
-        is invalid.
-    """
-    fabric_name = "1_InvalidFabricName"
-    with does_not_raise():
-        instance = EpFabricFreezeMode()
-    match = r"EpFabricFreezeMode.fabric_name:\s+"
-    match += r"ConversionUtils\.validate_fabric_name:\s+"
-    match += rf"Invalid fabric name: {fabric_name}\."
-    with pytest.raises(ValueError, match=match):
-        instance.fabric_name = fabric_name  # pylint: disable=pointless-statement
-
-
 # NOTE: EpFabricSummary tests are in test_v1_api_switches.py
 
 
@@ -619,45 +400,30 @@ def test_ep_fabrics_00700():
         instance = EpFabricUpdate()
         instance.fabric_name = FABRIC_NAME
         instance.template_name = TEMPLATE_NAME
-    assert instance.path == f"{PATH_PREFIX}/{FABRIC_NAME}/{TEMPLATE_NAME}"
+    assert instance.path == f"{FABRIC_PATH}/{TEMPLATE_NAME}"
     assert instance.verb == "PUT"
 
 
-def test_ep_fabrics_00740():
+def test_ep_fabrics_00710():
     """
     ### Class
     -   EpFabricUpdate
 
     ### Summary
-    -   Verify ``ValueError`` is raised if path is accessed
-        before setting ``fabric_name``.
-
+    -   Verify path reflects changes to ``fabric_name`` and
+        ``template_name`` made after path was first accessed.
     """
     with does_not_raise():
         instance = EpFabricUpdate()
-    match = r"EpFabricUpdate\.path_fabric_name_template_name:\s+"
-    match += r"fabric_name must be set prior to accessing path\."
-    with pytest.raises(ValueError, match=match):
-        instance.path  # pylint: disable=pointless-statement
-
-
-def test_ep_fabrics_00750():
-    """
-    ### Class
-    -   EpFabricUpdate
-
-    ### Summary
-    -   Verify ``ValueError`` is raised if ``fabric_name``
-        is invalid.
-    """
-    fabric_name = "1_InvalidFabricName"
+        instance.fabric_name = FABRIC_NAME
+        instance.template_name = TEMPLATE_NAME
+    assert instance.path == f"{FABRIC_PATH}/{TEMPLATE_NAME}"
     with does_not_raise():
-        instance = EpFabricUpdate()
-    match = r"EpFabricUpdate.fabric_name:\s+"
-    match += r"ConversionUtils\.validate_fabric_name:\s+"
-    match += rf"Invalid fabric name: {fabric_name}\."
-    with pytest.raises(ValueError, match=match):
-        instance.fabric_name = fabric_name  # pylint: disable=pointless-statement
+        instance.fabric_name = "MyOtherFabric"
+    assert instance.path == f"{PATH_PREFIX}/MyOtherFabric/{TEMPLATE_NAME}"
+    with does_not_raise():
+        instance.template_name = "Easy_Fabric_IPFM"
+    assert instance.path == f"{PATH_PREFIX}/MyOtherFabric/Easy_Fabric_IPFM"
 
 
 def test_ep_fabrics_00760():
@@ -692,7 +458,7 @@ def test_ep_fabrics_00770():
     with does_not_raise():
         instance = EpFabricUpdate()
         instance.fabric_name = FABRIC_NAME
-    match = r"EpFabricUpdate.template_name:\s+"
+    match = r"EpFabricUpdate\.template_name:\s+"
     match += r"Invalid template_name: Invalid_Template_Name\.\s+"
     match += r"Expected one of:.*\."
     with pytest.raises(ValueError, match=match):
@@ -727,6 +493,78 @@ def test_ep_fabrics_00810():
     assert instance.verb == "GET"
 
 
+@pytest.mark.parametrize(
+    "endpoint, method_name",
+    [
+        (EpFabricConfigDeploy, "path_fabric_name"),
+        (EpFabricConfigSave, "path_fabric_name"),
+        (EpFabricCreate, "path_fabric_name_template_name"),
+        (EpFabricDelete, "path_fabric_name"),
+        (EpFabricDetails, "path_fabric_name"),
+        (EpFabricFreezeMode, "path_fabric_name"),
+        (EpFabricUpdate, "path_fabric_name_template_name"),
+    ],
+)
+def test_ep_fabrics_01000(endpoint, method_name):
+    """
+    ### Class
+    -   EpFabricConfigDeploy
+    -   EpFabricConfigSave
+    -   EpFabricCreate
+    -   EpFabricDelete
+    -   EpFabricDetails
+    -   EpFabricFreezeMode
+    -   EpFabricUpdate
+
+    ### Summary
+    -   Verify ``ValueError`` is raised if path is accessed
+        before setting ``fabric_name``.
+    """
+    with does_not_raise():
+        instance = endpoint()
+    match = rf"{endpoint.__name__}\.{method_name}:\s+"
+    match += r"fabric_name must be set prior to accessing path\."
+    with pytest.raises(ValueError, match=match):
+        instance.path  # pylint: disable=pointless-statement
+
+
+@pytest.mark.parametrize(
+    "endpoint",
+    [
+        EpFabricConfigDeploy,
+        EpFabricConfigSave,
+        EpFabricCreate,
+        EpFabricDelete,
+        EpFabricDetails,
+        EpFabricFreezeMode,
+        EpFabricUpdate,
+    ],
+)
+def test_ep_fabrics_01010(endpoint):
+    """
+    ### Class
+    -   EpFabricConfigDeploy
+    -   EpFabricConfigSave
+    -   EpFabricCreate
+    -   EpFabricDelete
+    -   EpFabricDetails
+    -   EpFabricFreezeMode
+    -   EpFabricUpdate
+
+    ### Summary
+    -   Verify ``ValueError`` is raised if ``fabric_name``
+        is invalid.
+    """
+    fabric_name = "1_InvalidFabricName"
+    with does_not_raise():
+        instance = endpoint()
+    match = rf"{endpoint.__name__}\.fabric_name:\s+"
+    match += r"ConversionUtils\.validate_fabric_name:\s+"
+    match += rf"Invalid fabric name: {fabric_name}\."
+    with pytest.raises(ValueError, match=match):
+        instance.fabric_name = fabric_name  # pylint: disable=pointless-statement
+
+
 def test_ep_fabrics_03000():
     """
     ### Class
@@ -771,7 +609,7 @@ def test_ep_fabrics_03020():
     with does_not_raise():
         instance = EpMaintenanceModeEnable()
         instance.serial_number = SERIAL_NUMBER
-    match = r"EpMaintenanceModeEnable.path_fabric_name_serial_number:\s+"
+    match = r"EpMaintenanceModeEnable\.path_fabric_name_serial_number:\s+"
     match += r"fabric_name must be set prior to accessing path\."
     with pytest.raises(ValueError, match=match):
         instance.path  # pylint: disable=pointless-statement
@@ -789,7 +627,7 @@ def test_ep_fabrics_03030():
     with does_not_raise():
         instance = EpMaintenanceModeEnable()
         instance.fabric_name = FABRIC_NAME
-    match = r"EpMaintenanceModeEnable.path_fabric_name_serial_number:\s+"
+    match = r"EpMaintenanceModeEnable\.path_fabric_name_serial_number:\s+"
     match += r"serial_number must be set prior to accessing path\."
     with pytest.raises(ValueError, match=match):
         instance.path  # pylint: disable=pointless-statement
@@ -808,9 +646,7 @@ def test_ep_fabrics_03040():
         instance = EpMaintenanceModeEnable()
         instance.fabric_name = FABRIC_NAME
         instance.serial_number = SERIAL_NUMBER
-    path = f"{PATH_PREFIX}/{FABRIC_NAME}/switches/{SERIAL_NUMBER}"
-    path += "/maintenance-mode"
-    assert instance.path == path
+    assert instance.path == MAINTENANCE_MODE_PATH
 
 
 def test_ep_fabrics_03050():
@@ -827,9 +663,7 @@ def test_ep_fabrics_03050():
         instance.fabric_name = FABRIC_NAME
         instance.serial_number = SERIAL_NUMBER
         instance.ticket_id = TICKET_ID
-    path = f"{PATH_PREFIX}/{FABRIC_NAME}/switches/{SERIAL_NUMBER}"
-    path += f"/maintenance-mode?ticketId={TICKET_ID}"
-    assert instance.path == path
+    assert instance.path == f"{MAINTENANCE_MODE_PATH}?ticketId={TICKET_ID}"
 
 
 def test_ep_fabrics_03100():
@@ -874,7 +708,7 @@ def test_ep_fabrics_03120():
     with does_not_raise():
         instance = EpMaintenanceModeDisable()
         instance.serial_number = SERIAL_NUMBER
-    match = r"EpMaintenanceModeDisable.path_fabric_name_serial_number:\s+"
+    match = r"EpMaintenanceModeDisable\.path_fabric_name_serial_number:\s+"
     match += r"fabric_name must be set prior to accessing path\."
     with pytest.raises(ValueError, match=match):
         instance.path  # pylint: disable=pointless-statement
@@ -892,7 +726,7 @@ def test_ep_fabrics_03130():
     with does_not_raise():
         instance = EpMaintenanceModeDisable()
         instance.fabric_name = FABRIC_NAME
-    match = r"EpMaintenanceModeDisable.path_fabric_name_serial_number:\s+"
+    match = r"EpMaintenanceModeDisable\.path_fabric_name_serial_number:\s+"
     match += r"serial_number must be set prior to accessing path\."
     with pytest.raises(ValueError, match=match):
         instance.path  # pylint: disable=pointless-statement
@@ -911,9 +745,7 @@ def test_ep_fabrics_03140():
         instance = EpMaintenanceModeDisable()
         instance.fabric_name = FABRIC_NAME
         instance.serial_number = SERIAL_NUMBER
-    path = f"{PATH_PREFIX}/{FABRIC_NAME}/switches/{SERIAL_NUMBER}"
-    path += "/maintenance-mode"
-    assert instance.path == path
+    assert instance.path == MAINTENANCE_MODE_PATH
 
 
 def test_ep_fabrics_03150():
@@ -930,39 +762,41 @@ def test_ep_fabrics_03150():
         instance.fabric_name = FABRIC_NAME
         instance.serial_number = SERIAL_NUMBER
         instance.ticket_id = TICKET_ID
-    path = f"{PATH_PREFIX}/{FABRIC_NAME}/switches/{SERIAL_NUMBER}"
-    path += f"/maintenance-mode?ticketId={TICKET_ID}"
-    assert instance.path == path
+    assert instance.path == f"{MAINTENANCE_MODE_PATH}?ticketId={TICKET_ID}"
 
 
-MATCH_10000 = r"Fabrics.serial_number:\s+"
-MATCH_10000 += r"Expected string for serial_number\.\s+"
+MATCH_10000 = re.compile(
+    r"Fabrics\.serial_number:\s+"
+    r"Expected string for serial_number\.\s+"
+)
+
+
+def test_ep_fabrics_10000():
+    """
+    ### Class
+    -   Fabrics
+
+    ### Summary
+    -   Verify serial_number does not raise if set to string.
+    """
+    with does_not_raise():
+        instance = Fabrics()
+        instance.serial_number = SERIAL_NUMBER
+    assert instance.serial_number == SERIAL_NUMBER
 
 
 @pytest.mark.parametrize(
-    "value, does_raise, expected",
-    [
-        (SERIAL_NUMBER, False, does_not_raise()),
-        ([SERIAL_NUMBER], True, pytest.raises(TypeError, match=MATCH_10000)),
-        (EpFabricCreate(), True, pytest.raises(TypeError, match=MATCH_10000)),
-        (None, True, pytest.raises(TypeError, match=MATCH_10000)),
-        (10, True, pytest.raises(TypeError, match=MATCH_10000)),
-        ([10], True, pytest.raises(TypeError, match=MATCH_10000)),
-        ({10}, True, pytest.raises(TypeError, match=MATCH_10000)),
-    ],
+    "value", [[SERIAL_NUMBER], EpFabricCreate(), None, 10, [10], {10}]
 )
-def test_ep_fabrics_10000(value, does_raise, expected):
+def test_ep_fabrics_10010(value):
     """
     ### Class
     -   Fabrics
 
     ### Summary
-    -   Verify serial_number does not raise if set to string.
-    -   Verify serial_number raises ``ValueError`` if not a string.
+    -   Verify serial_number raises ``TypeError`` if not a string.
     """
     with does_not_raise():
         instance = Fabrics()
-    with expected:
+    with pytest.raises(TypeError, match=MATCH_10000):
         instance.serial_number = value  # pylint: disable=pointless-statement
-    if not does_raise:
-        assert instance.serial_number == value
@@ -17,7 +17,7 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 
-from contextlib import contextmanager
+from contextlib import nullcontext
 
 import pytest
 from ansible_collections.ansible.netcommon.tests.unit.modules.utils import \
@@ -238,12 +238,11 @@ def params_validate_v2_fixture():
     return ParamsValidateV2()
 
 
-@contextmanager
 def does_not_raise():
     """
     A context manager that does not raise an exception.
     """
-    yield
+    return nullcontext()
 
 
 def merge_dicts_data(key: str) -> dict[str, str]:
@@ -0,0 +1,54 @@
+# Copyright (c) 2024 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+__copyright__ = "Copyright (c) 2024 Cisco and/or its affiliates."
+__author__ = "Allen Robel"
+
+import pytest
+from ansible_collections.cisco.dcnm.plugins.module_utils.common.backoff import (
+    BACKOFF_JITTER, backoff_interval)
+from ansible_collections.cisco.dcnm.tests.unit.module_utils.common.common_utils import \
+    does_not_raise
+
+
+@pytest.mark.parametrize(
+    "attempt, max_interval, expected",
+    [
+        (0, 10, 0.5),
+        (1, 10, 1),
+        (2, 10, 2),
+        (3, 10, 4),
+        (4, 10, 8),
+        (5, 10, 10),
+        (6, 10, 10),
+        (5000, 10, 10),
+        (0, 0.25, 0.25),
+    ],
+)
+def test_backoff_00010(attempt, max_interval, expected) -> None:
+    """
+    ### Function
+    -   ``backoff_interval``
+
+    ### Test
+    -   Verify the interval doubles with each attempt, is capped at
+        max_interval, and includes at most BACKOFF_JITTER jitter.
+    """
+    with does_not_raise():
+        interval = backoff_interval(attempt, max_interval)
+    assert expected <= interval <= expected * (1 + BACKOFF_JITTER)
@@ -0,0 +1,77 @@
+# Copyright (c) 2024 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+__copyright__ = "Copyright (c) 2024 Cisco and/or its affiliates."
+__author__ = "Allen Robel"
+
+import math
+
+import pytest
+from ansible_collections.cisco.dcnm.plugins.module_utils.common.json_decode import \
+    json_loads
+from ansible_collections.cisco.dcnm.tests.unit.module_utils.common.common_utils import \
+    does_not_raise
+
+
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        ('{"networkName": "net1", "vlanId": 202}', {"networkName": "net1", "vlanId": 202}),
+        (b'{"networkName": "net1"}', {"networkName": "net1"}),
+        ("[]", []),
+        ('{"segmentId": 18446744073709551616}', {"segmentId": 18446744073709551616}),
+    ],
+)
+def test_json_decode_00010(data, expected) -> None:
+    """
+    ### Function
+    -   ``json_loads``
+
+    ### Test
+    -   Verify documents are decoded, including integers wider than
+        64 bits, which orjson rejects.
+    """
+    with does_not_raise():
+        result = json_loads(data)
+    assert result == expected
+
+
+def test_json_decode_00020() -> None:
+    """
+    ### Function
+    -   ``json_loads``
+
+    ### Test
+    -   Verify NaN and Infinity, which orjson rejects, are decoded.
+    """
+    with does_not_raise():
+        result = json_loads('{"a": NaN, "b": Infinity}')
+    assert math.isnan(result["a"])
+    assert result["b"] == float("inf")
+
+
+def test_json_decode_00030() -> None:
+    """
+    ### Function
+    -   ``json_loads``
+
+    ### Test
+    -   Verify ``ValueError`` is raised for an invalid document.
+    """
+    with pytest.raises(ValueError):
+        json_loads("{not json")
@@ -29,9 +29,6 @@ __metaclass__ = type
 __copyright__ = "Copyright (c) 2024 Cisco and/or its affiliates."
 __author__ = "Allen Robel"
 
-import copy
-import inspect
-
 import pytest
 from ansible_collections.cisco.dcnm.tests.unit.modules.dcnm.dcnm_fabric.utils import (
     does_not_raise, response_handler_fixture, responses_response_handler)
@@ -26,7 +26,7 @@ __metaclass__ = type
 __copyright__ = "Copyright (c) 2024 Cisco and/or its affiliates."
 __author__ = "Allen Robel"
 
-import copy
+import re
 
 import pytest
 from ansible_collections.cisco.dcnm.plugins.module_utils.common.response_handler import (
@@ -44,17 +44,78 @@ from ansible_collections.cisco.dcnm.tests.unit.module_utils.common.common_utils
 )
 
 PARAMS = {"state": "merged", "check_mode": False}
+# Shared by tests that do not commit through, or otherwise modify, them.
+RESPONSE_HANDLER = ResponseHandler()
+SENDER = Sender()
+
+
+@pytest.fixture(name="rest_send_base")
+def rest_send_base_fixture():
+    """
+    return RestSend() with path, response_handler, sender, and verb set.
+    """
+    instance = RestSend(PARAMS)
+    instance.path = "/foo/path"
+    instance.response_handler = ResponseHandler()
+    instance.sender = Sender()
+    instance.verb = "GET"
+    return instance
+
+
+@pytest.fixture(name="rest_send_bare")
+def rest_send_bare_fixture():
+    """
+    return RestSend() with no properties set.
+    """
+    return RestSend(PARAMS)
 
 
 def responses():
     """
     Dummy coroutine for ResponseGenerator()
 
-    See e.g. test_rest_send_v2_00800
+    See e.g. test_rest_send_v2_00320
     """
     yield {}
 
 
+# Not a response_handler_v1 implementation. See test_rest_send_v2_00800
+RESPONSE_GENERATOR = ResponseGenerator(iter([{}]))
+
+
+class MockResponseHandler:
+    """
+    Mock ``ResponseHandler().commit()`` to raise ``ValueError``.
+    """
+
+    def __init__(self):
+        self._verb = "GET"
+
+    def commit(self):
+        """
+        Raise ``ValueError``.
+        """
+        raise ValueError("Error in ResponseHandler.")
+
+    @property
+    def implements(self):
+        """
+        Return expected interface string.
+        """
+        return "response_handler_v1"
+
+    @property
+    def verb(self):
+        """
+        get/set verb.
+        """
+        return self._verb
+
+    @verb.setter
+    def verb(self, value):
+        self._verb = value
+
+
 def test_rest_send_v2_00000() -> None:
     """
     ### Classes and Methods
@@ -89,93 +150,18 @@ def test_rest_send_v2_00000() -> None:
     assert instance.state == PARAMS.get("state", None)
 
 
-def test_rest_send_v2_00100() -> None:
-    """
-    ### Classes and Methods
-    -   RestSend()
-            -   _verify_commit_parameters()
-            -   commit_normal_mode()
-            -   commit()
-
-    ### Summary
-    Verify ``_verify_commit_parameters()`` raises ``ValueError``
-    due to ``path`` not being set.
-
-    ### Setup - Code
-    -   RestSend() is initialized.
-    -   RestSend().path is NOT set.
-    -   RestSend().response_handler is set.
-    -   RestSend().sender is set.
-    -   RestSend().verb is set.
-
-    ### Setup - Data
-    None
-
-    ### Trigger
-    -   RestSend().commit() is called.
-
-    ### Expected Result
-    -   RestSend()._verify_commit_parameters() raises ``ValueError``.
-    """
-    with does_not_raise():
-        instance = RestSend(PARAMS)
-        instance.sender = Sender()
-        instance.response_handler = ResponseHandler()
-        instance.verb = "GET"
-
-    match = r"RestSend\.commit:\s+"
-    match += r"Error during commit\.\s+"
-    match += r"Error details:\s+"
-    match += r"RestSend\._verify_commit_parameters:\s+"
-    match += r"path must be set before calling commit\(\)."
-    with pytest.raises(ValueError, match=match):
-        instance.commit()
-
-
-def test_rest_send_v2_00110() -> None:
-    """
-    ### Classes and Methods
-    -   RestSend()
-            -   _verify_commit_parameters()
-            -   commit_normal_mode()
-            -   commit()
-
-    ### Summary
-    Verify ``_verify_commit_parameters()`` raises ``ValueError``
-    due to ``response_handler`` not being set.
-
-    ### Setup - Code
-    -   RestSend() is initialized.
-    -   RestSend().path is set.
-    -   RestSend().response_handler is NOT set.
-    -   RestSend().sender is set.
-    -   RestSend().verb is set.
-
-    ### Setup - Data
-    None
-
-    ### Trigger
-    -   RestSend().commit() is called.
-
-    ### Expected Result
-    -   RestSend()._verify_commit_parameters() raises ``ValueError``.
-    """
-    with does_not_raise():
-        instance = RestSend(PARAMS)
-        instance.path = "/foo/path"
-        instance.sender = Sender()
-        instance.verb = "GET"
+REQUIRED_COMMIT_PARAMETERS = [
+    ("path", "/foo/path"),
+    ("response_handler", RESPONSE_HANDLER),
+    ("sender", SENDER),
+    ("verb", "GET"),
+]
 
-    match = r"RestSend\.commit:\s+"
-    match += r"Error during commit\.\s+"
-    match += r"Error details:\s+"
-    match += r"RestSend\._verify_commit_parameters:\s+"
-    match += r"response_handler must be set before calling commit\(\)."
-    with pytest.raises(ValueError, match=match):
-        instance.commit()
 
-
-def test_rest_send_v2_00120() -> None:
+@pytest.mark.parametrize(
+    "missing", [parameter for parameter, _ in REQUIRED_COMMIT_PARAMETERS]
+)
+def test_rest_send_v2_00100(missing) -> None:
     """
     ### Classes and Methods
     -   RestSend()
@@ -185,14 +171,13 @@ def test_rest_send_v2_00120() -> None:
 
     ### Summary
     Verify ``_verify_commit_parameters()`` raises ``ValueError``
-    due to ``sender`` not being set.
+    when any one of ``path``, ``response_handler``, ``sender``,
+    or ``verb`` is not set.
 
     ### Setup - Code
     -   RestSend() is initialized.
-    -   RestSend().path is set.
-    -   RestSend().response_handler is set.
-    -   RestSend().sender is NOT set.
-    -   RestSend().verb is set.
+    -   Every parameter in ``REQUIRED_COMMIT_PARAMETERS`` except
+        ``missing`` is set.
 
     ### Setup - Data
     None
@@ -205,63 +190,22 @@ def test_rest_send_v2_00120() -> None:
     """
     with does_not_raise():
         instance = RestSend(PARAMS)
-        instance.path = "/foo/path"
-        instance.response_handler = ResponseHandler()
-        instance.verb = "GET"
+        for parameter, value in REQUIRED_COMMIT_PARAMETERS:
+            if parameter == missing:
+                continue
+            setattr(instance, parameter, value)
 
     match = r"RestSend\.commit:\s+"
     match += r"Error during commit\.\s+"
     match += r"Error details:\s+"
     match += r"RestSend\._verify_commit_parameters:\s+"
-    match += r"sender must be set before calling commit\(\)."
-    with pytest.raises(ValueError, match=match):
-        instance.commit()
-
-
-def test_rest_send_v2_00130() -> None:
-    """
-    ### Classes and Methods
-    -   RestSend()
-            -   _verify_commit_parameters()
-            -   commit_normal_mode()
-            -   commit()
-
-    ### Summary
-    Verify ``_verify_commit_parameters()`` raises ``ValueError``
-    due to ``verb`` not being set.
-
-    ### Setup - Code
-    -   RestSend() is initialized.
-    -   RestSend().path is set.
-    -   RestSend().response_handler is set.
-    -   RestSend().sender is set.
-    -   RestSend().verb is NOT set.
-
-    ### Setup - Data
-    None
-
-    ### Trigger
-    -   RestSend().commit() is called.
-
-    ### Expected Result
-    -   RestSend()._verify_commit_parameters() raises ``ValueError``.
-    """
-    with does_not_raise():
-        instance = RestSend(PARAMS)
-        instance.path = "/foo/path"
-        instance.response_handler = ResponseHandler()
-        instance.sender = Sender()
-
-    match = r"RestSend\.commit:\s+"
-    match += r"Error during commit\.\s+"
-    match += r"Error details:\s+"
-    match = r"RestSend\._verify_commit_parameters:\s+"
-    match += r"verb must be set before calling commit\(\)\."
+    match += rf"{missing} must be set before calling commit\(\)\."
     with pytest.raises(ValueError, match=match):
         instance.commit()
 
 
-def test_rest_send_v2_00200() -> None:
+@pytest.mark.parametrize("verb, result_key", [("GET", "found"), ("POST", "changed")])
+def test_rest_send_v2_00200(rest_send_base, verb, result_key) -> None:
     """
     ### Classes and Methods
     -   RestSend()
@@ -270,15 +214,13 @@ def test_rest_send_v2_00200() -> None:
 
     ### Summary
     Verify ``commit_check_mode()`` happy path when
-    ``verb`` is "GET".
+    ``verb`` is "GET" or "POST".
 
     ### Setup - Code
-    -   PARAMS["check_mode"] is set to True
-    -   RestSend() is initialized.
-    -   RestSend().path is set.
-    -   RestSend().response_handler is set.
-    -   RestSend().sender is set.
-    -   RestSend().verb is set.
+    -   rest_send_base provides RestSend() with path,
+        response_handler, sender, and verb set.
+    -   RestSend().check_mode is set to True
+    -   RestSend().verb is set to ``verb``.
 
     ### Setup - Data
     None
@@ -292,90 +234,28 @@ def test_rest_send_v2_00200() -> None:
             -   ``response_current``
             -   ``result``
             -   ``result_current``
-    -   result_current["found"] is True
+    -   result_current["found"] is True for "GET".
+    -   result_current["changed"] is True for "POST".
     """
-    params = copy.copy(PARAMS)
-    params["check_mode"] = True
-
+    instance = rest_send_base
     with does_not_raise():
-        instance = RestSend(params)
-        instance.path = "/foo/path"
-        instance.response_handler = ResponseHandler()
-        instance.sender = Sender()
-        instance.verb = "GET"
+        instance.check_mode = True
+        instance.verb = verb
         instance.commit()
-    assert instance.response_current["CHECK_MODE"] == instance.check_mode
-    assert (
-        instance.response_current["DATA"] == "[simulated-check-mode-response:Success]"
-    )
-    assert instance.response_current["MESSAGE"] == "OK"
-    assert instance.response_current["METHOD"] == instance.verb
-    assert instance.response_current["REQUEST_PATH"] == instance.path
-    assert instance.response_current["RETURN_CODE"] == 200
-    assert instance.result_current["success"] is True
-    assert instance.result_current["found"] is True
-    assert instance.response == [instance.response_current]
-    assert instance.result == [instance.result_current]
-
-
-def test_rest_send_v2_00210() -> None:
-    """
-    ### Classes and Methods
-    -   RestSend()
-            -   commit_check_mode()
-            -   commit()
-
-    ### Summary
-    Verify ``commit_check_mode()`` happy path when
-    ``verb`` is "POST".
-
-    ### Setup - Code
-    -   PARAMS["check_mode"] is set to True
-    -   RestSend() is initialized.
-    -   RestSend().path is set.
-    -   RestSend().response_handler is set.
-    -   RestSend().sender is set.
-    -   RestSend().verb is set.
-
-    ### Setup - Data
-    None
-
-    ### Trigger
-    -   RestSend().commit() is called.
-
-    ### Expected Result
-    -   The following are updated to expected values:
-            -   ``response``
-            -   ``response_current``
-            -   ``result``
-            -   ``result_current``
-    -   result_current["changed"] is True
-    """
-    params = copy.copy(PARAMS)
-    params["check_mode"] = True
-
-    with does_not_raise():
-        instance = RestSend(params)
-        instance.path = "/foo/path"
-        instance.response_handler = ResponseHandler()
-        instance.sender = Sender()
-        instance.verb = "POST"
-        instance.commit()
-    assert instance.response_current["CHECK_MODE"] == instance.check_mode
-    assert (
-        instance.response_current["DATA"] == "[simulated-check-mode-response:Success]"
-    )
-    assert instance.response_current["MESSAGE"] == "OK"
-    assert instance.response_current["METHOD"] == instance.verb
-    assert instance.response_current["REQUEST_PATH"] == instance.path
-    assert instance.response_current["RETURN_CODE"] == 200
-    assert instance.result_current["success"] is True
-    assert instance.result_current["changed"] is True
+    assert instance.response_current == {
+        "CHECK_MODE": instance.check_mode,
+        "DATA": "[simulated-check-mode-response:Success]",
+        "MESSAGE": "OK",
+        "METHOD": verb,
+        "REQUEST_PATH": instance.path,
+        "RETURN_CODE": 200,
+    }
+    assert instance.result_current == {"success": True, result_key: True}
     assert instance.response == [instance.response_current]
     assert instance.result == [instance.result_current]
 
 
-def test_rest_send_v2_00220(monkeypatch) -> None:
+def test_rest_send_v2_00220(monkeypatch, rest_send_base) -> None:
     """
     ### Classes and Methods
     -   RestSend()
@@ -387,12 +267,9 @@ def test_rest_send_v2_00220(monkeypatch) -> None:
     ``response_handler.commit()`` raises ``ValueError``.
 
     ### Setup - Code
-    -   PARAMS["check_mode"] is set to True
-    -   RestSend() is initialized.
-    -   RestSend().path is set.
-    -   RestSend().response_handler is set.
-    -   RestSend().sender is set.
-    -   RestSend().verb is set.
+    -   rest_send_base provides RestSend() with path,
+        response_handler, sender, and verb set.
+    -   RestSend().check_mode is set to True
     -   ResponseHandler().commit() is patched to raise ``ValueError``.
 
     ### Setup - Data
@@ -406,46 +283,9 @@ def test_rest_send_v2_00220(monkeypatch) -> None:
     -   commit_check_mode() re-raises ``ValueError``
     -   commit() re-raises ``ValueError``
     """
-    params = copy.copy(PARAMS)
-    params["check_mode"] = True
-
-    class MockResponseHandler:
-        """
-        Mock ``ResponseHandler().commit()`` to raise ``ValueError``.
-        """
-
-        def __init__(self):
-            self._verb = "GET"
-
-        def commit(self):
-            """
-            Raise ``ValueError``.
-            """
-            raise ValueError("Error in ResponseHandler.")
-
-        @property
-        def implements(self):
-            """
-            Return expected interface string.
-            """
-            return "response_handler_v1"
-
-        @property
-        def verb(self):
-            """
-            get/set verb.
-            """
-            return self._verb
-
-        @verb.setter
-        def verb(self, value):
-            self._verb = value
-
+    instance = rest_send_base
     with does_not_raise():
-        instance = RestSend(params)
-        instance.path = "/foo/path"
-        instance.response_handler = ResponseHandler()
-        instance.sender = Sender()
+        instance.check_mode = True
         instance.verb = "POST"
 
     monkeypatch.setattr(instance, "response_handler", MockResponseHandler())
@@ -470,7 +310,7 @@ def test_rest_send_v2_00300() -> None:
     ``verb`` is "POST" and ``payload`` is set.
 
     ### Setup - Code
-    -   PARAMS["check_mode"] is set to False
+    -   PARAMS["check_mode"] is False
     -   RestSend() is initialized.
     -   RestSend().path is set.
     -   RestSend().response_handler is set.
@@ -491,9 +331,6 @@ def test_rest_send_v2_00300() -> None:
             -   ``result_current``
     -   result_current["changed"] is True
     """
-    params = copy.copy(PARAMS)
-    params["check_mode"] = False
-
     def responses_00300():
         yield {
             "METHOD": "POST",
@@ -507,21 +344,22 @@ def test_rest_send_v2_00300() -> None:
     sender = Sender()
     sender.gen = ResponseGenerator(responses_00300())
     with does_not_raise():
-        instance = RestSend(params)
+        instance = RestSend(PARAMS)
         instance.path = "/foo/path"
         instance.response_handler = ResponseHandler()
         instance.sender = sender
         instance.verb = "POST"
         instance.payload = {}
         instance.commit()
-    assert instance.response_current["CHECK_MODE"] == instance.check_mode
-    assert instance.response_current["DATA"] == "simulated_data"
-    assert instance.response_current["MESSAGE"] == "OK"
-    assert instance.response_current["METHOD"] == instance.verb
-    assert instance.response_current["REQUEST_PATH"] == instance.path
-    assert instance.response_current["RETURN_CODE"] == 200
-    assert instance.result_current["success"] is True
-    assert instance.result_current["changed"] is True
+    assert instance.response_current == {
+        "CHECK_MODE": instance.check_mode,
+        "DATA": "simulated_data",
+        "MESSAGE": "OK",
+        "METHOD": instance.verb,
+        "REQUEST_PATH": instance.path,
+        "RETURN_CODE": 200,
+    }
+    assert instance.result_current == {"success": True, "changed": True}
     assert instance.response == [instance.response_current]
     assert instance.result == [instance.result_current]
 
@@ -538,7 +376,7 @@ def test_rest_send_v2_00310() -> None:
     ``Sender().commit()`` raises ``ValueError``.
 
     ### Setup - Code
-    -   PARAMS["check_mode"] is set to False
+    -   PARAMS["check_mode"] is False
     -   RestSend() is initialized.
     -   RestSend().path is set.
     -   RestSend().response_handler is set.
@@ -559,9 +397,6 @@ def test_rest_send_v2_00310() -> None:
     -   commit_normal_mode() re-raises ``ValueError``
     -   commit() re-raises ``ValueError``
     """
-    params = copy.copy(PARAMS)
-    params["check_mode"] = False
-
     def responses_00300():
         yield {
             "METHOD": "POST",
@@ -578,9 +413,9 @@ def test_rest_send_v2_00310() -> None:
     sender.raise_exception = ValueError
 
     with does_not_raise():
-        instance = RestSend(params)
+        instance = RestSend(PARAMS)
         instance.path = "/foo/path"
-        instance.response_handler = ResponseHandler()
+        instance.response_handler = RESPONSE_HANDLER
         instance.sender = sender
         instance.verb = "POST"
         instance.payload = {}
@@ -591,7 +426,7 @@ def test_rest_send_v2_00310() -> None:
         instance.commit()
 
 
-def test_rest_send_v2_00320(monkeypatch) -> None:
+def test_rest_send_v2_00320(monkeypatch, rest_send_base) -> None:
     """
     ### Classes and Methods
     -   RestSend()
@@ -603,12 +438,9 @@ def test_rest_send_v2_00320(monkeypatch) -> None:
     ``response_handler.commit()`` raises ``ValueError``.
 
     ### Setup - Code
-    -   PARAMS["check_mode"] is set to False
-    -   RestSend() is initialized.
-    -   RestSend().path is set.
-    -   RestSend().response_handler is set.
-    -   RestSend().sender is set.
-    -   RestSend().verb is set.
+    -   rest_send_base provides RestSend() with path,
+        response_handler, sender, and verb set.
+    -   RestSend().verb is set to "POST".
     -   ResponseHandler().commit() is patched to raise ``ValueError``.
 
     ### Setup - Data
@@ -622,46 +454,8 @@ def test_rest_send_v2_00320(monkeypatch) -> None:
     -   commit_normal_mode() re-raises ``ValueError``
     -   commit() re-raises ``ValueError``
     """
-    params = copy.copy(PARAMS)
-    params["check_mode"] = False
-
-    class MockResponseHandler:
-        """
-        Mock ``ResponseHandler().commit()`` to raise ``ValueError``.
-        """
-
-        def __init__(self):
-            self._verb = "GET"
-
-        def commit(self):
-            """
-            Raise ``ValueError``.
-            """
-            raise ValueError("Error in ResponseHandler.")
-
-        @property
-        def implements(self):
-            """
-            Return expected interface string.
-            """
-            return "response_handler_v1"
-
-        @property
-        def verb(self):
-            """
-            get/set verb.
-            """
-            return self._verb
-
-        @verb.setter
-        def verb(self, value):
-            self._verb = value
-
+    instance = rest_send_base
     with does_not_raise():
-        instance = RestSend(params)
-        instance.path = "/foo/path"
-        instance.response_handler = ResponseHandler()
-        instance.sender = Sender()
         instance.sender.gen = ResponseGenerator(responses())
         instance.verb = "POST"
 
@@ -675,166 +469,157 @@ def test_rest_send_v2_00320(monkeypatch) -> None:
         instance.commit()
 
 
-MATCH_00500 = r"RestSend\.check_mode:\s+"
-MATCH_00500 += r"check_mode must be a boolean\.\s+"
-MATCH_00500 += r"Got.*\."
-
-
-@pytest.mark.parametrize(
-    "value, does_raise, expected",
-    [
-        (10, True, pytest.raises(TypeError, match=MATCH_00500)),
-        ([10], True, pytest.raises(TypeError, match=MATCH_00500)),
-        ({10}, True, pytest.raises(TypeError, match=MATCH_00500)),
-        ("FOO", True, pytest.raises(TypeError, match=MATCH_00500)),
-        (None, True, pytest.raises(TypeError, match=MATCH_00500)),
-        (False, False, does_not_raise()),
-        (True, False, does_not_raise()),
-    ],
+MATCH_00500 = re.compile(
+    r"RestSend\.check_mode:\s+"
+    r"check_mode must be a boolean\.\s+"
+    r"Got.*\."
 )
-def test_rest_send_v2_00500(value, does_raise, expected) -> None:
-    """
-    ### Classes and Methods
-    -   RestSend()
-            -   check_mode.setter
-
-    ### Summary
-    Verify ``check_mode.setter`` raises ``TypeError``
-    when set to inappropriate types, and does not raise
-    when set to boolean.
-
-    ### Setup - Code
-    -   PARAMS["check_mode"] is set to True
-    -   RestSend() is initialized.
 
-    ### Setup - Data
-    None
+MATCH_00600 = re.compile(
+    r"RestSend\.response_current:\s+"
+    r"response_current must be a dict\.\s+"
+    r"Got.*\."
+)
 
-    ### Trigger
-    -   RestSend().check_mode is reset using various types.
+MATCH_00700 = re.compile(
+    r"RestSend\.response:\s+"
+    r"response must be a dict\.\s+"
+    r"Got type.*,\s+"
+    r"Value:\s+.*\."
+)
 
-    ### Expected Result
-    -   ``check_mode`` raises TypeError for non-boolean inputs.
-    -   ``check_mode`` accepts boolean values.
-    """
-    with does_not_raise():
-        instance = RestSend(PARAMS)
+MATCH_00900 = re.compile(
+    r"RestSend\.result_current:\s+"
+    r"result_current must be a dict\.\s+"
+    r"Got.*\."
+)
 
-    with expected:
-        instance.check_mode = value
-    if does_raise is False:
-        assert instance.check_mode == value
+MATCH_01000 = re.compile(
+    r"RestSend\.result:\s+"
+    r"result must be a dict\.\s+"
+    r"Got type.*,\s+"
+    r"Value:\s+.*\."
+)
 
+MATCH_01100 = re.compile(
+    r"RestSend\.send_interval:\s+"
+    r"send_interval must be an integer\.\s+"
+    r"Got type.*,\s+"
+    r"value\s+.*\."
+)
 
-MATCH_00600 = r"RestSend\.response_current:\s+"
-MATCH_00600 += r"response_current must be a dict\.\s+"
-MATCH_00600 += r"Got.*\."
+# (attribute, good value, expected getter value, match)
+SETTER_SPECS = [
+    ("check_mode", True, True, MATCH_00500),
+    ("response_current", {"RESULT_CODE": 200}, {"RESULT_CODE": 200}, MATCH_00600),
+    ("response", {"RESULT_CODE": 200}, [{"RESULT_CODE": 200}], MATCH_00700),
+    ("result_current", {"failed": False}, {"failed": False}, MATCH_00900),
+    ("result", {"RESULT_CODE": 200}, [{"RESULT_CODE": 200}], MATCH_01000),
+    ("send_interval", 200, 200, MATCH_01100),
+]
+# (id, value)
+BAD_VALUES = [
+    ("int", 10),
+    ("list", [10]),
+    ("set", {10}),
+    ("str", "FOO"),
+    ("none", None),
+    ("false", False),
+    ("true", True),
+]
 
 
 @pytest.mark.parametrize(
-    "value, does_raise, expected",
+    "attribute, value, match",
     [
-        (10, True, pytest.raises(TypeError, match=MATCH_00600)),
-        ([10], True, pytest.raises(TypeError, match=MATCH_00600)),
-        ({10}, True, pytest.raises(TypeError, match=MATCH_00600)),
-        ("FOO", True, pytest.raises(TypeError, match=MATCH_00600)),
-        (None, True, pytest.raises(TypeError, match=MATCH_00600)),
-        (False, True, pytest.raises(TypeError, match=MATCH_00600)),
-        (True, True, pytest.raises(TypeError, match=MATCH_00600)),
-        ({"RESULT_CODE": 200}, False, does_not_raise()),
+        pytest.param(attribute, value, match, id=f"{attribute}-{value_id}")
+        for attribute, good, _, match in SETTER_SPECS
+        for value_id, value in BAD_VALUES
+        if type(value) is not type(good)
     ],
 )
-def test_rest_send_v2_00600(value, does_raise, expected) -> None:
+def test_rest_send_v2_00500(rest_send_bare, attribute, value, match) -> None:
     """
     ### Classes and Methods
     -   RestSend()
+            -   check_mode.setter
             -   response_current.setter
+            -   response.setter
+            -   result_current.setter
+            -   result.setter
+            -   send_interval.setter
 
     ### Summary
-    Verify ``response_current.setter`` raises ``TypeError``
-    when set to inappropriate types, and does not raise
-    when set to dict.
+    Verify each setter in ``SETTER_SPECS`` raises ``TypeError``
+    when set to inappropriate types.
 
     ### Setup - Code
-    -   RestSend() is initialized.
+    -   rest_send_bare provides RestSend().
 
     ### Setup - Data
     None
 
     ### Trigger
-    -   RestSend().response_current is reset using various types.
+    -   Each property is reset to every value in ``BAD_VALUES``
+        whose type differs from the type the property accepts.
 
     ### Expected Result
-    -   ``response_current`` raises TypeError for non-dict inputs.
-    -   ``response_current`` accepts dict values.
+    -   The setter raises ``TypeError``.
     """
-    with does_not_raise():
-        instance = RestSend(PARAMS)
-
-    with expected:
-        instance.response_current = value
-    if does_raise is False:
-        assert instance.response_current == value
-
-
-MATCH_00700 = r"RestSend\.response:\s+"
-MATCH_00700 += r"response must be a dict\.\s+"
-MATCH_00700 += r"Got type.*,\s+"
-MATCH_00700 += r"Value:\s+.*\."
+    instance = rest_send_bare
+    with pytest.raises(TypeError, match=match):
+        setattr(instance, attribute, value)
 
 
 @pytest.mark.parametrize(
-    "value, does_raise, expected",
-    [
-        (10, True, pytest.raises(TypeError, match=MATCH_00700)),
-        ([10], True, pytest.raises(TypeError, match=MATCH_00700)),
-        ({10}, True, pytest.raises(TypeError, match=MATCH_00700)),
-        ("FOO", True, pytest.raises(TypeError, match=MATCH_00700)),
-        (None, True, pytest.raises(TypeError, match=MATCH_00700)),
-        (False, True, pytest.raises(TypeError, match=MATCH_00700)),
-        (True, True, pytest.raises(TypeError, match=MATCH_00700)),
-        ({"RESULT_CODE": 200}, False, does_not_raise()),
-    ],
+    "attribute, value, expected",
+    [(attribute, good, expected) for attribute, good, expected, _ in SETTER_SPECS]
+    + [("check_mode", False, False)],
+    ids=[attribute for attribute, _, _, _ in SETTER_SPECS] + ["check_mode-false"],
 )
-def test_rest_send_v2_00700(value, does_raise, expected) -> None:
+def test_rest_send_v2_00510(rest_send_bare, attribute, value, expected) -> None:
     """
     ### Classes and Methods
     -   RestSend()
-            -   response.setter
+            -   check_mode
+            -   response_current
+            -   response
+            -   result_current
+            -   result
+            -   send_interval
 
     ### Summary
-    Verify ``response.setter`` raises ``TypeError``
-    when set to inappropriate types, and does not raise
-    when set to dict.
+    Verify each setter in ``SETTER_SPECS`` accepts an appropriate
+    value, and the getter returns the expected value.
 
     ### Setup - Code
-    -   RestSend() is initialized.
+    -   rest_send_bare provides RestSend().
 
     ### Setup - Data
     None
 
     ### Trigger
-    -   RestSend().response is reset using various types.
+    -   Each property is set to its good value.
 
     ### Expected Result
-    -   ``response`` raises TypeError for non-dict inputs.
-    -   ``response`` accepts dict values.
-    -   ``response`` returns a list of dict in the happy path.
+    -   The setter does not raise.
+    -   ``response`` and ``result`` return a list of dict.
+    -   The other getters return the value that was set.
     """
+    instance = rest_send_bare
     with does_not_raise():
-        instance = RestSend(PARAMS)
-
-    with expected:
-        instance.response = value
-    if does_raise is False:
-        assert instance.response == [value]
+        setattr(instance, attribute, value)
+    assert isinstance(getattr(instance, attribute), type(expected))
+    assert getattr(instance, attribute) == expected
 
 
-MATCH_00800 = r"RestSend\.response_handler:\s+"
-MATCH_00800 += r"response_handler must implement response_handler_v1\.\s+"
-MATCH_00800 += r"Got type\s+.*,\s+"
-MATCH_00800 += r"implementing\s+.*\."
-MATCH_00800_A = rf"{MATCH_00800} Error detail:\s+.*"
+MATCH_00800 = re.compile(
+    r"RestSend\.response_handler:\s+"
+    r"response_handler must implement response_handler_v1\.\s+"
+    r"Got type\s+.*,\s+"
+    r"implementing\s+.*\."
+)
+MATCH_00800_A = re.compile(MATCH_00800.pattern + r" Error detail:\s+.*")
 MATCH_00800_B = MATCH_00800
 
 
@@ -848,13 +633,10 @@ MATCH_00800_B = MATCH_00800
         (None, True, pytest.raises(TypeError, match=MATCH_00800_A)),
         (False, True, pytest.raises(TypeError, match=MATCH_00800_A)),
         (True, True, pytest.raises(TypeError, match=MATCH_00800_A)),
-        (
-            ResponseGenerator(responses()),
-            True,
-            pytest.raises(TypeError, match=MATCH_00800_B),
-        ),
-        (ResponseHandler(), False, does_not_raise()),
+        (RESPONSE_GENERATOR, True, pytest.raises(TypeError, match=MATCH_00800_B)),
+        (RESPONSE_HANDLER, False, does_not_raise()),
     ],
+    ids=["int", "list", "set", "str", "none", "false", "true", "gen", "good"],
 )
 def test_rest_send_v2_00800(value, does_raise, expected) -> None:
     """
@@ -892,163 +674,6 @@ def test_rest_send_v2_00800(value, does_raise, expected) -> None:
         assert isinstance(instance.response_handler, ResponseHandler)
 
 
-MATCH_00900 = r"RestSend\.result_current:\s+"
-MATCH_00900 += r"result_current must be a dict\.\s+"
-MATCH_00900 += r"Got.*\."
-
-
-@pytest.mark.parametrize(
-    "value, does_raise, expected",
-    [
-        (10, True, pytest.raises(TypeError, match=MATCH_00900)),
-        ([10], True, pytest.raises(TypeError, match=MATCH_00900)),
-        ({10}, True, pytest.raises(TypeError, match=MATCH_00900)),
-        ("FOO", True, pytest.raises(TypeError, match=MATCH_00900)),
-        (None, True, pytest.raises(TypeError, match=MATCH_00900)),
-        (False, True, pytest.raises(TypeError, match=MATCH_00900)),
-        (True, True, pytest.raises(TypeError, match=MATCH_00900)),
-        ({"failed": False}, False, does_not_raise()),
-    ],
-)
-def test_rest_send_v2_00900(value, does_raise, expected) -> None:
-    """
-    ### Classes and Methods
-    -   RestSend()
-            -   result_current.setter
-
-    ### Summary
-    Verify ``result_current.setter`` raises ``TypeError``
-    when set to inappropriate types, and does not raise
-    when set to dict.
-
-    ### Setup - Code
-    -   RestSend() is initialized.
-
-    ### Setup - Data
-    None
-
-    ### Trigger
-    -   RestSend().result_current is reset using various types.
-
-    ### Expected Result
-    -   ``result_current`` raises TypeError for non-dict inputs.
-    -   ``result_current`` accepts dict values.
-    """
-    with does_not_raise():
-        instance = RestSend(PARAMS)
-
-    with expected:
-        instance.result_current = value
-    if does_raise is False:
-        assert instance.result_current == value
-
-
-MATCH_01000 = r"RestSend\.result:\s+"
-MATCH_01000 += r"result must be a dict\.\s+"
-MATCH_01000 += r"Got type.*,\s+"
-MATCH_01000 += r"Value:\s+.*\."
-
-
-@pytest.mark.parametrize(
-    "value, does_raise, expected",
-    [
-        (10, True, pytest.raises(TypeError, match=MATCH_01000)),
-        ([10], True, pytest.raises(TypeError, match=MATCH_01000)),
-        ({10}, True, pytest.raises(TypeError, match=MATCH_01000)),
-        ("FOO", True, pytest.raises(TypeError, match=MATCH_01000)),
-        (None, True, pytest.raises(TypeError, match=MATCH_01000)),
-        (False, True, pytest.raises(TypeError, match=MATCH_01000)),
-        (True, True, pytest.raises(TypeError, match=MATCH_01000)),
-        ({"RESULT_CODE": 200}, False, does_not_raise()),
-    ],
-)
-def test_rest_send_v2_01000(value, does_raise, expected) -> None:
-    """
-    ### Classes and Methods
-    -   RestSend()
-            -   result.setter
-
-    ### Summary
-    Verify ``result.setter`` raises ``TypeError``
-    when set to inappropriate types, and does not raise
-    when set to dict.
-
-    ### Setup - Code
-    -   RestSend() is initialized.
-
-    ### Setup - Data
-    None
-
-    ### Trigger
-    -   RestSend().result is reset using various types.
-
-    ### Expected Result
-    -   ``result`` raises TypeError for non-dict inputs.
-    -   ``result`` accepts dict values.
-    -   ``result`` returns a list of dict in the happy path.
-    """
-    with does_not_raise():
-        instance = RestSend(PARAMS)
-
-    with expected:
-        instance.result = value
-    if does_raise is False:
-        assert instance.result == [value]
-
-
-MATCH_01100 = r"RestSend\.send_interval:\s+"
-MATCH_01100 += r"send_interval must be an integer\.\s+"
-MATCH_01100 += r"Got type.*,\s+"
-MATCH_01100 += r"value\s+.*\."
-
-
-@pytest.mark.parametrize(
-    "value, does_raise, expected",
-    [
-        (200, False, does_not_raise()),
-        ([10], True, pytest.raises(TypeError, match=MATCH_01100)),
-        ({10}, True, pytest.raises(TypeError, match=MATCH_01100)),
-        ("FOO", True, pytest.raises(TypeError, match=MATCH_01100)),
-        (None, True, pytest.raises(TypeError, match=MATCH_01100)),
-        (False, True, pytest.raises(TypeError, match=MATCH_01100)),
-        (True, True, pytest.raises(TypeError, match=MATCH_01100)),
-    ],
-)
-def test_rest_send_v2_01100(value, does_raise, expected) -> None:
-    """
-    ### Classes and Methods
-    -   RestSend()
-            -   send_interval.setter
-
-    ### Summary
-    Verify ``send_interval.setter`` raises ``TypeError``
-    when set to inappropriate types, and does not raise
-    when set to integer.
-
-    ### Setup - Code
-    -   RestSend() is initialized.
-
-    ### Setup - Data
-    None
-
-    ### Trigger
-    -   RestSend().send_interval is reset using various types.
-
-    ### Expected Result
-    -   ``send_interval`` raises TypeError for non-integer inputs.
-    -   ``send_interval`` accepts integer inputs.
-    -   ``send_interval`` returns an integer in the happy path.
-    """
-    with does_not_raise():
-        instance = RestSend(PARAMS)
-
-    with expected:
-        instance.send_interval = value
-    if does_raise is False:
-        assert isinstance(instance.send_interval, int)
-        assert instance.send_interval == value
-
-
 def test_rest_send_v2_01200() -> None:
     """
     ### Classes and Methods
@@ -1112,10 +737,12 @@ def test_rest_send_v2_01300() -> None:
     assert implements == "rest_send_v2"
 
 
-MATCH_01400 = r"RestSend.sender:\s+"
-MATCH_01400 += r"value must be a class that implements sender_v1\.\s+"
-MATCH_01400 += r"Got type .*, value .*\.\s+"
-MATCH_01400_A = rf"{MATCH_01400}Error detail:.*"
+MATCH_01400 = re.compile(
+    r"RestSend.sender:\s+"
+    r"value must be a class that implements sender_v1\.\s+"
+    r"Got type .*, value .*\.\s+"
+)
+MATCH_01400_A = re.compile(MATCH_01400.pattern + r"Error detail:.*")
 MATCH_01400_B = MATCH_01400
 
 
@@ -1128,8 +755,8 @@ MATCH_01400_B = MATCH_01400
         ([10], True, pytest.raises(TypeError, match=MATCH_01400_A)),
         ({10}, True, pytest.raises(TypeError, match=MATCH_01400_A)),
         ("FOO", True, pytest.raises(TypeError, match=MATCH_01400_A)),
-        (ResponseHandler(), True, pytest.raises(TypeError, match=MATCH_01400_B)),
-        (Sender(), False, does_not_raise()),
+        (RESPONSE_HANDLER, True, pytest.raises(TypeError, match=MATCH_01400_B)),
+        (SENDER, False, does_not_raise()),
     ],
 )
 def test_rest_send_v2_01400(value, does_raise, expected) -> None:
@@ -1164,10 +791,12 @@ def test_rest_send_v2_01400(value, does_raise, expected) -> None:
         assert instance.sender.implements == "sender_v1"
 
 
-MATCH_01500 = r"RestSend\.timeout:\s+"
-MATCH_01500 += r"timeout must be an integer\.\s+"
-MATCH_01500 += r"Got type.*,\s+"
-MATCH_01500 += r"value\s+.*\."
+MATCH_01500 = re.compile(
+    r"RestSend\.timeout:\s+"
+    r"timeout must be an integer\.\s+"
+    r"Got type.*,\s+"
+    r"value\s+.*\."
+)
 
 
 @pytest.mark.parametrize(
@@ -1217,10 +846,12 @@ def test_rest_send_v2_01500(value, does_raise, expected) -> None:
         assert instance.timeout == value
 
 
-MATCH_01600 = r"RestSend\.unit_test:\s+"
-MATCH_01600 += r"unit_test must be a boolean\.\s+"
-MATCH_01600 += r"Got type.*,\s+"
-MATCH_01600 += r"value\s+.*\."
+MATCH_01600 = re.compile(
+    r"RestSend\.unit_test:\s+"
+    r"unit_test must be a boolean\.\s+"
+    r"Got type.*,\s+"
+    r"value\s+.*\."
+)
 
 
 @pytest.mark.parametrize(
@@ -1270,10 +901,12 @@ def test_rest_send_v2_01600(value, does_raise, expected) -> None:
         assert instance.unit_test == value
 
 
-MATCH_01700 = r"RestSend\.verb:\s+"
-MATCH_01700 += r"verb must be one of\s+"
-MATCH_01700 += r"\['DELETE', 'GET', 'POST', 'PUT'\]\.\s+"
-MATCH_01700 += r"Got.*\."
+MATCH_01700 = re.compile(
+    r"RestSend\.verb:\s+"
+    r"verb must be one of\s+"
+    r"\['DELETE', 'GET', 'POST', 'PUT'\]\.\s+"
+    r"Got.*\."
+)
 
 
 @pytest.mark.parametrize(
@@ -151,6 +151,8 @@ def test_fabric_common_00021(fabric_common, bgp_as, expected) -> None:
         ("None", None),
         ("NONE", None),
         (None, None),
+        (True, True),
+        (False, False),
         (10, 10),
         ({"foo": "bar"}, {"foo": "bar"}),
         (["foo", "bar"], ["foo", "bar"]),
@@ -189,3 +189,35 @@ def test_fabric_types_00050(fabric_types) -> None:
     match += r"FabricTypes\.mandatory_parameters"
     with pytest.raises(ValueError, match=match):
         instance.mandatory_parameters  # pylint: disable=pointless-statement
+
+
+def test_fabric_types_00060(fabric_types) -> None:
+    """
+    Classes and Methods
+    - FabricTypes
+        - __init__()
+        - valid_fabric_template_names.getter
+        - valid_fabric_template_names_set.getter
+
+    Summary
+    -   Verify valid_fabric_template_names returns a sorted list of
+        template names.
+    -   Verify valid_fabric_template_names_set returns a frozenset
+        containing the same template names.
+    -   Verify modifying the returned list does not modify the
+        template names held by the instance.
+    """
+    with does_not_raise():
+        instance = fabric_types
+    template_names = [
+        "Easy_Fabric",
+        "Easy_Fabric_IPFM",
+        "External_Fabric",
+        "LAN_Classic",
+        "MSD_Fabric",
+    ]
+    assert instance.valid_fabric_template_names == template_names
+    assert isinstance(instance.valid_fabric_template_names_set, frozenset)
+    assert instance.valid_fabric_template_names_set == frozenset(template_names)
+    instance.valid_fabric_template_names.append("FOO")
+    assert instance.valid_fabric_template_names == template_names
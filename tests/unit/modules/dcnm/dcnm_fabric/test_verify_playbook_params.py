@@ -51,7 +51,6 @@ def test_verify_playbook_params_00010() -> None:
     Classes and Methods
     - VerifyPlaybookParams
         - __init__()
-        - _init_properties()
     - ConversionUtils
         - __init__()
     - ParamInfo
@@ -75,9 +74,9 @@ def test_verify_playbook_params_00010() -> None:
     assert instance.local_params == {"DEPLOY"}
     assert instance.parameter is None
     assert instance.params_are_valid == set()
-    assert instance.properties["config_playbook"] is None
-    assert instance.properties["config_controller"] is None
-    assert instance.properties["template"] is None
+    assert instance.config_playbook is None
+    assert instance.config_controller is None
+    assert instance.template is None
 
 
 MATCH_OOO20 = r"VerifyPlaybookParams\.config_controller: "
@@ -733,6 +732,7 @@ def test_verify_playbook_params_00500(monkeypatch) -> None:
 
     with does_not_raise():
         instance = VerifyPlaybookParams()
+        instance.config_playbook = {}
 
     monkeypatch.setattr(
         instance, "controller_param_is_valid", mock_controller_param_is_valid
@@ -787,7 +787,7 @@ def test_verify_playbook_params_00520(monkeypatch) -> None:
         raise KeyError(msg)
 
     def mock_playbook_param_is_valid(*args):
-        return True
+        return None
 
     with does_not_raise():
         instance = VerifyPlaybookParams()
@@ -972,3 +972,250 @@ def test_verify_playbook_params_00800(monkeypatch) -> None:
     with does_not_raise():
         value = instance.default_param_is_valid(item)
     assert value is None
+
+
+@pytest.mark.parametrize(
+    "rule_operator, user_value, rule_value, expected",
+    [
+        ("==", "foo", "foo", True),
+        ("==", "foo", "bar", False),
+        ("!=", "foo", "bar", True),
+        ("!=", "foo", "foo", False),
+        ("<", 1, 2, True),
+        ("<=", 2, 2, True),
+        (">", 1, 2, False),
+        (">=", 2, 2, True),
+        ("in", "foo", ["foo", "bar"], True),
+        ("not in", "foo", ["foo", "bar"], False),
+    ],
+)
+def test_verify_playbook_params_00900(
+    rule_operator, user_value, rule_value, expected
+) -> None:
+    """
+    Classes and Methods
+    - VerifyPlaybookParams
+        - eval_parameter_rule()
+
+    Summary
+    -   Verify eval_parameter_rule() returns the expected result
+        for each supported operator.
+    """
+    rule = {
+        "parameter": "PARAM_1",
+        "user_value": user_value,
+        "operator": rule_operator,
+        "value": rule_value,
+    }
+    with does_not_raise():
+        instance = VerifyPlaybookParams()
+        result = instance.eval_parameter_rule(rule)
+    assert result is expected
+
+
+def test_verify_playbook_params_00910() -> None:
+    """
+    Classes and Methods
+    - VerifyPlaybookParams
+        - eval_parameter_rule()
+
+    Summary
+    -   Verify eval_parameter_rule() raises ``ValueError`` when the
+        rule operator is not supported.
+    """
+    rule = {
+        "parameter": "PARAM_1",
+        "user_value": "foo",
+        "operator": "=~",
+        "value": "foo",
+    }
+    with does_not_raise():
+        instance = VerifyPlaybookParams()
+    match = r"VerifyPlaybookParams\.eval_parameter_rule:\s+"
+    match += r"Unsupported operator =~ in parameter PARAM_1 rule:"
+    with pytest.raises(ValueError, match=match):
+        instance.eval_parameter_rule(rule)
+
+
+def test_verify_playbook_params_00920(monkeypatch) -> None:
+    """
+    Classes and Methods
+    - VerifyPlaybookParams
+        - update_ruleset()
+
+    Summary
+    -   Verify update_ruleset() refreshes the ruleset only when the
+        template object changes.
+    """
+    refresh_calls = []
+
+    with does_not_raise():
+        instance = VerifyPlaybookParams()
+
+    original_refresh = instance._ruleset.refresh
+
+    def mock_refresh(*args):
+        refresh_calls.append(True)
+        original_refresh()
+
+    monkeypatch.setattr(instance._ruleset, "refresh", mock_refresh)
+
+    template = templates_verify_playbook_params("easy_fabric")
+    with does_not_raise():
+        instance.template = template
+        instance.update_ruleset()
+        instance.update_ruleset()
+    assert len(refresh_calls) == 1
+
+    with does_not_raise():
+        instance.template = templates_verify_playbook_params("easy_fabric")
+        instance.update_ruleset()
+    assert len(refresh_calls) == 2
+
+
+def test_verify_playbook_params_00930(monkeypatch) -> None:
+    """
+    Classes and Methods
+    - VerifyPlaybookParams
+        - update_decision_set()
+
+    Summary
+    -   Verify update_decision_set() returns False without evaluating
+        the controller and default values when playbook_param_is_valid()
+        returns False.
+    """
+
+    def mock_playbook_param_is_valid(*args):
+        return False
+
+    def mock_controller_param_is_valid(*args):
+        msg = "controller_param_is_valid should not be called."
+        raise AssertionError(msg)
+
+    def mock_default_param_is_valid(*args):
+        msg = "default_param_is_valid should not be called."
+        raise AssertionError(msg)
+
+    with does_not_raise():
+        instance = VerifyPlaybookParams()
+
+    monkeypatch.setattr(
+        instance, "playbook_param_is_valid", mock_playbook_param_is_valid
+    )
+    monkeypatch.setattr(
+        instance, "controller_param_is_valid", mock_controller_param_is_valid
+    )
+    monkeypatch.setattr(
+        instance, "default_param_is_valid", mock_default_param_is_valid
+    )
+    item = {"operator": "==", "parameter": "STP_ROOT_OPTION", "value": "rpvst+"}
+    with does_not_raise():
+        is_valid = instance.update_decision_set(item)
+    assert is_valid is False
+
+
+def test_verify_playbook_params_00940() -> None:
+    """
+    Classes and Methods
+    - VerifyPlaybookParams
+        - config_playbook.setter
+        - playbook_param_is_valid()
+
+    Summary
+    -   Verify playbook_param_is_valid() uses the new playbook value
+        after config_playbook is set again.
+    """
+    with does_not_raise():
+        instance = VerifyPlaybookParams()
+        instance.config_playbook = {"PARAM_1": "true"}
+    item = {"operator": "==", "parameter": "PARAM_1", "value": True}
+    assert instance.playbook_param_is_valid(item) is True
+
+    with does_not_raise():
+        instance.config_playbook = {"PARAM_1": "false"}
+    item = {"operator": "==", "parameter": "PARAM_1", "value": True}
+    assert instance.playbook_param_is_valid(item) is False
+
+
+def test_verify_playbook_params_00950(monkeypatch) -> None:
+    """
+    Classes and Methods
+    - VerifyPlaybookParams
+        - update_param_info()
+
+    Summary
+    -   Verify update_param_info() refreshes the parameter info only
+        when the template object changes.
+    """
+    refresh_calls = []
+
+    with does_not_raise():
+        instance = VerifyPlaybookParams()
+
+    original_refresh = instance._param_info.refresh
+
+    def mock_refresh(*args):
+        refresh_calls.append(True)
+        original_refresh()
+
+    monkeypatch.setattr(instance._param_info, "refresh", mock_refresh)
+
+    template = templates_verify_playbook_params("easy_fabric")
+    with does_not_raise():
+        instance.template = template
+        instance.update_param_info()
+        instance.update_param_info()
+    assert len(refresh_calls) == 1
+
+    with does_not_raise():
+        instance.template = templates_verify_playbook_params("easy_fabric")
+        instance.update_param_info()
+    assert len(refresh_calls) == 2
+
+
+def test_verify_playbook_params_00960(monkeypatch) -> None:
+    """
+    Classes and Methods
+    - VerifyPlaybookParams
+        - verify_parameter_value()
+
+    Summary
+    -   Verify verify_parameter_value() raises ``ValueError``, rather than
+        ``TypeError``, when the playbook value is unhashable.
+    """
+
+    def mock_param_info_parameter(*args):
+        return {"choices": ["Ingress", "Multicast"], "type": "string"}
+
+    with does_not_raise():
+        instance = VerifyPlaybookParams()
+        instance.config_playbook = {"REPLICATION_MODE": ["Ingress"]}
+        instance.parameter = "REPLICATION_MODE"
+
+    monkeypatch.setattr(instance._param_info, "parameter", mock_param_info_parameter)
+
+    match = r"Parameter: REPLICATION_MODE, Invalid value:\s+"
+    match += r"\(\['Ingress'\]\)\.\s+"
+    match += r"Valid values: \['Ingress', 'Multicast'\]"
+    with pytest.raises(ValueError, match=match):
+        instance.verify_parameter_value()
+
+
+def test_verify_playbook_params_00970() -> None:
+    """
+    Classes and Methods
+    - VerifyPlaybookParams
+        - commit()
+
+    Summary
+    -   Verify commit() raises ``ValueError`` when the playbook config
+        does not contain FABRIC_NAME.
+    """
+    with does_not_raise():
+        instance = VerifyPlaybookParams()
+        instance.template = templates_verify_playbook_params("easy_fabric")
+        instance.config_playbook = {"REPLICATION_MODE": "Ingress"}
+        instance.config_controller = None
+    match = r"FABRIC_NAME not found in playbook config\."
+    with pytest.raises(ValueError, match=match):
+        instance.commit()
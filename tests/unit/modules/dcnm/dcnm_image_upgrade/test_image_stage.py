@@ -380,7 +380,7 @@ def test_image_stage_00410(image_stage) -> None:
         instance.issu_detail.results = Results()
         instance.serial_numbers = ["FDO21120U5D", "FDO2112189M"]
 
-    match = "Seconds remaining 1790: stage image failed for "
+    match = "Seconds remaining 1800: stage image failed for "
     match += "cvd-2313-leaf, FDO2112189M, 172.22.150.108. image "
     match += "staged percent: 90"
 
@@ -753,9 +753,7 @@ def test_image_stage_00900(image_stage, serial_numbers_is_set, expected) -> None
     key = f"{method_name}a"
 
     def responses():
-        # ImageStage().prune_serial_numbers
-        yield responses_ep_issu(key)
-        # ImageStage().validate_serial_numbers
+        # ImageStage()._prune_and_validate
         yield responses_ep_issu(key)
         # ImageStage()._populate_controller_version
         yield responses_ep_version(key)
@@ -824,9 +822,7 @@ def test_image_stage_00910(
     """
 
     def responses():
-        # ImageStage().prune_serial_numbers
-        yield responses_ep_issu(key)
-        # ImageStage().validate_serial_numbers
+        # ImageStage()._prune_and_validate
         yield responses_ep_issu(key)
         # ImageStage()._populate_controller_version
         yield responses_ep_version(key)
@@ -954,9 +950,7 @@ def test_image_stage_00930(image_stage) -> None:
     key = f"{method_name}a"
 
     def responses():
-        # ImageStage().prune_serial_numbers
-        yield responses_ep_issu(key)
-        # ImageStage().validate_serial_numbers
+        # ImageStage()._prune_and_validate
         yield responses_ep_issu(key)
         # ImageStage()._populate_controller_version
         yield responses_ep_version(key)
@@ -1019,9 +1013,7 @@ def test_image_stage_00940(image_stage) -> None:
     key_b = f"{method_name}b"
 
     def responses():
-        # ImageStage().prune_serial_numbers()
-        yield responses_ep_issu(key_a)
-        # ImageStage().validate_serial_numbers()
+        # ImageStage()._prune_and_validate()
         yield responses_ep_issu(key_a)
         # ImageStage().wait_for_controller()
         yield responses_ep_issu(key_a)
@@ -2260,7 +2260,7 @@ def test_image_upgrade_04120(image_upgrade) -> None:
         ]
 
     match = r"ImageUpgrade\._wait_for_image_upgrade_to_complete:\s+"
-    match += r"Seconds remaining 1790:\s+"
+    match += r"Seconds remaining 1800:\s+"
     match += r"upgrade image Failed for cvd-2313-leaf, FDO2112189M,\s+"
     match += r"172\.22\.150\.108, upgrade_percent 50\.\s+"
     match += r"Check the controller to determine the cause\.\s+"
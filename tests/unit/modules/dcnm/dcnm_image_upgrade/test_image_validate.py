@@ -106,39 +106,30 @@ def test_image_validate_00000(image_validate) -> None:
 #     assert instance.serial_numbers is None
 
 
-def test_image_validate_00200(image_validate) -> None:
+def test_image_validate_00210(image_validate) -> None:
     """
     ### Classes and Methods
     -   ``ImageValidate``
-            - ``prune_serial_numbers``
+            - ``_prune_and_validate``
 
     ### Summary
-    Verify that ``prune_serial_numbers`` prunes serial numbers that have already
-    been validated.
+    Verify that ``_prune_and_validate`` prunes serial numbers that have
+    already been validated, using a single refresh.
 
     ### Setup
     -   ``responses_ep_issu()`` returns 200 response indicating that
-        ``imageStaged`` is "none" for three serial numbers and "Success"
+        ``validated`` is "none" for three serial numbers and "Success"
         for two serial numbers in the serial_numbers list.
 
-    ### Test
-    -   ``serial_numbers`` contains only serial numbers for which
-        "validated" == "none"
-    -   ``serial_numbers`` does not contain serial numbers for which
-        "validated" == "Success"
-
-    ### Description
-    prune_serial_numbers removes serial numbers from the list for which
-    "validated" == "Success"
-
     ### Expected results
     1. instance.serial_numbers == ["FDO2112189M", "FDO211218AX", "FDO211218B5"]
-    2. instance.serial_numbers != ["FDO211218FV", "FDO211218GC"]
+    2. Only one response is needed (a second refresh would fail).
     """
     method_name = inspect.stack()[0][3]
     key = f"{method_name}a"
 
     def responses():
+        # ImageValidate()._prune_and_validate
         yield responses_ep_issu(key)
 
     gen_responses = ResponseGenerator(responses())
@@ -163,49 +154,66 @@ def test_image_validate_00200(image_validate) -> None:
             "FDO211218FV",
             "FDO211218GC",
         ]
-        instance.prune_serial_numbers()
-    assert isinstance(instance.serial_numbers, list)
-    assert len(instance.serial_numbers) == 3
-    assert "FDO2112189M" in instance.serial_numbers
-    assert "FDO211218AX" in instance.serial_numbers
-    assert "FDO211218B5" in instance.serial_numbers
-    assert "FDO211218FV" not in instance.serial_numbers
-    assert "FDO211218GC" not in instance.serial_numbers
+        instance._prune_and_validate()  # pylint: disable=protected-access
+    assert instance.serial_numbers == ["FDO2112189M", "FDO211218AX", "FDO211218B5"]
 
 
-def test_image_validate_00300(image_validate) -> None:
+def test_image_validate_00250(image_validate) -> None:
     """
     ### Classes and Methods
     -   ``ImageValidate``
-            - ``validate_serial_numbers``
+            - ``build_payload``
 
     ### Summary
-    Verify that ``validate_serial_numbers`` raises ``ControllerResponseError``
-    appropriately.
+    Verify that ``build_payload`` reuses the payload when ``serial_numbers``
+    and ``non_disruptive`` are unchanged, and rebuilds it otherwise.
+    """
+    with does_not_raise():
+        instance = image_validate
+        instance.serial_numbers = ["FDO21120U5D"]
+        instance.build_payload()
+        payload = instance.payload
+        instance.build_payload()
+    assert instance.payload is payload
+    assert instance.payload == {
+        "serialNum": ["FDO21120U5D"],
+        "nonDisruptive": False,
+    }
 
-    ### Setup
-    -   ``responses_ep_issu()`` returns 200 response indicating that
-        ``validated`` is "Success" for one serial number and "Failed"
-        for the other serial number in the serial_numbers list.
+    with does_not_raise():
+        instance.non_disruptive = True
+        instance.build_payload()
+    assert instance.payload is not payload
+    assert instance.payload["nonDisruptive"] is True
 
-    ### Test
-    - ``ControllerResponseError`` is not called when ``validated`` == "Success"
-    - ``ControllerResponseError`` is called when ``validated`` == "Failed"
+    with does_not_raise():
+        payload = instance.payload
+        instance.serial_numbers = ["FDO21120U5D", "FDO2112189M"]
+        instance.build_payload()
+    assert instance.payload is not payload
+    assert instance.payload["serialNum"] == ["FDO21120U5D", "FDO2112189M"]
 
-    ### Description
-    ``validate_serial_numbers`` checks the ``validated`` status for each serial
-    number and raises ``ControllerResponseError`` if ``validated`` == "Failed"
-    for any serial number.
 
-    ### Expectations
+def test_image_validate_00310(image_validate) -> None:
+    """
+    ### Classes and Methods
+    -   ``ImageValidate``
+            - ``_prune_and_validate``
+
+    ### Summary
+    Verify that ``_prune_and_validate`` raises ``ControllerResponseError``
+    if ``validated`` == "Failed" for any serial number.
 
-    FDO21120U5D should pass since ``validated`` == "Success"
-    FDO2112189M should fail since ``validated`` == "Failed"
+    ### Setup
+    -   ``responses_ep_issu()`` returns 200 response indicating that
+        ``validated`` is "Success" for FDO21120U5D and "Failed" for
+        FDO2112189M.
     """
     method_name = inspect.stack()[0][3]
     key = f"{method_name}a"
 
     def responses():
+        # ImageValidate()._prune_and_validate
         yield responses_ep_issu(key)
 
     gen_responses = ResponseGenerator(responses())
@@ -226,14 +234,14 @@ def test_image_validate_00300(image_validate) -> None:
         instance.issu_detail.results = Results()
         instance.serial_numbers = ["FDO21120U5D", "FDO2112189M"]
 
-    match = "ImageValidate.validate_serial_numbers: "
+    match = "ImageValidate._prune_and_validate: "
     match += "image validation is failing for the following switch: "
     match += "cvd-2313-leaf, 172.22.150.108, FDO2112189M. If this "
     match += "persists, check the switch connectivity to the "
     match += "controller and try again."
 
     with pytest.raises(ControllerResponseError, match=match):
-        instance.validate_serial_numbers()
+        instance._prune_and_validate()  # pylint: disable=protected-access
 
 
 def test_image_validate_00400(image_validate) -> None:
@@ -349,7 +357,7 @@ def test_image_validate_00410(image_validate) -> None:
         instance.issu_detail.results = Results()
         instance.serial_numbers = ["FDO21120U5D", "FDO2112189M"]
 
-    match = "Seconds remaining 1790: validate image Failed for "
+    match = "Seconds remaining 1800: validate image Failed for "
     match += "cvd-2313-leaf, 172.22.150.108, FDO2112189M, "
     match += "image validated percent: 90. Check the switch e.g. "
     match += "show install log detail, show incompatibility-all nxos "
@@ -844,9 +852,7 @@ def test_image_validate_00930(image_validate) -> None:
     key = f"{method_name}a"
 
     def responses():
-        # ImageValidate().prune_serial_numbers
-        yield responses_ep_issu(key)
-        # ImageValidate().validate_serial_numbers
+        # ImageValidate()._prune_and_validate
         yield responses_ep_issu(key)
         # RestSend.commit_normal_mode
         yield responses_ep_image_validate(key)
@@ -907,11 +913,8 @@ def test_image_validate_00940(image_validate) -> None:
     key_b = f"{method_name}b"
 
     def responses():
-        # ImageValidate.prune_serial_numbers()
-        yield responses_ep_issu(key_a)
-        # ImageValidate.validate_serial_numbers()
-        yield responses_ep_issu(key_a)
-        # ImageValidate().wait_for_controller()
+        # ImageValidate()._prune_and_validate()
+        # No actions in progress, so wait_for_controller() is skipped.
         yield responses_ep_issu(key_a)
         # ImageStage().commit() -> ImageStage().rest_send.commit()
         yield responses_ep_image_validate(key_a)
@@ -951,6 +954,73 @@ def test_image_validate_00940(image_validate) -> None:
     assert instance.results.diff[0]["172.22.150.102"]["serial_number"] == "FDO21120U5D"
 
 
+def test_image_validate_00950(image_validate) -> None:
+    """
+    ### Classes and Methods
+    -   ``ImageValidate``
+            `   ``commit``
+
+    ### Summary
+    Verify that commit() calls wait_for_controller() when
+    ``_prune_and_validate()`` finds actions in progress.
+
+    ### Setup
+    -   ``responses_ep_issu()`` returns, in order:
+            -   imageStaged == In-Progress
+            -   no actions in progress
+            -   validated == Success
+    -   ``responses_ep_image_validate()`` returns a 200 response.
+
+    ### Test
+    -   All four responses are consumed, in order, and commit() sets
+        self.diff to the expected values.
+    """
+    method_name = inspect.stack()[0][3]
+    key_a = f"{method_name}a"
+    key_b = f"{method_name}b"
+    key_c = f"{method_name}c"
+
+    def responses():
+        # ImageValidate()._prune_and_validate()
+        yield responses_ep_issu(key_a)
+        # ImageValidate().wait_for_controller()
+        yield responses_ep_issu(key_b)
+        # RestSend.commit_normal_mode
+        yield responses_ep_image_validate(key_a)
+        # ImageValidate._wait_for_image_validate_to_complete()
+        yield responses_ep_issu(key_c)
+
+    gen_responses = ResponseGenerator(responses())
+
+    sender = Sender()
+    sender.ansible_module = MockAnsibleModule()
+    sender.gen = gen_responses
+    rest_send = RestSend(params)
+    rest_send.unit_test = True
+    rest_send.send_interval = 1
+    rest_send.timeout = 1
+    rest_send.response_handler = ResponseHandler()
+    rest_send.sender = sender
+
+    with does_not_raise():
+        instance = image_validate
+        instance.results = Results()
+        instance.rest_send = rest_send
+        instance.check_timeout = 1
+        instance.check_interval = 1
+        instance.issu_detail.rest_send = rest_send
+        instance.issu_detail.results = Results()
+        instance.serial_numbers = ["FDO21120U5D"]
+        instance.commit()
+
+    assert instance.results.result_current == {
+        "success": True,
+        "changed": True,
+        "sequence_number": 1,
+    }
+    assert instance.results.diff[0]["172.22.150.102"]["serial_number"] == "FDO21120U5D"
+
+
 MATCH_01000 = "ImageValidate.non_disruptive: "
 MATCH_01000 += "instance.non_disruptive must be a boolean."
 
@@ -984,3 +1054,41 @@ def test_image_validate_01000(image_validate, value, expected) -> None:
 
     with expected:
         instance.non_disruptive = value
+
+
+MATCH_01100 = r"ImageValidate\.check_(interval|timeout): "
+MATCH_01100 += r"must be a positive integer or zero\."
+
+
+@pytest.mark.parametrize(
+    "prop, value, expected",
+    [
+        ("check_interval", 0, does_not_raise()),
+        ("check_interval", 10, does_not_raise()),
+        ("check_interval", -1, pytest.raises(ValueError, match=MATCH_01100)),
+        ("check_interval", True, pytest.raises(TypeError, match=MATCH_01100)),
+        ("check_interval", None, pytest.raises(TypeError, match=MATCH_01100)),
+        ("check_interval", "10", pytest.raises(TypeError, match=MATCH_01100)),
+        ("check_timeout", 0, does_not_raise()),
+        ("check_timeout", 10, does_not_raise()),
+        ("check_timeout", -1, pytest.raises(ValueError, match=MATCH_01100)),
+        ("check_timeout", False, pytest.raises(TypeError, match=MATCH_01100)),
+        ("check_timeout", 1.5, pytest.raises(TypeError, match=MATCH_01100)),
+    ],
+)
+def test_image_validate_01100(image_validate, prop, value, expected) -> None:
+    """
+    ### Classes and Methods
+    -   ``ImageValidate``
+            - ``check_interval.setter``
+            - ``check_timeout.setter``
+
+    ### Test
+    -   ``TypeError`` is raised if the value is not an integer, or is a bool.
+    -   ``ValueError`` is raised if the value is less than zero.
+    """
+    with does_not_raise():
+        instance = image_validate
+
+    with expected:
+        setattr(instance, prop, value)
@@ -0,0 +1,99 @@
+# Copyright (c) 2024 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+__copyright__ = "Copyright (c) 2024 Cisco and/or its affiliates."
+__author__ = "Allen Robel"
+
+import pytest
+from ansible_collections.cisco.dcnm.plugins.module_utils.common.rest_send_v2 import \
+    RestSend
+from ansible_collections.cisco.dcnm.plugins.module_utils.image_upgrade.wait_for_controller_done import \
+    WaitForControllerDone
+
+from .utils import does_not_raise, params
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        ["FDO21120U5D", "FDO2112189M"],
+        {"FDO21120U5D", "FDO2112189M"},
+        ("FDO21120U5D", "FDO2112189M"),
+        (item for item in ["FDO21120U5D", "FDO2112189M"]),
+    ],
+)
+def test_wait_for_controller_done_00100(value) -> None:
+    """
+    ### Classes and Methods
+    -   ``WaitForControllerDone``
+            - ``items.setter``
+
+    ### Test
+    -   Any iterable is accepted and stored as a frozenset.
+    """
+    with does_not_raise():
+        instance = WaitForControllerDone()
+        instance.items = value
+    assert instance.items == frozenset({"FDO21120U5D", "FDO2112189M"})
+
+
+@pytest.mark.parametrize("value", ["FDO21120U5D", 10, None])
+def test_wait_for_controller_done_00110(value) -> None:
+    """
+    ### Classes and Methods
+    -   ``WaitForControllerDone``
+            - ``items.setter``
+
+    ### Test
+    -   ``TypeError`` is raised if items is a string or is not iterable.
+    """
+    with does_not_raise():
+        instance = WaitForControllerDone()
+    match = r"WaitForControllerDone\.items: items must be an iterable of items"
+    with pytest.raises(TypeError, match=match):
+        instance.items = value
+
+
+@pytest.mark.parametrize(
+    "item_type, expected",
+    [
+        ("device_name", "SwitchIssuDetailsByDeviceName"),
+        ("ipv4_address", "SwitchIssuDetailsByIpAddress"),
+        ("serial_number", "SwitchIssuDetailsBySerialNumber"),
+    ],
+)
+def test_wait_for_controller_done_00200(item_type, expected) -> None:
+    """
+    ### Classes and Methods
+    -   ``WaitForControllerDone``
+            - ``get_filter_class``
+
+    ### Test
+    -   The ``SwitchIssuDetails`` subclass matching ``item_type`` is
+        selected.
+    -   The same instance is reused on subsequent calls.
+    """
+    with does_not_raise():
+        instance = WaitForControllerDone()
+        instance.item_type = item_type
+        instance.rest_send = RestSend(params)
+        instance.get_filter_class()
+        issu_details = instance.issu_details
+        instance.get_filter_class()
+    assert issu_details.class_name == expected
+    assert instance.issu_details is issu_details
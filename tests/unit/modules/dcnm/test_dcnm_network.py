@@ -22,6 +22,9 @@ from unittest.mock import patch
 # from units.compat.mock import patch
 
 from ansible_collections.cisco.dcnm.plugins.modules import dcnm_network
+from ansible_collections.cisco.dcnm.plugins.module_utils.network.dcnm.dcnm import (
+    dcnm_get_url,
+)
 from .dcnm_module import TestDcnmModule, set_module_args, loadPlaybookData
 
 import copy
@@ -60,6 +63,7 @@ class TestDcnmNetworkModule(TestDcnmModule):
 
     attach_success_resp = test_data.get("attach_success_resp")
     attach_success_resp2 = test_data.get("attach_success_resp2")
+    attach_update_in_progress_resp = test_data.get("attach_update_in_progress_resp")
     deploy_success_resp = test_data.get("deploy_success_resp")
     error1 = test_data.get("error1")
     error2 = test_data.get("error2")
@@ -119,6 +123,17 @@ class TestDcnmNetworkModule(TestDcnmModule):
         self.mock_dcnm_version_supported.stop()
         self.mock_dcnm_get_url.stop()
 
+    def use_dcnm_get_url(self, responses):
+        # Run the real dcnm_get_url(), which splits long queries and checks the
+        # responses, against the given controller responses
+        mock_dcnm_utils_send = patch(
+            "ansible_collections.cisco.dcnm.plugins.module_utils.network.dcnm.dcnm.dcnm_send",
+            side_effect=responses,
+        )
+        self.run_dcnm_utils_send = mock_dcnm_utils_send.start()
+        self.addCleanup(mock_dcnm_utils_send.stop)
+        self.run_dcnm_get_url.side_effect = dcnm_get_url
+
     def load_fixtures(self, response=None, device=""):
 
         if self.version == 12:
@@ -170,6 +185,25 @@ class TestDcnmNetworkModule(TestDcnmModule):
                 self.deploy_success_resp,
             ]
 
+        elif "_merged_update_in_progress_retry" in self._testMethodName:
+            self.init_data()
+            self.run_dcnm_send.side_effect = [
+                self.mock_vrf_object,
+                self.blank_data,
+                self.blank_data,
+                self.attach_update_in_progress_resp,
+                self.attach_success_resp,
+                self.deploy_success_resp,
+            ]
+
+        elif "_merged_update_in_progress_timeout" in self._testMethodName:
+            self.init_data()
+            self.run_dcnm_send.side_effect = [
+                self.mock_vrf_object,
+                self.blank_data,
+                self.blank_data,
+            ] + [self.attach_update_in_progress_resp] * 11 + [self.blank_data]
+
         elif "_merged_novlan_new" in self._testMethodName:
             self.init_data()
             self.run_dcnm_send.side_effect = [
@@ -306,15 +340,17 @@ class TestDcnmNetworkModule(TestDcnmModule):
 
         elif "override_with_deletions" in self._testMethodName:
             self.init_data()
-            self.run_dcnm_get_url.side_effect = [self.mock_net_attach_object]
+            self.run_dcnm_get_url.side_effect = [
+                self.mock_net_attach_object,
+                self.mock_net_attach_object_del_not_ready,
+                self.mock_net_attach_object_del_ready,
+                self.mock_net_attach_object_del_ready,
+            ]
             self.run_dcnm_send.side_effect = [
                 self.mock_vrf_object,
                 self.mock_net_object,
                 self.attach_success_resp,
                 self.deploy_success_resp,
-                self.mock_net_attach_object_del_not_ready,
-                self.mock_net_attach_object_del_ready,
-                self.mock_net_attach_object_del_ready,
                 self.delete_success_resp,
                 self.blank_data,
                 self.attach_success_resp2,
@@ -323,54 +359,127 @@ class TestDcnmNetworkModule(TestDcnmModule):
 
         elif "delete_std" in self._testMethodName:
             self.init_data()
-            self.run_dcnm_get_url.side_effect = [self.mock_net_attach_object]
+            self.run_dcnm_get_url.side_effect = [
+                self.mock_net_attach_object,
+                self.mock_net_attach_object_del_not_ready,
+                self.mock_net_attach_object_del_ready,
+                self.mock_net_attach_object_del_ready,
+            ]
             self.run_dcnm_send.side_effect = [
                 self.mock_vrf_object,
                 self.mock_net_object,
                 self.blank_data,
                 self.attach_success_resp,
                 self.deploy_success_resp,
-                self.mock_net_attach_object_del_not_ready,
-                self.mock_net_attach_object_del_ready,
-                self.mock_net_attach_object_del_ready,
                 self.delete_success_resp,
             ]
 
-        elif "delete_without_config" in self._testMethodName:
+        elif "delete_poll_not_ok" in self._testMethodName:
             self.init_data()
-            self.run_dcnm_get_url.side_effect = [self.mock_net_attach_object]
+            self.use_dcnm_get_url(
+                [
+                    self.mock_net_attach_object,
+                    self.error1,
+                    self.error1,
+                ]
+            )
             self.run_dcnm_send.side_effect = [
                 self.mock_vrf_object,
                 self.mock_net_object,
                 self.blank_data,
                 self.attach_success_resp,
                 self.deploy_success_resp,
+                self.delete_success_resp,
+            ]
+
+        elif "delete_without_config" in self._testMethodName:
+            self.init_data()
+            self.run_dcnm_get_url.side_effect = [
+                self.mock_net_attach_object,
                 self.mock_net_attach_object_del_not_ready,
                 self.mock_net_attach_object_del_ready,
                 self.mock_net_attach_object_del_ready,
+            ]
+            self.run_dcnm_send.side_effect = [
+                self.mock_vrf_object,
+                self.mock_net_object,
+                self.blank_data,
+                self.attach_success_resp,
+                self.deploy_success_resp,
                 self.delete_success_resp,
             ]
 
         elif "query_with_config" in self._testMethodName:
             self.init_data()
-            self.run_dcnm_get_url.side_effect = [self.mock_net_attach_object]
+            self.run_dcnm_get_url.side_effect = [
+                self.mock_net_attach_object,
+                self.mock_net_attach_object,
+            ]
             self.run_dcnm_send.side_effect = [
                 self.mock_vrf_object,
                 self.mock_net_object,
                 self.mock_vrf_object,
-                self.mock_net_query_object,
-                self.mock_net_attach_object
+                self.mock_net_object,
             ]
 
         elif "query_without_config" in self._testMethodName:
             self.init_data()
-            self.run_dcnm_get_url.side_effect = [self.mock_net_attach_object]
+            self.run_dcnm_get_url.side_effect = [
+                self.mock_net_attach_object,
+                self.mock_net_attach_object,
+            ]
             self.run_dcnm_send.side_effect = [
                 self.mock_vrf_object,
                 self.mock_net_object,
                 self.mock_vrf_object,
                 self.mock_net_object,
-                self.mock_net_attach_object
+            ]
+
+        elif "query_attach_not_ok" in self._testMethodName:
+            self.init_data()
+            self.use_dcnm_get_url([self.mock_net_attach_object, self.error1])
+            self.run_dcnm_send.side_effect = [
+                self.mock_vrf_object,
+                self.mock_net_object,
+                self.mock_vrf_object,
+                self.mock_net_object,
+            ]
+
+        elif "query_duplicate_names" in self._testMethodName:
+            self.init_data()
+            self.run_dcnm_get_url.side_effect = [
+                self.mock_net_attach_object,
+                self.mock_net_attach_object,
+            ]
+            self.run_dcnm_send.side_effect = [
+                self.mock_vrf_object,
+                self.mock_net_object,
+                self.mock_vrf_object,
+                self.mock_net_object,
+            ]
+
+        elif "query_attach_batches" in self._testMethodName:
+            self.init_data()
+            # Enough networks that their names do not fit in one attachments query
+            net_objects = copy.deepcopy(self.mock_net_object)
+            net_template = net_objects["DATA"][0]
+            net_objects["DATA"] = []
+            for index in range(150):
+                net = copy.deepcopy(net_template)
+                net["networkName"] = "test_network_{0:03d}_{1}".format(index, "x" * 40)
+                net_objects["DATA"].append(net)
+            first_attach = copy.deepcopy(self.mock_net_attach_object)
+            first_attach["DATA"][0]["networkName"] = net_objects["DATA"][0]["networkName"]
+            last_attach = copy.deepcopy(self.mock_net_attach_object)
+            last_attach["DATA"][0]["networkName"] = net_objects["DATA"][-1]["networkName"]
+            self.use_dcnm_get_url(
+                [self.mock_net_attach_object, first_attach, last_attach]
+            )
+            self.run_dcnm_send.side_effect = [
+                self.mock_vrf_object,
+                self.mock_net_object,
+                self.mock_vrf_object,
+                net_objects,
             ]
 
         elif "_merged_torport_new" in self._testMethodName:
@@ -421,6 +530,17 @@ class TestDcnmNetworkModule(TestDcnmModule):
                 self.attach_success_resp,
                 self.deploy_success_resp,
             ]
+
+        elif "_tor_port_order" in self._testMethodName:
+            self.init_data()
+            self.run_dcnm_get_url.side_effect = [self.mock_net_attach_tor_object]
+            self.run_dcnm_send.side_effect = [
+                self.mock_vrf_object,
+                self.mock_net_object,
+                self.blank_data,
+                self.attach_success_resp,
+                self.deploy_success_resp,
+            ]
         else:
             pass
 
@@ -493,6 +613,52 @@ class TestDcnmNetworkModule(TestDcnmModule):
             result.get("diff")[0]["attach"][0]["ip_address"], "10.10.10.217"
         )
 
+    def attach_posts(self):
+        return [
+            call_args
+            for call_args in self.run_dcnm_send.call_args_list
+            if call_args[0][1] == "POST" and call_args[0][2].endswith("/attachments")
+        ]
+
+    def test_dcnm_net_merged_update_in_progress_retry(self):
+        set_module_args(
+            dict(state="merged", fabric="test_network", config=self.playbook_config)
+        )
+        with patch(
+            "ansible_collections.cisco.dcnm.plugins.modules.dcnm_network.time.sleep"
+        ) as mock_sleep:
+            result = self.execute_module(changed=True, failed=False)
+        attach_posts = self.attach_posts()
+        self.assertEqual(len(attach_posts), 2)
+        self.assertEqual(attach_posts[0][0][3], attach_posts[1][0][3])
+        self.assertEqual(mock_sleep.call_count, 1)
+        self.assertEqual(len(result["response"]), 3)
+        self.assertEqual(
+            result["response"][1]["DATA"]["test-network--9NN7E41N16A(leaf1)"], "SUCCESS"
+        )
+
+    def test_dcnm_net_merged_update_in_progress_timeout(self):
+        set_module_args(
+            dict(state="merged", fabric="test_network", config=self.playbook_config)
+        )
+        # Without jitter the waits are 0.5, 1, 2, 4 and then 8 seconds, which
+        # use up the 50 second timeout after 10 waits and 11 attempts.
+        with patch(
+            "ansible_collections.cisco.dcnm.plugins.modules.dcnm_network.time.sleep"
+        ) as mock_sleep, patch(
+            "ansible_collections.cisco.dcnm.plugins.modules.dcnm_network.backoff_interval",
+            side_effect=lambda attempt, max_interval: min(max_interval, 0.5 * 2 ** attempt),
+        ):
+            result = self.execute_module(changed=False, failed=True)
+        attach_posts = self.attach_posts()
+        self.assertEqual(len(attach_posts), 11)
+        self.assertEqual(len(set(call_args[0][3] for call_args in attach_posts)), 1)
+        self.assertEqual(mock_sleep.call_count, 10)
+        self.assertEqual(
+            result["msg"]["DATA"]["test-network--9NN7E41N16A(leaf1)"],
+            "Failed, Network update in progress. Please try after some time",
+        )
+
     def test_dcnm_net_merged_novlan_new(self):
         set_module_args(
             dict(state="merged", fabric="test_network", config=self.playbook_config_novlan)
@@ -724,6 +890,17 @@ class TestDcnmNetworkModule(TestDcnmModule):
         self.assertEqual(result["response"][1]["DATA"]["status"], "")
         self.assertEqual(result["response"][1]["RETURN_CODE"], self.SUCCESS_RETURN_CODE)
 
+    def test_dcnm_net_delete_poll_not_ok(self):
+        # A failed poll of the attachments leaves nothing to wait for
+        set_module_args(
+            dict(state="deleted", fabric="test_network", config=self.playbook_config)
+        )
+        result = self.execute_module(changed=True, failed=False)
+        self.assertEqual(result.get("diff")[0]["net_name"], "test_network")
+        self.assertEqual(result["response"][2]["RETURN_CODE"], self.SUCCESS_RETURN_CODE)
+        self.assertEqual(self.run_dcnm_send.call_count, 6)
+        self.assertEqual(self.run_dcnm_utils_send.call_count, 3)
+
     def test_dcnm_net_delete_without_config(self):
         set_module_args(dict(state="deleted", fabric="test_network", config=[]))
         result = self.execute_module(changed=True, failed=False)
@@ -787,6 +964,42 @@ class TestDcnmNetworkModule(TestDcnmModule):
             202,
         )
 
+    def test_dcnm_net_query_attach_not_ok(self):
+        set_module_args(
+            dict(state="query", fabric="test_network", config=self.playbook_config)
+        )
+        result = self.execute_module(changed=False, failed=False)
+        self.assertFalse(result.get("diff"))
+        self.assertEqual(result.get("response"), [])
+
+    def test_dcnm_net_query_duplicate_names(self):
+        config = self.playbook_config + copy.deepcopy(self.playbook_config)
+        set_module_args(dict(state="query", fabric="test_network", config=config))
+        result = self.execute_module(changed=False, failed=False)
+        self.assertEqual(len(result.get("response")), 1)
+        self.assertEqual(result.get("response")[0]["parent"]["networkName"], "test_network")
+        self.assertEqual(
+            result.get("response")[0]["parent"]["networkTemplateConfig"]["networkName"],
+            "test_network",
+        )
+        self.assertEqual(self.run_dcnm_get_url.call_args_list[1][0][3], "test_network")
+
+    def test_dcnm_net_query_attach_batches(self):
+        set_module_args(dict(state="query", fabric="test_network", config=[]))
+        result = self.execute_module(changed=False, failed=False)
+        # One query for get_have() and two for the 150 network names
+        self.assertEqual(self.run_dcnm_utils_send.call_count, 3)
+        self.assertEqual(len(result.get("response")), 2)
+        self.assertEqual(
+            result.get("response")[0]["parent"]["networkName"],
+            "test_network_000_" + "x" * 40,
+        )
+        self.assertEqual(
+            result.get("response")[1]["parent"]["networkName"],
+            "test_network_149_" + "x" * 40,
+        )
+        self.assertEqual(result.get("response")[1]["attach"][0]["switchName"], "n9kv-218")
+
     def test_dcnm_net_merged_torport_new(self):
         self.version = 12
         set_module_args(
@@ -890,3 +1103,41 @@ class TestDcnmNetworkModule(TestDcnmModule):
             result.get("diff")[0]["attach"][1]["tor_ports"], "dt-n9k7(Ethernet1/13,Ethernet1/14)"
         )
         self.assertEqual(result.get("diff")[0]["vrf_name"], "ansible-vrf-int1")
+
+    def tor_port_order_config(self):
+        # Enough unsorted ports that joining a set would not reproduce this order
+        config = copy.deepcopy(self.playbook_tor_config_update)
+        config[0]["attach"][0]["tor_ports"][0]["ports"] = [
+            "Ethernet1/20",
+            "Ethernet1/3",
+            "Ethernet1/17",
+            "Ethernet1/12",
+            "Ethernet1/9",
+            "Ethernet1/15",
+        ]
+        return config
+
+    def test_dcnm_net_merged_tor_port_order(self):
+        self.version = 12
+        set_module_args(
+            dict(state="merged", fabric="test_network", config=self.tor_port_order_config())
+        )
+        result = self.execute_module(changed=True, failed=False)
+        self.version = 11
+        # New playbook ports keep their order and precede the controller's ports
+        self.assertEqual(
+            result.get("diff")[0]["attach"][0]["tor_ports"],
+            "dt-n9k6(Ethernet1/20,Ethernet1/3,Ethernet1/17,Ethernet1/9,Ethernet1/15,Ethernet1/12)",
+        )
+
+    def test_dcnm_net_replace_tor_port_order(self):
+        self.version = 12
+        set_module_args(
+            dict(state="replaced", fabric="test_network", config=self.tor_port_order_config())
+        )
+        result = self.execute_module(changed=True, failed=False)
+        self.version = 11
+        self.assertEqual(
+            result.get("diff")[0]["attach"][0]["tor_ports"],
+            "dt-n9k6(Ethernet1/20,Ethernet1/3,Ethernet1/17,Ethernet1/12,Ethernet1/9,Ethernet1/15)",
+        )